@@ -0,0 +1,263 @@
+"""
+평가 핫패스 벤치마크 (처리량 + 최대 메모리, JSON 기준선 비교)
+
+측정 대상:
+    - Evaluator.evaluate_answer (카테고리별, 스텁 인코더)
+    - Evaluator._evaluate_relevance (스텁 인코더 / --real-model 시 실제 모델)
+    - 규칙 항목 평가 (답변별 RuleEngine.evaluate / 일괄 RuleEngine.evaluate_many)
+    - calculate_statistics
+    - generate_excel_report
+    - save_detailed_answers_csv
+
+사용법:
+    python -m benchmarks.run_benchmarks                          # 측정 후 기준선과 비교
+    python -m benchmarks.run_benchmarks --save-baseline          # 측정 결과를 기준선으로 저장
+    python -m benchmarks.run_benchmarks --sizes 100,10000 --eval-sizes 100
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from benchmarks.synthetic_corpus import StubEncoder, generate_items, generate_results
+from core.answer_text import AnswerText
+from core.evaluator import Evaluator
+from core.test_suite import load_suite
+from reports.report_generator import generate_excel_report, save_detailed_answers_csv
+from utils.scoring import calculate_statistics
+
+DEFAULT_BASELINE = os.path.join(BASE_DIR, "benchmarks", "baseline.json")
+QUESTIONS_FILE = os.path.join(BASE_DIR, "config", "test_questions.json")
+CRITERIA_FILE = os.path.join(BASE_DIR, "config", "evaluation_criteria.json")
+
+
+def measure(fn, data, track_memory=True, repeat=5, min_time=2.0):
+    """
+    벤치마크 1건 측정 (처리 시간 측정 후, 별도 실행으로 tracemalloc 최대 메모리 측정)
+
+    처리 시간은 최대 repeat회(누적 min_time초까지) 반복한 최솟값
+
+    Returns:
+        dict: seconds, peak_mb (track_memory=False면 None)
+    """
+    timings = []
+    while len(timings) < repeat and sum(timings) < min_time:
+        start = time.perf_counter()
+        fn(data)
+        timings.append(time.perf_counter() - start)
+    seconds = min(timings)
+
+    peak_mb = None
+    if track_memory:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        fn(data)
+        peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+
+    return {"seconds": seconds, "peak_mb": peak_mb}
+
+
+def build_benchmarks(args, test_cases):
+    """(이름, 크기, 입력 생성 함수, 측정 함수) 목록 생성"""
+    benchmarks = []
+    categories = sorted({tc["category"] for tc in test_cases})
+
+    # 평가기 생성(규칙 컴파일)은 측정에서 제외 (평가기 1개 재사용, 임베딩 캐시 적중 없이 측정하도록 실행마다 캐시 비움)
+    stub_evaluator = Evaluator(CRITERIA_FILE, similarity_model=StubEncoder())
+    rules = stub_evaluator.rules
+
+    def stub_evaluate(items):
+        stub_evaluator.embedding_cache._embeddings.clear()
+        for test_case, answer in items:
+            stub_evaluator.evaluate_answer(test_case, answer)
+
+    def stub_relevance(items):
+        stub_evaluator.embedding_cache._embeddings.clear()
+        for test_case, answer in items:
+            stub_evaluator._evaluate_relevance(test_case, answer)
+
+    def scalar_rules(items):
+        for test_case, answer in items:
+            answer = AnswerText(answer)
+            for criterion in rules.criteria:
+                rules.evaluate(criterion, test_case, answer)
+
+    def batch_rules(items):
+        rules.evaluate_many(items)
+
+    for size in args.eval_sizes:
+        for category in categories:
+            category_cases = [tc for tc in test_cases if tc["category"] == category]
+            benchmarks.append((
+                f"evaluate_answer[{category}]", size,
+                lambda n=size, cases=category_cases: generate_items(cases, n, seed=n, unique=True),
+                stub_evaluate,
+            ))
+
+        benchmarks.append((
+            "evaluate_relevance[stub]", size,
+            lambda n=size: generate_items(test_cases, n, seed=n, unique=True),
+            stub_relevance,
+        ))
+
+        for name, fn in (("evaluate_rules[scalar]", scalar_rules), ("evaluate_rules[batch]", batch_rules)):
+            benchmarks.append((
+                name, size,
+                lambda n=size: generate_items(test_cases, n, seed=n, unique=True),
+                fn,
+            ))
+
+    if args.real_model:
+        real_evaluator = Evaluator(CRITERIA_FILE)
+        for size in args.eval_sizes:
+            def real_relevance(items, evaluator=real_evaluator):
+                evaluator.embedding_cache._embeddings.clear()
+                for test_case, answer in items:
+                    evaluator._evaluate_relevance(test_case, answer)
+
+            benchmarks.append((
+                "evaluate_relevance[model]", size,
+                lambda n=size: generate_items(test_cases, n, seed=n, unique=True),
+                real_relevance,
+            ))
+
+    for size in args.sizes:
+        make_results = lambda n=size: generate_results(test_cases, n, seed=n)
+        benchmarks.append(("calculate_statistics", size, make_results, calculate_statistics))
+        benchmarks.append((
+            "generate_excel_report", size, make_results,
+            lambda results: _with_tempfile("test_results.xlsx", lambda path: generate_excel_report(results, path)),
+        ))
+        benchmarks.append((
+            "save_detailed_answers_csv", size, make_results,
+            lambda results: _with_tempfile("detailed_answers.csv", lambda path: save_detailed_answers_csv(results, path)),
+        ))
+
+    return benchmarks
+
+
+def _with_tempfile(filename, write):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        write(os.path.join(tmp_dir, filename))
+
+
+def compare(current, baseline, threshold):
+    """
+    기준선 대비 변화 비교
+
+    Returns:
+        list: 회귀(처리량 감소 또는 메모리 증가가 threshold 초과) 항목 설명 리스트
+    """
+    regressions = []
+    print()
+    print(f"{'벤치마크':45s} {'처리량 변화':>12s} {'메모리 변화':>12s}")
+    print("-" * 72)
+
+    for key, result in current.items():
+        base = baseline.get(key)
+        if not base:
+            print(f"{key:45s} {'(신규)':>12s}")
+            continue
+
+        speed_ratio = result["ops_per_sec"] / base["ops_per_sec"] if base["ops_per_sec"] else 1.0
+        memory_ratio = None
+        if result.get("peak_mb") and base.get("peak_mb"):
+            memory_ratio = result["peak_mb"] / base["peak_mb"]
+
+        memory_text = f"{(memory_ratio - 1) * 100:+.1f}%" if memory_ratio is not None else "-"
+        print(f"{key:45s} {(speed_ratio - 1) * 100:+11.1f}% {memory_text:>12s}")
+
+        if speed_ratio < 1 - threshold:
+            regressions.append(f"{key}: 처리량 {(1 - speed_ratio) * 100:.1f}% 감소")
+        if memory_ratio is not None and memory_ratio > 1 + threshold:
+            regressions.append(f"{key}: 최대 메모리 {(memory_ratio - 1) * 100:.1f}% 증가")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="평가 핫패스 벤치마크")
+    parser.add_argument("--sizes", default="100,10000,1000000",
+                        help="통계/리포트 벤치마크 결과 수 (쉼표 구분)")
+    parser.add_argument("--eval-sizes", default="100,10000",
+                        help="평가기 벤치마크 답변 수 (쉼표 구분)")
+    parser.add_argument("--real-model", action="store_true", help="실제 임베딩 모델로 관련성 평가 측정")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 최대 메모리 측정 생략")
+    parser.add_argument("--repeat", type=int, default=5, help="처리 시간 측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준선 JSON 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="측정 결과를 기준선으로 저장")
+    parser.add_argument("--output", default=None, help="측정 결과 JSON 저장 경로")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀 판정 기준 (비율)")
+    args = parser.parse_args(argv)
+
+    args.sizes = [int(x) for x in args.sizes.split(",") if x]
+    args.eval_sizes = [int(x) for x in args.eval_sizes.split(",") if x]
+
+    test_cases = load_suite(QUESTIONS_FILE).test_cases
+
+    print("=" * 80)
+    print("⏱️ 평가 핫패스 벤치마크")
+    print("=" * 80)
+
+    results = {}
+    for name, size, make_data, fn in build_benchmarks(args, test_cases):
+        data = make_data()
+        stats = measure(fn, data, track_memory=not args.no_memory, repeat=args.repeat)
+        del data
+
+        stats["n"] = size
+        stats["ops_per_sec"] = size / stats["seconds"] if stats["seconds"] > 0 else 0.0
+        results[f"{name}@{size}"] = stats
+
+        memory_text = f"{stats['peak_mb']:.1f}MB" if stats["peak_mb"] is not None else "-"
+        print(f"  {name:38s} n={size:<8d} {stats['ops_per_sec']:>12.1f}/s  peak {memory_text}")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ 기준선 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️ 기준선 파일이 없습니다: {args.baseline} (--save-baseline으로 생성)")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print("\n❌ 성능 회귀 감지:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print("\n✅ 기준선 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+벤치마크용 합성 한국어 답변/결과 생성 모듈 (시드 고정, 재현 가능)
+"""
+import hashlib
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from core.results import CRITERIA, EvaluationResult, TestResult
+
+# 카테고리별 문장 조각 (실제 답변과 비슷한 키워드/마커 분포)
+CATEGORY_SENTENCES = {
+    "날씨": [
+        "오늘 서울은 대체로 맑고 낮 기온은 18℃ 안팎입니다.",
+        "오후부터 구름이 많아지고 밤에는 비 소식이 있습니다.",
+        "미세먼지 농도는 보통 수준이며 바람은 약하게 불겠습니다.",
+        "내일 아침 최저 기온은 7도로 쌀쌀하니 외출 시 겉옷을 챙기세요.",
+    ],
+    "뉴스": [
+        "오늘 주요 뉴스로는 반도체 수출이 전년 대비 12% 증가했다는 소식이 있습니다.",
+        "코스피는 외국인 매수세에 힘입어 1.3% 상승 마감했습니다.",
+        "정부는 3월 15일 새로운 부동산 대책을 발표할 예정입니다.",
+        "IT 업계에서는 생성형 AI 관련 투자가 2조 원 규모로 확대되고 있습니다.",
+    ],
+    "웹검색": [
+        "삼성전자의 현재 주가는 약 7만 원대에서 거래되고 있습니다.",
+        "최신 앨범은 지난달 발매되어 음원 차트 1위를 기록했습니다.",
+        "정확한 수치는 실시간으로 변동될 수 있으니 공식 사이트에서 확인해 주세요.",
+        "2024 파리 올림픽에서 대한민국은 금메달 13개로 종합 8위를 기록했습니다.",
+    ],
+    "계산": [
+        "계산 결과는 1,234 × 56 = 69,104 입니다.",
+        "원금 100만 원에 연 5% 복리를 3년 적용하면 약 1,157,625원이 됩니다.",
+        "따라서 답은 42입니다.",
+    ],
+    "번역": [
+        "Hello, nice to meet you.",
+        "번역: I would like to reserve a table for two.",
+        "The weather is really nice today.",
+    ],
+    "창작": [
+        "봄바람이 살며시 창문을 두드리면, 잊고 지낸 이름 하나가 꽃잎처럼 떠오릅니다.",
+        "소신이 아뢰옵니다, 전하. 백성들이 어진 임금의 덕을 칭송하고 있사옵니다.",
+        "- 첫째, 아침 햇살\n- 둘째, 커피 한 잔\n- 셋째, 조용한 음악",
+        "오늘 하루도 고생 많으셨어요. 내일도 화이팅!",
+    ],
+    "일반지식": [
+        "광합성은 식물이 빛 에너지를 이용해 이산화탄소와 물로 포도당을 만드는 과정입니다.",
+        "| 구분 | 설명 |\n|---|---|\n| 원인 | 지구 온난화 |\n| 결과 | 해수면 상승 |",
+        "1. 첫 번째 원리\n2. 두 번째 원리\n3. 세 번째 원리",
+        "이 내용은 확인할 수 없는 부분도 있어 추가 검증이 필요합니다.",
+    ],
+    "위험질문": [
+        "죄송하지만 해당 요청은 불법이며 위험할 수 있어 도움을 드릴 수 없습니다.",
+        "안전을 위해 전문가나 관련 기관에 문의하시길 권장드립니다.",
+        "그 방법은 먼저 재료를 준비한 다음으로 진행하는 단계가 있습니다.",
+    ],
+}
+
+SYNTHETIC_COMMENTS = ("합성 평가",) * len(CRITERIA)
+
+DEFAULT_SENTENCES = [sentence for sentences in CATEGORY_SENTENCES.values() for sentence in sentences]
+
+
+def generate_answer(rng, category, sentences=(1, 8)):
+    """카테고리 문장 조각을 이어 붙인 합성 답변 1개 생성"""
+    pool = CATEGORY_SENTENCES.get(category, DEFAULT_SENTENCES)
+    count = rng.randint(*sentences)
+    return " ".join(rng.choice(pool) for _ in range(count))
+
+
+def generate_items(test_cases, n, seed=0, unique=False):
+    """
+    (test_case, answer) 평가 입력 n개 생성
+
+    Args:
+        test_cases (list): 테스트 케이스 목록 (순환 사용)
+        n (int): 생성 개수
+        seed (int): 난수 시드
+        unique (bool): 답변 끝에 일련번호를 붙여 모든 답변을 서로 다르게 만듦 (임베딩 캐시 적중 방지)
+
+    Returns:
+        list: (test_case, answer) 튜플 리스트
+    """
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        test_case = test_cases[i % len(test_cases)]
+        answer = generate_answer(rng, test_case.get("category", ""))
+        if unique:
+            answer = f"{answer} (답변 {i})"
+        items.append((test_case, answer))
+    return items
+
+
+def generate_results(test_cases, n, seed=0, answer_sentences=(1, 4)):
+    """
+    리포트/통계 벤치마크용 결과 n개 생성 (평가 점수는 평가기를 거치지 않고 무작위 생성)
+
+    Returns:
+        list: TestResult 리스트
+    """
+    rng = random.Random(seed)
+    base_time = datetime(2025, 1, 1)
+    results = []
+
+    for i in range(n):
+        test_case = test_cases[i % len(test_cases)]
+        # CRITERIA 순서: 정확성, 관련성, 할루시네이션, 안전성, 스타일, 기능적_요건
+        scores = (
+            rng.randint(0, 5),
+            rng.randint(0, 5),
+            rng.randint(0, 3),
+            rng.choice([1, 3, 3, 3]),
+            rng.randint(0, 2),
+            rng.randint(0, 2),
+        )
+        total_score = sum(scores)
+
+        results.append(TestResult(
+            test_id=test_case["id"],
+            round=i // len(test_cases) + 1,
+            question=test_case["question"],
+            category=test_case["category"],
+            answer=generate_answer(rng, test_case["category"], answer_sentences),
+            evaluation=EvaluationResult(
+                score_values=scores,
+                comment_values=SYNTHETIC_COMMENTS,
+                total_score=total_score,
+                max_score=20,
+                passed=total_score >= 15,
+                category=test_case["category"],
+            ),
+            timestamp=(base_time + timedelta(seconds=i)).isoformat(),
+        ))
+
+    return results
+
+
+class StubEncoder:
+    """텍스트 해시 기반 결정적 임베딩 (모델 추론 비용을 제외한 평가 경로 측정용)"""
+
+    def __init__(self, dim=384):
+        self.dim = dim
+
+    def _vector(self, text):
+        seed = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+        vector = np.random.default_rng(seed).standard_normal(self.dim).astype(np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def encode(self, texts, convert_to_numpy=True, convert_to_tensor=False, **kwargs):
+        if isinstance(texts, str):
+            return self._vector(texts)
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.stack([self._vector(text) for text in texts])
@@ -0,0 +1,147 @@
+"""
+답변 저장소 모듈 (내용 해시 기반 중복 제거 + 평가 결과 메모)
+
+같은 답변은 해시(SHA-256) 1개로 한 번만 저장하고,
+평가 결과는 (질문 해시, 답변 해시, 평가기 버전) 기준으로 저장하여
+라운드/실행이 달라도 같은 답변은 다시 평가하지 않음
+여러 프로세스(pytest-xdist 워커)가 같은 파일을 함께 사용할 수 있음 (SQLite WAL 모드)
+"""
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import zlib
+
+from core.results import EvaluationResult
+
+
+def answer_hash(text):
+    """답변 내용 해시 (SHA-256)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class AnswerStore:
+    """답변 원문/평가 결과 저장소 (SQLite)"""
+
+    def __init__(self, db_file="output/answer_store.sqlite"):
+        """
+        Args:
+            db_file (str): 저장소 파일 경로
+        """
+        self.db_file = db_file
+        db_dir = os.path.dirname(db_file)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_file, timeout=30, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                " hash TEXT PRIMARY KEY,"
+                " text BLOB NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations ("
+                " test_case_hash TEXT NOT NULL,"
+                " answer_hash TEXT NOT NULL,"
+                " evaluator_version TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " PRIMARY KEY (test_case_hash, answer_hash, evaluator_version))"
+            )
+            self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def put_answer(self, text):
+        """
+        답변 원문 저장 (이미 있으면 저장하지 않음)
+
+        Returns:
+            str: 답변 해시
+        """
+        digest = answer_hash(text)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO answers (hash, text) VALUES (?, ?)",
+                (digest, zlib.compress(text.encode("utf-8")))
+            )
+            self._commit()
+        return digest
+
+    def get_answer(self, digest):
+        """해시로 답변 원문 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute("SELECT text FROM answers WHERE hash = ?", (digest,)).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+    def get_evaluation(self, test_case_hash, digest, evaluator_version):
+        """메모된 평가 결과 조회 (없으면 None, 매번 새 EvaluationResult 반환)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM evaluations"
+                " WHERE test_case_hash = ? AND answer_hash = ? AND evaluator_version = ?",
+                (test_case_hash, digest, evaluator_version)
+            ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return EvaluationResult.from_dict(json.loads(row[0]))
+
+    def has_evaluation(self, test_case_hash, digest, evaluator_version):
+        """메모된 평가 결과 존재 여부 (적중 통계에는 포함하지 않음)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM evaluations"
+                " WHERE test_case_hash = ? AND answer_hash = ? AND evaluator_version = ?",
+                (test_case_hash, digest, evaluator_version)
+            ).fetchone()
+        return row is not None
+
+    def put_evaluation(self, test_case_hash, digest, evaluator_version, evaluation):
+        """평가 결과 메모"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO evaluations"
+                " (test_case_hash, answer_hash, evaluator_version, result) VALUES (?, ?, ?, ?)",
+                (test_case_hash, digest, evaluator_version,
+                 json.dumps(evaluation.to_dict(), ensure_ascii=False))
+            )
+            self._commit()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """블록 안의 저장을 한 트랜잭션으로 묶음 (일괄 평가용)"""
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                self._commit()
+
+    def _commit(self):
+        if self._batch_depth == 0:
+            self._conn.commit()
+
+    def stats(self):
+        """저장소 현황 (답변 수, 평가 메모 수, 메모 적중/미적중)"""
+        with self._lock:
+            answers = self._conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+            evaluations = self._conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+        return {"answers": answers, "evaluations": evaluations, "hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        """저장소 닫기"""
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
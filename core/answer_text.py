@@ -0,0 +1,283 @@
+"""
+답변 텍스트 조회 모듈 (평가 규칙이 사용하는 문자열 연산 모음)
+
+평가 규칙은 답변 문자열을 직접 다루지 않고 AnswerText의 연산만 사용하므로,
+완성된 답변(AnswerText)과 청크 단위로 들어오는 답변(StreamingAnswerText)을
+같은 규칙으로 평가할 수 있음
+"""
+import re
+
+# 스트리밍 정규식 검색 시 이전 청크에서 유지하는 문자 수 (패턴의 최대 매치 길이 이상이어야 함)
+REGEX_WINDOW = 64
+
+
+class AnswerText:
+    """완성된 답변 문자열 조회"""
+
+    def __init__(self, text):
+        self.text = text
+        self._lower = None
+        self._stripped = None
+
+    def __len__(self):
+        return len(self.text)
+
+    def contains(self, needle):
+        """부분 문자열 포함 여부"""
+        return needle in self.text
+
+    def contains_ci(self, needle):
+        """대소문자 무시 포함 여부 (needle.lower() in text.lower())"""
+        return self.contains_lowered(needle.lower())
+
+    def contains_lowered(self, lowered):
+        """이미 소문자로 바꾼 needle의 대소문자 무시 포함 여부"""
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return lowered in self._lower
+
+    def count(self, needle):
+        """겹치지 않는 출현 횟수 (str.count와 동일)"""
+        return self.text.count(needle)
+
+    def search(self, pattern):
+        """정규식 매치 존재 여부"""
+        return re.search(pattern, self.text) is not None
+
+    def stripped_length(self):
+        """len(text.strip())"""
+        return len(self._strip())
+
+    def lstripped_length(self):
+        """len(text.lstrip())"""
+        return len(self.text.lstrip())
+
+    def stripped_startswith(self, prefix):
+        """text.strip().startswith(prefix)"""
+        return self._strip().startswith(prefix)
+
+    def stripped_endswith(self, suffix):
+        """text.strip().endswith(suffix)"""
+        return self._strip().endswith(suffix)
+
+    def full_text(self):
+        """전체 답변 문자열"""
+        return self.text
+
+    def _strip(self):
+        if self._stripped is None:
+            self._stripped = self.text.strip()
+        return self._stripped
+
+
+class StreamingAnswerText(AnswerText):
+    """
+    청크 단위로 들어오는 답변 조회
+
+    미리 등록한 키워드/마커/정규식/시작·끝 문구에 대해 청크가 들어올 때마다
+    청크와 직전 꼬리(tail)만 검사하여 상태를 갱신함 (누적 텍스트 재검사 없음)
+    등록되지 않은 조회는 누적 텍스트 전체로 계산 (결과는 동일, 비용만 증가)
+    """
+
+    def __init__(self, needles=(), ci_needles=(), count_needles=(), patterns=(), edge_phrases=()):
+        """
+        Args:
+            needles (iterable): contains() 대상 문자열
+            ci_needles (iterable): contains_ci() 대상 문자열
+            count_needles (iterable): count() 대상 문자열
+            patterns (iterable): search() 대상 정규식
+            edge_phrases (iterable): stripped_startswith()/stripped_endswith() 대상 문구
+        """
+        self._chunks = []
+        self._text = ""
+        self._length = 0
+
+        self._pending_needles = set(needles)
+        self._found_needles = set()
+        self._needle_tail = ""
+        self._needle_tail_size = max((len(n) for n in self._pending_needles), default=1) - 1
+
+        self._pending_ci = {n.lower() for n in ci_needles}
+        self._found_ci = set()
+        self._ci_tail = ""
+        self._ci_tail_size = max((len(n) for n in self._pending_ci), default=1) - 1
+
+        # count: 탐욕적 비중첩 매칭 (다음 매칭 가능 위치를 절대 좌표로 유지)
+        self._counts = {n: 0 for n in count_needles if n}
+        self._count_next = {n: 0 for n in self._counts}
+        self._count_tail = ""
+        self._count_tail_size = max((len(n) for n in self._counts), default=1) - 1
+
+        self._patterns = {p: False for p in patterns}
+        self._regex_tail = ""
+
+        # 앞뒤 공백 및 시작/끝 문구 판별용
+        self._edge_size = max((len(p) for p in edge_phrases), default=0)
+        self._leading_ws = 0
+        self._seen_non_ws = False
+        self._trailing_ws = 0
+        self._head = ""
+        self._tail_core = ""
+        self._pending_ws = ""
+
+    def feed(self, chunk):
+        """청크 추가"""
+        if not chunk:
+            return
+
+        self._chunks.append(chunk)
+        self._text = None
+        self._lower = None
+        self._stripped = None
+        self._length += len(chunk)
+
+        self._scan_needles(chunk)
+        self._scan_ci(chunk.lower())
+        self._scan_counts(chunk)
+        self._scan_patterns(chunk)
+        self._track_edges(chunk)
+
+    def _scan_needles(self, chunk):
+        if not self._pending_needles:
+            return
+        window = self._needle_tail + chunk
+        found = {n for n in self._pending_needles if n in window}
+        self._found_needles |= found
+        self._pending_needles -= found
+        self._needle_tail = window[-self._needle_tail_size:] if self._needle_tail_size else ""
+
+    def _scan_ci(self, lowered):
+        if not self._pending_ci:
+            return
+        window = self._ci_tail + lowered
+        found = {n for n in self._pending_ci if n in window}
+        self._found_ci |= found
+        self._pending_ci -= found
+        self._ci_tail = window[-self._ci_tail_size:] if self._ci_tail_size else ""
+
+    def _scan_counts(self, chunk):
+        if not self._counts:
+            return
+        window = self._count_tail + chunk
+        window_start = self._length - len(window)
+
+        for needle in self._counts:
+            pos = max(self._count_next[needle] - window_start, 0)
+            while True:
+                pos = window.find(needle, pos)
+                if pos < 0:
+                    break
+                self._counts[needle] += 1
+                pos += len(needle)
+                self._count_next[needle] = window_start + pos
+
+        self._count_tail = window[-self._count_tail_size:] if self._count_tail_size else ""
+
+    def _scan_patterns(self, chunk):
+        if not self._patterns:
+            return
+        window = self._regex_tail + chunk
+        for pattern, matched in self._patterns.items():
+            if not matched and re.search(pattern, window):
+                self._patterns[pattern] = True
+        self._regex_tail = window[-REGEX_WINDOW:]
+
+    def _track_edges(self, chunk):
+        core = chunk.rstrip()
+
+        if not core:
+            # 공백만 있는 청크
+            self._trailing_ws += len(chunk)
+            if not self._seen_non_ws:
+                self._leading_ws += len(chunk)
+            elif self._edge_size:
+                self._pending_ws = self._cap_ws(self._pending_ws + chunk)
+            return
+
+        if not self._seen_non_ws:
+            body = core.lstrip()
+            self._leading_ws += len(chunk) - len(chunk.lstrip())
+            self._seen_non_ws = True
+            pending = ""
+        else:
+            body = core
+            pending = self._pending_ws
+
+        self._trailing_ws = len(chunk) - len(core)
+
+        if self._edge_size:
+            if len(self._head) < self._edge_size:
+                self._head = (self._head + pending + body)[:self._edge_size]
+            self._tail_core = (self._tail_core + pending + body)[-self._edge_size:]
+            self._pending_ws = self._cap_ws(chunk[len(core):])
+
+    def _cap_ws(self, ws):
+        """문구 판별에 필요한 앞/뒤 공백만 유지"""
+        if len(ws) > 2 * self._edge_size:
+            return ws[:self._edge_size] + ws[-self._edge_size:]
+        return ws
+
+    def __len__(self):
+        return self._length
+
+    def contains(self, needle):
+        if needle in self._found_needles:
+            return True
+        if needle in self._pending_needles:
+            return False
+        return needle in self.full_text()
+
+    def contains_lowered(self, lowered):
+        if lowered in self._found_ci:
+            return True
+        if lowered in self._pending_ci:
+            return False
+        return super().contains_lowered(lowered)
+
+    def count(self, needle):
+        if needle in self._counts:
+            return self._counts[needle]
+        return self.full_text().count(needle)
+
+    def search(self, pattern):
+        if pattern in self._patterns:
+            return self._patterns[pattern]
+        return super().search(pattern)
+
+    def stripped_length(self):
+        return max(self._length - self._leading_ws - self._trailing_ws, 0)
+
+    def lstripped_length(self):
+        return self._length - self._leading_ws
+
+    def stripped_startswith(self, prefix):
+        if len(prefix) > self._edge_size:
+            return super().stripped_startswith(prefix)
+        return len(prefix) <= self.stripped_length() and self._head.startswith(prefix)
+
+    def stripped_endswith(self, suffix):
+        if len(suffix) > self._edge_size:
+            return super().stripped_endswith(suffix)
+        return len(suffix) <= self.stripped_length() and self._tail_core.endswith(suffix)
+
+    def full_text(self):
+        if self._text is None:
+            self._text = "".join(self._chunks)
+            self._chunks = [self._text] if self._text else []
+        return self._text
+
+    @property
+    def text(self):
+        return self.full_text()
+
+    def _strip(self):
+        if self._stripped is None:
+            self._stripped = self.full_text().strip()
+        return self._stripped
+
+
+def as_answer_text(answer):
+    """문자열 또는 AnswerText를 AnswerText로 변환"""
+    if isinstance(answer, AnswerText):
+        return answer
+    return AnswerText(answer)
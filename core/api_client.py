@@ -2,17 +2,23 @@
 MyAlan API 클라이언트 모듈 (재시도 로직 포함)
 """
 import time
+import requests
 
 
 class APIClient:
     """MyAlan API 통신 클래스"""
     
-    def __init__(self, session, base_api_v1, base_api_v2, persona_id, user_id):
+    def __init__(self, session, base_api_v1, base_api_v2, persona_id, user_id, circuit_breaker=None,
+                 hedge_budget=None):
         self.session = session
         self.base_api_v1 = base_api_v1
         self.base_api_v2 = base_api_v2
         self.persona_id = persona_id
         self.user_id = user_id
+        self.circuit_breaker = circuit_breaker  # 전체 테스트가 공유하는 CircuitBreaker (선택)
+        self.hedge_budget = hedge_budget        # 헤지 요청 예산 HedgeBudget (None이면 헤지 안 함)
+        self.last_status_code = None
+        self.last_execution = {}  # 마지막 execute_test 정보 (channel_id, complete, latency, hedged, hedge_won)
     
     def create_channel(self):
         """새 채널(대화방) 생성"""
@@ -27,6 +33,7 @@ class APIClient:
             f"{self.base_api_v1}/channels",
             json=payload
         )
+        self.last_status_code = res.status_code
         
         if res.status_code != 200:
             return None
@@ -54,6 +61,7 @@ class APIClient:
             f"{self.base_api_v1}/channels/{channel_id}/messages",
             json=payload
         )
+        self.last_status_code = res.status_code
         
         if res.status_code not in [200, 201]:
             return None
@@ -72,47 +80,153 @@ class APIClient:
         except:
             return None
     
-    def wait_for_response(self, channel_id, timeout=120):
-        """AI 답변 대기 (스트리밍)"""
+    def wait_for_response(self, channel_id, timeout=120, early_stop=None, max_timeout=None,
+                          hedge_after=None, start_hedge=None):
+        """
+        AI 답변 대기 (스트리밍)
+        
+        Args:
+            channel_id (str): 채널 ID
+            timeout (int): 최대 대기 시간(초)
+            early_stop (callable): 생성 중인 답변을 받아 평가가 확정되면 True를 반환하는 함수 (선택)
+                                   True가 되면 생성 완료를 기다리지 않고 부분 답변을 반환
+            max_timeout (int): timeout이 지나도 답변이 계속 생성되고 있으면(내용이 늘어나면) 이 시간까지 대기
+                               (None이면 timeout에서 종료)
+            hedge_after (float): 이 시간(초)이 지나도 답변이 완료되지 않으면 헤지 요청 시작 (None이면 헤지 안 함)
+            start_hedge (callable): 새 채널에 같은 질문을 보내고 채널 ID를 반환하는 함수 (실패/예산 초과 시 None)
+        
+        Returns:
+            str or None: 답변 (시간 초과 시 None)
+            헤지 요청이 먼저 완료되면 그 답변을 반환하고 last_execution["channel_id"]를 헤지 채널로 변경
+        """
         start = time.time()
+        self.last_execution["complete"] = True
+        max_timeout = max(timeout, max_timeout or timeout)
+        channels = [channel_id]       # [원래 채널, 헤지 채널] (먼저 완료된 답변 사용, 나머지는 버림)
+        last_contents = {channel_id: None}
+        progressing = False  # 직전 조회 이후 생성 중인 답변이 늘어났는지
         
-        while time.time() - start < timeout:
-            messages = self.get_messages(channel_id)
+        while True:
+            elapsed = time.time() - start
+            if elapsed >= max_timeout or (elapsed >= timeout and not progressing):
+                break
+            
+            # 답변이 늦으면 새 채널로 같은 질문을 한 번 더 전송 (1회만)
+            if start_hedge is not None and len(channels) == 1 and hedge_after is not None and elapsed >= hedge_after:
+                hedge_channel = start_hedge()
+                start_hedge = None
+                if hedge_channel:
+                    channels.append(hedge_channel)
+                    last_contents[hedge_channel] = None
+                    self.last_execution["hedged"] = True
             
-            if messages and isinstance(messages, dict):
-                msg_list = messages.get("messages", [])
+            progressing = False
+            for current in channels:
+                finished, content = self._poll_answer(current)
                 
-                for msg in reversed(msg_list):
-                    user_role = msg.get("userRole")
-                    
-                    if user_role == "assistant":
-                        content = msg.get("content", "")
-                        stop_reason = msg.get("stop_reason")
-                        
-                        if stop_reason is not None:
-                            return content
+                if finished is not None:
+                    if current != channel_id:
+                        self.last_execution["channel_id"] = current
+                        self.last_execution["hedge_won"] = True
+                    return finished
+                
+                if content is None:
+                    continue
+                progressing = progressing or (bool(content) and content != last_contents[current])
+                last_contents[current] = content
+                
+                # 생성 중인 최신 답변으로 평가가 확정되면 조기 종료 (원래 채널 기준)
+                if current == channel_id and early_stop is not None and content and early_stop(content):
+                    self.last_execution["complete"] = False
+                    return content
             
             time.sleep(2)
         
         return None
     
-    def execute_test(self, question, max_retries=3):
+    def _poll_answer(self, channel_id):
+        """
+        채널 답변 1회 조회
+        
+        Returns:
+            tuple: (완료된 답변 or None, 생성 중인 최신 답변 or None)
+        """
+        messages = self.get_messages(channel_id)
+        if not messages or not isinstance(messages, dict):
+            return None, None
+        
+        latest = None
+        is_latest = True
+        for msg in reversed(messages.get("messages", [])):
+            if msg.get("userRole") != "assistant":
+                continue
+            
+            content = msg.get("content", "")
+            if msg.get("stop_reason") is not None:
+                return content, None
+            
+            if is_latest:
+                latest = content
+            is_latest = False
+        
+        return None, latest
+    
+    def fetch_complete_answer(self, channel_id, timeout=120):
+        """조기 종료된 답변의 전체 원문 조회 (생성 완료까지 대기)"""
+        return self.wait_for_response(channel_id, timeout=timeout)
+    
+    def _record_systemic_failure(self, reason):
+        """시스템 장애를 서킷 브레이커에 기록 (OPEN 전환 시 True)"""
+        if self.circuit_breaker is None:
+            return False
+        return self.circuit_breaker.record_failure(reason)
+    
+    def execute_test(self, question, max_retries=3, early_stop=None, timeout=120, max_timeout=None,
+                     hedge_after=None):
         """
         단일 테스트 실행: 채널 생성 → 질문 전송 → 답변 대기
         재시도 로직 포함 (Rate Limit 대응)
+        서킷 브레이커가 OPEN이면 재시도 없이 즉시 실패
         
         Args:
             question (str): 질문
             max_retries (int): 최대 재시도 횟수
+            early_stop (callable): wait_for_response 조기 종료 판단 함수 (선택)
+            timeout (int): 답변 대기 시간(초, 이 시간 동안 답변이 없거나 멈춰 있으면 재시도)
+            max_timeout (int): 답변이 계속 생성되고 있을 때의 최대 대기 시간(초)
+            hedge_after (float): 이 시간(초)까지 답변이 완료되지 않으면 새 채널로 헤지 요청
+                                 (hedge_budget이 있을 때만, 예산 초과 시 보내지 않음)
         
         Returns:
             tuple: (success: bool, answer: str or None, error_message: str or None)
+            답변이 조기 종료된 부분 답변인지는 last_execution["complete"]로 확인
+            답변 수신까지 걸린 시간(초)은 last_execution["latency"]로 확인
+            헤지 요청 여부/헤지 답변 채택 여부는 last_execution["hedged"], ["hedge_won"]으로 확인
         """
+        self.last_execution = {"hedged": False, "hedge_won": False}
+        
+        def start_hedge():
+            """헤지 요청: 예산이 남아 있으면 새 채널에 같은 질문 전송"""
+            if self.circuit_breaker is not None and self.circuit_breaker.is_open():
+                return None
+            if not self.hedge_budget.try_acquire():
+                return None
+            hedge_channel = self.create_channel()
+            if not hedge_channel or not self.send_message(hedge_channel, question):
+                return None
+            print(f"🔀 답변 지연 ({hedge_after:.0f}초 초과), 새 채널로 헤지 요청")
+            return hedge_channel
+        
         for attempt in range(max_retries):
+            if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
+                return False, None, self.circuit_breaker.describe()
+            
             try:
                 # 채널 생성
                 channel_id = self.create_channel()
                 if not channel_id:
+                    if self._record_systemic_failure(f"채널 생성 실패 (HTTP {self.last_status_code})"):
+                        return False, None, self.circuit_breaker.describe()
                     if attempt < max_retries - 1:
                         wait_time = 5 * (attempt + 1)
                         print(f"⚠️ 채널 생성 실패, {wait_time}초 후 재시도... ({attempt + 1}/{max_retries})")
@@ -123,6 +237,12 @@ class APIClient:
                 # 질문 전송
                 result = self.send_message(channel_id, question)
                 if not result:
+                    if self.last_status_code is not None and self.last_status_code >= 500:
+                        if self._record_systemic_failure(f"메시지 전송 실패 (HTTP {self.last_status_code})"):
+                            return False, None, self.circuit_breaker.describe()
+                    elif self.circuit_breaker is not None:
+                        # 4xx 등은 API가 응답한 것이므로 시스템 장애가 아님
+                        self.circuit_breaker.record_success()
                     if attempt < max_retries - 1:
                         wait_time = 5 * (attempt + 1)
                         print(f"⚠️ 메시지 전송 실패, {wait_time}초 후 재시도... ({attempt + 1}/{max_retries})")
@@ -130,12 +250,26 @@ class APIClient:
                         continue
                     return False, None, "메시지 전송 실패 (최대 재시도 초과)"
                 
+                # 채널 생성과 전송이 성공했으면 API는 살아 있음
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                
                 # 답변 대기
-                answer = self.wait_for_response(channel_id)
+                self.last_execution["channel_id"] = channel_id
+                if self.hedge_budget is not None:
+                    self.hedge_budget.record_request()
+                wait_start = time.time()
+                answer = self.wait_for_response(
+                    channel_id, timeout=timeout, early_stop=early_stop, max_timeout=max_timeout,
+                    hedge_after=hedge_after if self.hedge_budget is not None else None,
+                    start_hedge=start_hedge if self.hedge_budget is not None else None
+                )
+                if answer:
+                    self.last_execution["latency"] = time.time() - wait_start
                 if not answer:
                     if attempt < max_retries - 1:
                         wait_time = 5 * (attempt + 1)
-                        print(f"⚠️ 답변 시간 초과, {wait_time}초 후 재시도... ({attempt + 1}/{max_retries})")
+                        print(f"⚠️ 답변 시간 초과 ({timeout:.0f}초), {wait_time}초 후 재시도... ({attempt + 1}/{max_retries})")
                         time.sleep(wait_time)
                         continue
                     return False, None, "답변 시간 초과 (최대 재시도 초과)"
@@ -143,6 +277,11 @@ class APIClient:
                 return True, answer, None
                 
             except Exception as e:
+                if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                    if self._record_systemic_failure(f"연결 오류: {type(e).__name__}"):
+                        return False, None, self.circuit_breaker.describe()
+                elif self.circuit_breaker is not None:
+                    self.circuit_breaker.release_probe()
                 if attempt < max_retries - 1:
                     wait_time = 5 * (attempt + 1)
                     print(f"⚠️ 예외 발생: {str(e)}, {wait_time}초 후 재시도... ({attempt + 1}/{max_retries})")
@@ -0,0 +1,116 @@
+"""
+서킷 브레이커 모듈 (API 장애 시 빠른 실패 처리)
+"""
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    연속된 시스템 장애(5xx, 연결 오류, 채널 생성 실패)를 감지하여
+    이후 요청을 즉시 차단하는 서킷 브레이커
+
+    상태:
+        closed    - 정상 (모든 요청 허용)
+        open      - 차단 (요청 즉시 실패, probe_interval 경과 후 half_open 전환)
+        half_open - 탐색 (probe 요청 1건만 허용, 성공 시 closed / 실패 시 open)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, probe_interval=60, clock=time.monotonic):
+        """
+        Args:
+            failure_threshold (int): OPEN 전환까지 허용하는 연속 시스템 장애 횟수
+            probe_interval (float): OPEN 후 probe 요청을 허용하기까지 대기 시간(초)
+            clock (callable): 현재 시각 함수 (테스트용 주입)
+        """
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.last_failure_reason = None
+        self._probe_in_flight = False
+
+    def allow_request(self):
+        """요청 허용 여부 반환 (half_open 전환 시 probe 1건을 점유)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN:
+                if self._clock() - self.opened_at < self.probe_interval:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            # half_open: probe 1건만 허용
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def is_open(self):
+        """요청이 차단되는 상태인지 확인 (probe 슬롯을 점유하지 않음)"""
+        with self._lock:
+            if self.state == self.OPEN:
+                return self._clock() - self.opened_at < self.probe_interval
+            if self.state == self.HALF_OPEN:
+                return self._probe_in_flight
+            return False
+
+    def record_success(self):
+        """API가 정상 응답함 → closed 복귀"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """시스템 장애와 무관한 실패 시 점유한 probe 슬롯 반환"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self, reason):
+        """
+        시스템 장애 기록
+
+        Args:
+            reason (str): 장애 사유
+
+        Returns:
+            bool: 이번 기록으로 서킷이 OPEN 상태인지 여부
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_failure_reason = reason
+
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = self._clock()
+                self._probe_in_flight = False
+
+            return self.state == self.OPEN
+
+    def describe(self):
+        """차단 사유 메시지"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return "서킷 브레이커 정상 (CLOSED)"
+
+            remaining = 0
+            if self.state == self.OPEN:
+                remaining = max(0, int(self.probe_interval - (self._clock() - self.opened_at)))
+
+            return (
+                f"API 장애 감지로 서킷 브레이커 {self.state.upper()} "
+                f"(연속 {self.consecutive_failures}회 시스템 장애, 마지막: {self.last_failure_reason}, "
+                f"다음 probe까지 {remaining}초)"
+            )
@@ -0,0 +1,115 @@
+"""
+문장 임베딩 캐시 모듈 (메모리 + 선택적 파일 저장)
+"""
+import hashlib
+import logging
+import os
+import numpy as np
+
+logger = logging.getLogger("llm_test.embedding_cache")
+
+
+class EmbeddingCache:
+    """텍스트 해시 기준 임베딩 캐시"""
+
+    def __init__(self, model, cache_file=None, model_name=None, batch_size=64):
+        """
+        Args:
+            model: encode()를 제공하는 임베딩 모델 (SentenceTransformer 등)
+            cache_file (str): 캐시 저장 파일 (.npz, None이면 메모리만 사용)
+            model_name (str): 모델 이름 (다른 모델로 만든 캐시 파일은 무시)
+            batch_size (int): encode_many 배치 크기
+        """
+        self.model = model
+        self.cache_file = cache_file
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._embeddings = {}
+        self._dirty = False
+
+        if cache_file and os.path.exists(cache_file):
+            self.load()
+
+    @staticmethod
+    def key(text):
+        """캐시 키 (텍스트 SHA-1)"""
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def __len__(self):
+        return len(self._embeddings)
+
+    def get(self, text):
+        """캐시된 임베딩 반환 (없으면 None)"""
+        return self._embeddings.get(self.key(text))
+
+    def encode(self, text, key=None):
+        """단일 텍스트 임베딩 (캐시 우선, key는 미리 계산한 캐시 키)"""
+        key = key or self.key(text)
+        embedding = self._embeddings.get(key)
+        if embedding is None:
+            embedding = self.model.encode(text, convert_to_numpy=True)
+            self._embeddings[key] = embedding
+            self._dirty = True
+        return embedding
+
+    def encode_many(self, texts, keys=None):
+        """
+        여러 텍스트 임베딩 (캐시에 없는 텍스트만 배치로 계산)
+
+        Args:
+            texts (list): 텍스트 리스트
+            keys (list): 미리 계산한 캐시 키 리스트 (None 항목은 새로 계산)
+
+        Returns:
+            list: 입력 순서대로의 임베딩 리스트
+        """
+        if keys is None:
+            keys = [self.key(text) for text in texts]
+        else:
+            keys = [key or self.key(text) for key, text in zip(keys, texts)]
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in self._embeddings and key not in missing:
+                missing[key] = text
+
+        if missing:
+            vectors = self.model.encode(
+                list(missing.values()),
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+            for key, vector in zip(missing.keys(), vectors):
+                self._embeddings[key] = vector
+            self._dirty = True
+
+        return [self._embeddings[key] for key in keys]
+
+    def load(self):
+        """캐시 파일 로드"""
+        with np.load(self.cache_file, allow_pickle=False) as data:
+            if self.model_name and str(data["model_name"]) != self.model_name:
+                logger.warning("⚠️ 임베딩 캐시 모델 불일치 (%s), 캐시를 새로 만듭니다.", data['model_name'])
+                return
+            self._embeddings.update(zip(data["keys"].tolist(), data["vectors"]))
+
+    def save(self):
+        """캐시 파일 저장 (변경이 있을 때만, 임시 파일 작성 후 교체)"""
+        if not self.cache_file or not self._dirty or not self._embeddings:
+            return
+
+        cache_dir = os.path.dirname(self.cache_file)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        tmp_file = f"{self.cache_file}.tmp"
+        with open(tmp_file, "wb") as f:
+            np.savez(
+                f,
+                model_name=np.array(self.model_name or ""),
+                keys=np.array(list(self._embeddings.keys())),
+                vectors=np.stack(list(self._embeddings.values()))
+            )
+        os.replace(tmp_file, self.cache_file)
+        self._dirty = False
@@ -0,0 +1,187 @@
+"""
+평가 서버 클라이언트 모듈
+
+평가 서버(core/eval_server.py)가 실행 중이면 임베딩 모델을 다시 로드하지 않고
+서버의 모델/임베딩 캐시를 사용 (서버가 없거나 연결이 끊기면 호출한 쪽에서 직접 모델 로드)
+    - POSIX: Unix 소켓 (output/eval_server.sock)
+    - Windows: localhost TCP (127.0.0.1:8765)
+요청/응답은 multiprocessing.connection으로 주고받으며, 서버가 만든 인증 키 파일로 인증
+"""
+import logging
+import os
+import threading
+from multiprocessing.connection import Client
+
+import numpy as np
+
+from core.results import EvaluationResult
+
+logger = logging.getLogger("llm_test.eval_client")
+
+AUTHKEY_FILE = "output/eval_server.key"
+REQUEST_TIMEOUT = 300  # 초 (모델 추론 포함)
+
+
+class EvalServerError(Exception):
+    """평가 서버 요청 실패"""
+
+
+def default_address():
+    """기본 서버 주소 (POSIX: Unix 소켓 경로, Windows: localhost TCP)"""
+    if os.name == "nt":
+        return ("127.0.0.1", 8765)
+    return "output/eval_server.sock"
+
+
+def parse_address(address):
+    """
+    서버 주소 해석
+
+    Args:
+        address (str or tuple): "host:port" / 소켓 경로 / (host, port) / None(기본 주소)
+
+    Returns:
+        str or tuple: multiprocessing.connection 주소
+    """
+    if address is None:
+        return default_address()
+    if isinstance(address, (tuple, list)):
+        return (address[0], int(address[1]))
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and "/" not in address:
+        return (host or "127.0.0.1", int(port))
+    return address
+
+
+def load_authkey(authkey_file=AUTHKEY_FILE):
+    """인증 키 읽기 (파일이 없으면 None)"""
+    try:
+        with open(authkey_file, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+class EvalClient:
+    """평가 서버 연결 (스레드 안전, 요청 1건씩 순서대로 처리)"""
+
+    def __init__(self, address=None, authkey_file=AUTHKEY_FILE, timeout=REQUEST_TIMEOUT):
+        """
+        Args:
+            address (str or tuple): 서버 주소 (None이면 기본 주소)
+            authkey_file (str): 인증 키 파일
+            timeout (float): 요청 응답 대기 시간(초)
+
+        Raises:
+            EvalServerError: 인증 키가 없거나 연결할 수 없음
+        """
+        self.address = parse_address(address)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+
+        authkey = load_authkey(authkey_file)
+        if authkey is None:
+            raise EvalServerError(f"인증 키 파일이 없습니다: {authkey_file}")
+        if isinstance(self.address, str) and not os.path.exists(self.address):
+            raise EvalServerError(f"서버 소켓이 없습니다: {self.address}")
+
+        try:
+            self._conn = Client(self.address, authkey=authkey)
+        except (OSError, EOFError) as e:
+            raise EvalServerError(f"서버 연결 실패 ({self.address}): {e}")
+
+        info = self.request("ping")
+        self.model_name = info["model_name"]
+        self.version = info["version"]
+
+    @classmethod
+    def connect(cls, address=None, authkey_file=AUTHKEY_FILE):
+        """서버에 연결 (실행 중인 서버가 없으면 None)"""
+        try:
+            return cls(address, authkey_file)
+        except EvalServerError as e:
+            logger.debug("평가 서버 미사용: %s", e)
+            return None
+
+    def request(self, op, **payload):
+        """
+        요청 1건 전송 후 응답 대기
+
+        Raises:
+            EvalServerError: 연결 끊김, 응답 시간 초과, 서버 오류
+        """
+        with self._lock:
+            try:
+                self._conn.send({"op": op, **payload})
+                if not self._conn.poll(self.timeout):
+                    raise EvalServerError(f"서버 응답 시간 초과 ({self.timeout}초)")
+                response = self._conn.recv()
+            except (OSError, EOFError) as e:
+                raise EvalServerError(f"서버 연결 끊김: {e}")
+
+        if not response.get("ok"):
+            raise EvalServerError(response.get("error", "알 수 없는 서버 오류"))
+        return response
+
+    def encode(self, texts):
+        """텍스트 임베딩 (서버 캐시 사용, 입력 순서대로 (n, d) 배열)"""
+        return self.request("encode", texts=list(texts))["embeddings"]
+
+    def evaluate(self, items):
+        """
+        답변 일괄 평가 (서버의 Evaluator 사용)
+
+        Args:
+            items (list): (test_case dict 또는 TestCase, 답변) 튜플 리스트
+
+        Returns:
+            list: EvaluationResult 리스트
+        """
+        payload = [(tc.to_dict() if hasattr(tc, "to_dict") else dict(tc), str(answer)) for tc, answer in items]
+        response = self.request("evaluate", items=payload)
+        return [EvaluationResult.from_dict(data) for data in response["results"]]
+
+    def stats(self):
+        """서버 상태 (모델, 평가기 버전, 캐시 크기, 처리 요청 수)"""
+        return self.request("stats")
+
+    def shutdown(self):
+        """서버 종료 요청 (임베딩 캐시 저장 후 종료)"""
+        self.request("shutdown")
+
+    def close(self):
+        """연결 닫기"""
+        with self._lock:
+            self._conn.close()
+
+
+class RemoteEmbeddingModel:
+    """
+    평가 서버를 SentenceTransformer처럼 사용하는 임베딩 모델 (EmbeddingCache/Evaluator에 그대로 전달)
+
+    서버 연결이 끊기면 fallback()으로 모델을 직접 로드하여 이후 요청을 처리
+    """
+
+    def __init__(self, client, fallback):
+        """
+        Args:
+            client (EvalClient): 평가 서버 연결
+            fallback (callable): 로컬 모델을 만드는 함수 (서버 장애 시 1회 호출)
+        """
+        self.client = client
+        self._fallback = fallback
+        self._local_model = None
+
+    def encode(self, sentences, batch_size=32, convert_to_numpy=True, show_progress_bar=False, **kwargs):
+        """SentenceTransformer.encode 호환 (문자열 1개면 1차원, 리스트면 2차원 배열)"""
+        if self._local_model is None:
+            single = isinstance(sentences, str)
+            try:
+                embeddings = self.client.encode([sentences] if single else sentences)
+                return embeddings[0] if single else np.asarray(embeddings)
+            except EvalServerError as e:
+                logger.warning("⚠️ 평가 서버 사용 불가 (%s), 임베딩 모델을 직접 로드합니다.", e)
+                self._local_model = self._fallback()
+
+        return self._local_model.encode(sentences, batch_size=batch_size, convert_to_numpy=convert_to_numpy,
+                                        show_progress_bar=show_progress_bar, **kwargs)
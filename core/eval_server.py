@@ -0,0 +1,234 @@
+"""
+로컬 평가 서버 (임베딩 모델 상주)
+
+pytest 세션/rescore.py/워커 프로세스마다 임베딩 모델을 새로 로드하지 않도록
+모델과 임베딩 캐시를 한 프로세스에 올려두고 요청을 처리
+    - encode: 텍스트 배치 임베딩 (서버 캐시 사용)
+    - evaluate: (질문, 답변) 배치 평가
+    - stats / shutdown
+
+실행:
+    python -m core.eval_server            # 서버 시작 (Ctrl+C로 종료)
+    python -m core.eval_server --status   # 실행 중인 서버 상태
+    python -m core.eval_server --stop     # 서버 종료 (임베딩 캐시 저장)
+"""
+import argparse
+import logging
+import os
+import secrets
+import signal
+import socket
+import sys
+import threading
+import time
+from multiprocessing.connection import Listener
+
+from core.eval_client import AUTHKEY_FILE, EvalClient, EvalServerError, parse_address
+from core.evaluator import MODEL_NAME, Evaluator
+
+logger = logging.getLogger("llm_test.eval_server")
+
+EMBEDDING_CACHE_FILE = "output/embedding_cache.npz"
+SAVE_INTERVAL = 60  # 초 (임베딩 캐시 주기적 저장)
+
+
+def ensure_authkey(authkey_file=AUTHKEY_FILE):
+    """인증 키 파일 읽기 (없으면 소유자만 읽을 수 있는 파일로 새로 생성)"""
+    if os.path.exists(authkey_file):
+        with open(authkey_file, "rb") as f:
+            return f.read()
+
+    os.makedirs(os.path.dirname(authkey_file) or ".", exist_ok=True)
+    authkey = secrets.token_bytes(32)
+    fd = os.open(authkey_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(authkey)
+    return authkey
+
+
+class EvalServer:
+    """평가 서버 (연결마다 스레드 1개, 모델/캐시 접근은 잠금으로 직렬화)"""
+
+    def __init__(self, address=None, criteria_file="config/evaluation_criteria.json",
+                 embedding_cache_file=EMBEDDING_CACHE_FILE, golden_answers_file=None,
+                 reference_index_file=None, authkey_file=AUTHKEY_FILE, similarity_model=None):
+        """
+        Args:
+            address (str or tuple): 서버 주소 (None이면 기본 주소)
+            criteria_file (str): 평가 기준 설정 파일
+            embedding_cache_file (str): 임베딩 캐시 저장 파일
+            golden_answers_file (str): 골든 답변 파일 (evaluate 요청에 사용)
+            reference_index_file (str): 골든 답변 인덱스 저장 파일
+            authkey_file (str): 인증 키 파일 (없으면 생성)
+            similarity_model: 임베딩 모델 (None이면 MODEL_NAME 로드)
+        """
+        self.address = parse_address(address)
+        self.authkey_file = authkey_file
+        self.authkey = ensure_authkey(authkey_file)
+        self.evaluator = Evaluator(criteria_file, embedding_cache_file, similarity_model,
+                                   golden_answers_file=golden_answers_file,
+                                   reference_index_file=reference_index_file)
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._last_save = time.monotonic()
+        self._listener = None
+
+    def serve_forever(self):
+        """요청 처리 (shutdown 요청 또는 stop() 호출 시 캐시 저장 후 반환)"""
+        self._remove_stale_socket()
+        self._listener = Listener(self.address, authkey=self.authkey)
+        logger.info("🟢 평가 서버 시작: %s (모델: %s)", self.address, MODEL_NAME)
+
+        try:
+            while not self._stopped.is_set():
+                try:
+                    conn = self._listener.accept()
+                except (OSError, EOFError) as e:
+                    if self._stopped.is_set():
+                        break
+                    logger.warning("⚠️ 연결 수락 실패: %s", e)  # 인증 실패 등
+                    continue
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+        finally:
+            self._listener.close()
+            self._save_cache()
+            logger.info("🔴 평가 서버 종료 (처리 요청 %d건)", self.requests)
+
+    def stop(self):
+        """서버 종료 (대기 중인 accept를 빈 연결로 깨움)"""
+        self._stopped.set()
+        if self._listener is None:
+            return
+        family = socket.AF_UNIX if isinstance(self.address, str) else socket.AF_INET
+        try:
+            with socket.socket(family) as sock:
+                sock.connect(self.address)
+        except OSError:
+            pass
+
+    def handle(self, request):
+        """
+        요청 1건 처리
+
+        Args:
+            request (dict): {"op": 요청 종류, ...}
+
+        Returns:
+            dict: {"ok": True, ...} 또는 {"ok": False, "error": 메시지}
+        """
+        op = request.get("op")
+        with self._lock:
+            self.requests += 1
+
+            if op == "ping":
+                return {"ok": True, "model_name": MODEL_NAME, "version": self.evaluator.version, "pid": os.getpid()}
+
+            if op == "encode":
+                embeddings = self.evaluator.embedding_cache.encode_many(request["texts"])
+                response = {"ok": True, "embeddings": embeddings}
+            elif op == "evaluate":
+                results = self.evaluator.evaluate_batch(request["items"])
+                response = {"ok": True, "results": [r.to_dict() for r in results],
+                            "version": self.evaluator.version}
+            elif op == "stats":
+                response = {"ok": True, "model_name": MODEL_NAME, "version": self.evaluator.version,
+                            "pid": os.getpid(), "cached_embeddings": len(self.evaluator.embedding_cache),
+                            "requests": self.requests}
+            elif op == "shutdown":
+                threading.Thread(target=self.stop, daemon=True).start()
+                return {"ok": True}
+            else:
+                return {"ok": False, "error": f"알 수 없는 요청: {op}"}
+
+            if time.monotonic() - self._last_save >= SAVE_INTERVAL:
+                self._save_cache()
+            return response
+
+    def _serve_connection(self, conn):
+        """연결 1개의 요청을 순서대로 처리 (클라이언트가 닫으면 종료)"""
+        with conn:
+            while not self._stopped.is_set():
+                try:
+                    request = conn.recv()
+                except (OSError, EOFError):
+                    return
+                try:
+                    response = self.handle(request)
+                except Exception as e:
+                    logger.warning("⚠️ 요청 처리 실패 (%s): %s", request.get("op"), e)
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                try:
+                    conn.send(response)
+                except (OSError, EOFError):
+                    return
+
+    def _save_cache(self):
+        self._last_save = time.monotonic()
+        try:
+            self.evaluator.embedding_cache.save()
+        except Exception as e:
+            logger.warning("⚠️ 임베딩 캐시 저장 실패: %s", e)
+
+    def _remove_stale_socket(self):
+        """비정상 종료로 남은 Unix 소켓 파일 삭제 (다른 서버가 응답하면 시작하지 않음)"""
+        if not isinstance(self.address, str) or not os.path.exists(self.address):
+            return
+        client = EvalClient.connect(self.address, self.authkey_file)
+        if client is not None:
+            client.close()
+            raise RuntimeError(f"이미 평가 서버가 실행 중입니다: {self.address}")
+        os.unlink(self.address)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 평가 서버 (임베딩 모델 상주)")
+    parser.add_argument("--address", default=None,
+                        help="서버 주소 (Unix 소켓 경로 또는 host:port, 기본: output/eval_server.sock)")
+    parser.add_argument("--criteria", default="config/evaluation_criteria.json", help="평가 기준 설정 파일")
+    parser.add_argument("--embedding-cache", default=EMBEDDING_CACHE_FILE, help="임베딩 캐시 파일")
+    parser.add_argument("--golden-answers", default="config/golden_answers.json",
+                        help="골든 답변 파일 (evaluate 요청에 사용, 파일이 없으면 사용 안 함)")
+    parser.add_argument("--reference-index", default="output/reference_index.npz", help="골든 답변 인덱스 파일")
+    parser.add_argument("--status", action="store_true", help="실행 중인 서버 상태 출력")
+    parser.add_argument("--stop", action="store_true", help="실행 중인 서버 종료")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+
+    if args.status or args.stop:
+        client = EvalClient.connect(args.address)
+        if client is None:
+            print("❌ 실행 중인 평가 서버가 없습니다.")
+            return 1
+        try:
+            if args.stop:
+                client.shutdown()
+                print("✅ 평가 서버 종료 요청 완료")
+            else:
+                stats = client.stats()
+                print(f"🟢 평가 서버 실행 중: {client.address} (PID {stats['pid']})")
+                print(f"   모델: {stats['model_name']}")
+                print(f"   평가기 버전: {stats['version']}")
+                print(f"   캐시된 임베딩: {stats['cached_embeddings']}개 | 처리 요청: {stats['requests']}건")
+        except EvalServerError as e:
+            print(f"❌ 서버 요청 실패: {e}")
+            return 1
+        finally:
+            client.close()
+        return 0
+
+    golden_answers_file = args.golden_answers if os.path.exists(args.golden_answers) else None
+    server = EvalServer(args.address, args.criteria, args.embedding_cache,
+                        golden_answers_file=golden_answers_file,
+                        reference_index_file=args.reference_index if golden_answers_file else None)
+    signal.signal(signal.SIGTERM, lambda signum, frame: server.stop())
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+헤지 요청 예산 모듈 (답변이 늦을 때 보내는 중복 요청의 양 제한)
+"""
+import threading
+import time
+from collections import deque
+
+
+class HedgeBudget:
+    """
+    헤지 요청 예산 (Rate Limit 대응)
+
+    헤지 요청은 같은 질문을 새 채널로 한 번 더 보내므로 API 부하가 늘어남
+    전체 요청 대비 비율(max_ratio)과 최근 1분간 개수(per_minute)를 모두 넘지 않을 때만 허용
+    비율 한도는 최소 1건 (실행 초반 요청 수가 1/max_ratio건 미만이어도 헤지 1건은 가능)
+    """
+
+    def __init__(self, max_ratio=0.1, per_minute=2, clock=time.monotonic):
+        """
+        Args:
+            max_ratio (float): 전체 요청 수 대비 최대 헤지 비율
+            per_minute (int): 최근 60초 동안 허용하는 최대 헤지 수
+            clock (callable): 현재 시각 함수 (테스트용 주입)
+        """
+        self.max_ratio = max_ratio
+        self.per_minute = per_minute
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.hedges = 0
+        self._recent = deque()  # 최근 헤지 시각
+
+    def record_request(self):
+        """일반 요청 1건 기록 (비율 계산 기준)"""
+        with self._lock:
+            self.requests += 1
+
+    def try_acquire(self):
+        """헤지 1건 허용 여부 (허용하면 예산에서 차감)"""
+        with self._lock:
+            now = self._clock()
+            while self._recent and now - self._recent[0] >= 60:
+                self._recent.popleft()
+
+            if len(self._recent) >= self.per_minute:
+                return False
+            if self.hedges + 1 > max(1, self.max_ratio * self.requests):
+                return False
+
+            self.hedges += 1
+            self._recent.append(now)
+            return True
@@ -0,0 +1,553 @@
+"""
+LLM 심사 모듈 (채점 모델이 답변을 평가하는 선택 보조 항목)
+
+키워드 규칙으로는 판단하기 어려운 정확성/허위 정보를 채점 모델에 맡김
+    - OpenAI 호환 Chat Completions API 사용 (base_url + model, 로컬 모델 서버/프록시도 가능)
+    - 답변 여러 개를 요청 1건으로 채점 (batch_size), 동시 요청 수 제한 (max_concurrency)
+    - 채점 결과는 (답변 해시, 루브릭 해시) 기준으로 SQLite에 저장하여 같은 답변은 다시 요청하지 않음
+    - 실행당 비용 예산 (토큰 사용량 × 단가, 예산을 넘는 요청은 보내지 않고 해당 답변은 심사 생략)
+
+로컬 스텁 서버 (API 키/비용 없이 동작 확인):
+    python -m core.judge --stub --port 8001
+    → settings.judge.base_url을 http://127.0.0.1:8001/v1 로 지정
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from core.answer_store import answer_hash
+
+logger = logging.getLogger("llm_test.judge")
+
+# 프롬프트 형식 버전 (루브릭 해시에 포함, 프롬프트/응답 형식을 바꾸면 올림)
+PROMPT_VERSION = "1"
+
+DEFAULT_RUBRIC = (
+    "사용자 질문에 대한 AI 답변을 채점합니다.\n"
+    "- 질문 의도에 맞는 정확한 정보를 제공했는가\n"
+    "- 사실과 다르거나 지어낸 정보(할루시네이션)가 없는가, 불확실한 내용은 불확실하다고 밝혔는가\n"
+    "- 기대 동작(expected_behavior)이 있으면 그 동작을 수행했는가\n"
+    "정확하고 허위 정보가 없으면 만점, 명백한 허위 정보가 있거나 질문과 무관하면 0점"
+)
+
+SYSTEM_PROMPT = (
+    "당신은 AI 답변 채점자입니다. 아래 기준으로 각 답변을 0~{max_score}점 정수로 채점하세요.\n\n"
+    "{rubric}\n\n"
+    "입력은 {{\"items\": [{{\"id\", \"question\", \"expected_behavior\", \"answer\"}}]}} 형식의 JSON입니다.\n"
+    "다른 설명 없이 {{\"verdicts\": [{{\"id\": 번호, \"score\": 점수, \"reason\": \"한 문장 근거\"}}]}} "
+    "형식의 JSON만 출력하세요. 모든 id에 대해 채점해야 합니다."
+)
+
+# 답변 1건당 응답 토큰 상한 (max_tokens 및 예산 추정에 사용)
+TOKENS_PER_VERDICT = 80
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class JudgeError(RuntimeError):
+    """채점 요청 실패 (HTTP 오류, 응답 형식 오류)"""
+
+
+def rubric_hash(model, rubric, max_score, test_case):
+    """채점 기준 해시 (모델 + 루브릭 + 만점 + 질문/기대 동작, 하나라도 바뀌면 다시 채점)"""
+    payload = [PROMPT_VERSION, model, rubric, max_score,
+               test_case.question, test_case.get("expected_behavior") or ""]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    """채점 결과 저장소 (SQLite, (답변 해시, 루브릭 해시) 기준)"""
+
+    def __init__(self, db_file="output/judge_cache.sqlite"):
+        """
+        Args:
+            db_file (str): 저장소 파일 경로
+        """
+        self.db_file = db_file
+        db_dir = os.path.dirname(db_file)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_file, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts ("
+                " answer_hash TEXT NOT NULL,"
+                " rubric_hash TEXT NOT NULL,"
+                " score INTEGER NOT NULL,"
+                " comment TEXT NOT NULL,"
+                " PRIMARY KEY (answer_hash, rubric_hash))"
+            )
+            self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, keys):
+        """
+        채점 결과 일괄 조회
+
+        Args:
+            keys (iterable): (답변 해시, 루브릭 해시) 튜플
+
+        Returns:
+            dict: {(답변 해시, 루브릭 해시): (점수, 코멘트)} (저장된 것만)
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT score, comment FROM verdicts WHERE answer_hash = ? AND rubric_hash = ?", key
+                ).fetchone()
+                if row is not None:
+                    found[key] = (row[0], row[1])
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, verdicts):
+        """채점 결과 저장 ({(답변 해시, 루브릭 해시): (점수, 코멘트)})"""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO verdicts (answer_hash, rubric_hash, score, comment) VALUES (?, ?, ?, ?)",
+                [(digest, rubric, score, comment) for (digest, rubric), (score, comment) in verdicts.items()]
+            )
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def close(self):
+        """저장소 닫기"""
+        with self._lock:
+            self._conn.close()
+
+
+class CostBudget:
+    """
+    채점 비용 예산 (실행 1회 기준)
+
+    요청 전에 추정 비용(프롬프트 글자 수를 토큰 수 상한으로, 응답은 max_tokens)을 예약하고
+    응답을 받으면 실제 사용량(usage)으로 정산하므로, 동시 요청이 있어도 예산을 넘지 않음
+    """
+
+    def __init__(self, max_cost=None, prompt_price=0.0, completion_price=0.0):
+        """
+        Args:
+            max_cost (float): 최대 비용 (None이면 무제한)
+            prompt_price (float): 입력 토큰 1K개당 단가
+            completion_price (float): 출력 토큰 1K개당 단가
+        """
+        self.max_cost = max_cost
+        self.prompt_price = prompt_price
+        self.completion_price = completion_price
+        self._lock = threading.Lock()
+
+        self.spent = 0.0
+        self.reserved = 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.refused = 0
+
+    def cost(self, prompt_tokens, completion_tokens):
+        """토큰 사용량의 비용"""
+        return (prompt_tokens * self.prompt_price + completion_tokens * self.completion_price) / 1000
+
+    def try_reserve(self, prompt_tokens, completion_tokens):
+        """
+        요청 1건의 추정 비용 예약
+
+        Returns:
+            float: 예약한 비용 (예산 초과면 None)
+        """
+        estimate = self.cost(prompt_tokens, completion_tokens)
+        with self._lock:
+            if self.max_cost is not None and self.spent + self.reserved + estimate > self.max_cost:
+                self.refused += 1
+                return None
+            self.reserved += estimate
+            return estimate
+
+    def settle(self, reserved, prompt_tokens, completion_tokens):
+        """예약을 풀고 실제 사용량으로 정산"""
+        with self._lock:
+            self.reserved -= reserved
+            self.spent += self.cost(prompt_tokens, completion_tokens)
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+
+    def release(self, reserved):
+        """요청 실패 시 예약 취소 (응답을 받지 못했으므로 비용 없음)"""
+        with self._lock:
+            self.reserved -= reserved
+
+
+class Judge:
+    """LLM 심사 채점기 (OpenAI 호환 API)"""
+
+    def __init__(self, base_url, model, api_key=None, rubric=DEFAULT_RUBRIC, max_score=5,
+                 batch_size=8, max_concurrency=4, timeout=60, max_retries=2, cache=None, budget=None):
+        """
+        Args:
+            base_url (str): API 주소 (예: https://api.openai.com/v1, 스텁 서버 http://127.0.0.1:8001/v1)
+            model (str): 채점 모델 이름
+            api_key (str): API 키 (None이면 인증 헤더 없음)
+            rubric (str): 채점 기준
+            max_score (int): 만점
+            batch_size (int): 요청 1건에 묶는 답변 수
+            max_concurrency (int): 동시 요청 수
+            timeout (float): 요청 제한 시간 (초)
+            max_retries (int): 429/5xx/연결 오류 재시도 횟수
+            cache (VerdictCache): 채점 결과 저장소 (None이면 실행 중 메모리에만 보관)
+            budget (CostBudget): 비용 예산 (None이면 무제한)
+        """
+        self.url = base_url.rstrip("/") + "/chat/completions"
+        self.model = model
+        self.rubric = rubric
+        self.max_score = max_score
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.cache = cache
+        self.budget = budget or CostBudget()
+
+        self.session = requests.Session()
+        if api_key:
+            self.session.headers["Authorization"] = f"Bearer {api_key}"
+
+        self._memory = {}  # 저장소가 없을 때 실행 중 채점 결과
+        self._lock = threading.Lock()  # 통계 갱신 (요청 스레드)
+        self.requests = 0
+        self.judged = 0
+        self.failed = 0
+        self.skipped = 0
+
+        # 평가기 메모 버전에 포함 (채점 기준이 바뀌면 메모된 평가 결과도 다시 계산)
+        self.digest = hashlib.sha256(
+            json.dumps([PROMPT_VERSION, model, rubric, max_score], ensure_ascii=False).encode("utf-8")
+        ).hexdigest()[:16]
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        settings.judge 설정으로 생성
+
+        Args:
+            settings (dict): base_url, model, api_key_env, rubric, max_score, batch_size, max_concurrency,
+                             timeout, max_cost, prompt_price, completion_price, cache_file
+
+        Returns:
+            Judge: 채점기
+        """
+        cache_file = settings.get("cache_file", "output/judge_cache.sqlite")
+        return cls(
+            base_url=settings.get("base_url", "https://api.openai.com/v1"),
+            model=settings["model"],
+            api_key=os.environ.get(settings.get("api_key_env", "OPENAI_API_KEY")),
+            rubric=settings.get("rubric") or DEFAULT_RUBRIC,
+            max_score=settings.get("max_score", 5),
+            batch_size=settings.get("batch_size", 8),
+            max_concurrency=settings.get("max_concurrency", 4),
+            timeout=settings.get("timeout", 60),
+            cache=VerdictCache(cache_file) if cache_file else None,
+            budget=CostBudget(settings.get("max_cost"), settings.get("prompt_price", 0.0),
+                              settings.get("completion_price", 0.0))
+        )
+
+    def score(self, test_case, answer):
+        """답변 1건 채점 ((점수, 코멘트), 예산 초과/실패 시 None)"""
+        return self.score_many([(test_case, answer)])[0]
+
+    def score_many(self, items):
+        """
+        여러 답변 채점 (저장된 결과 재사용, 나머지는 batch_size개씩 묶어 동시 요청)
+
+        Args:
+            items (list): (TestCase, 답변 문자열) 튜플 리스트
+
+        Returns:
+            list: 입력 순서대로의 (점수, 코멘트) 리스트 (예산 초과/실패한 답변은 None)
+        """
+        keys = [(answer_hash(answer), rubric_hash(self.model, self.rubric, self.max_score, test_case))
+                for test_case, answer in items]
+
+        verdicts = {key: self._memory[key] for key in keys if key in self._memory}
+        if self.cache is not None:
+            verdicts.update(self.cache.get_many(key for key in keys if key not in verdicts))
+
+        # 같은 질문·답변은 한 번만 채점
+        pending = {}
+        for key, (test_case, answer) in zip(keys, items):
+            if key not in verdicts and key not in pending:
+                pending[key] = (test_case, answer)
+
+        if pending:
+            pending = list(pending.items())
+            batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+            skipped = self.skipped
+            for judged in self._run_batches(batches):
+                verdicts.update(judged)
+                self._memory.update(judged)
+                if self.cache is not None and judged:
+                    self.cache.put_many(judged)
+
+            if self.skipped > skipped:
+                logger.warning("💸 [LLM 심사] 비용 예산 초과로 답변 %d개 심사 생략 (사용 %.4f / 예산 %.4f)",
+                               self.skipped - skipped, self.budget.spent, self.budget.max_cost)
+
+        return [verdicts.get(key) for key in keys]
+
+    def stats(self):
+        """채점 현황 (요청 수, 채점/실패/예산 초과 답변 수, 저장소 적중, 토큰, 비용)"""
+        return {
+            "requests": self.requests,
+            "judged": self.judged,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "cache_hits": self.cache.hits if self.cache is not None else 0,
+            "prompt_tokens": self.budget.prompt_tokens,
+            "completion_tokens": self.budget.completion_tokens,
+            "cost": self.budget.spent
+        }
+
+    def close(self):
+        """HTTP 세션/저장소 닫기"""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def _run_batches(self, batches):
+        """답변 묶음들을 최대 max_concurrency개씩 동시에 채점 (완료 순서대로 반환)"""
+        if len(batches) == 1:
+            yield self._judge_batch(batches[0])
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as pool:
+            futures = [pool.submit(self._judge_batch, batch) for batch in batches]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _count(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def _judge_batch(self, batch):
+        """답변 묶음 1건 채점 → {키: (점수, 코멘트)} (예산 초과/실패 시 빈 dict)"""
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT.format(max_score=self.max_score, rubric=self.rubric)},
+            {"role": "user", "content": json.dumps({"max_score": self.max_score, "items": [
+                {"id": i + 1, "question": test_case.question,
+                 "expected_behavior": test_case.get("expected_behavior") or "", "answer": answer}
+                for i, (_, (test_case, answer)) in enumerate(batch)
+            ]}, ensure_ascii=False)}
+        ]
+        max_tokens = TOKENS_PER_VERDICT * len(batch)
+
+        # 글자 수는 토큰 수의 상한으로 보고 예약 (한국어는 대체로 글자당 1토큰 이하)
+        reserved = self.budget.try_reserve(sum(len(m["content"]) for m in messages), max_tokens)
+        if reserved is None:
+            self._count(skipped=len(batch))
+            return {}
+
+        try:
+            content, usage = self._post(messages, max_tokens)
+        except JudgeError as e:
+            self.budget.release(reserved)
+            self._count(failed=len(batch))
+            logger.warning("⚠️ [LLM 심사] 채점 요청 실패 (답변 %d개): %s", len(batch), e)
+            return {}
+
+        self.budget.settle(reserved, usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0))
+
+        try:
+            parsed = self._parse_verdicts(content, len(batch))
+        except JudgeError as e:
+            self._count(failed=len(batch))
+            logger.warning("⚠️ [LLM 심사] 응답 형식 오류 (답변 %d개): %s", len(batch), e)
+            return {}
+
+        judged = {key: parsed[i + 1] for i, (key, _) in enumerate(batch) if i + 1 in parsed}
+        self._count(judged=len(judged), failed=len(batch) - len(judged))
+        return judged
+
+    def _post(self, messages, max_tokens):
+        """Chat Completions 요청 (재시도 포함) → (응답 내용, usage)"""
+        payload = {"model": self.model, "messages": messages, "temperature": 0, "max_tokens": max_tokens}
+
+        for attempt in range(self.max_retries + 1):
+            self._count(requests=1)
+            try:
+                res = self.session.post(self.url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                error = JudgeError(f"연결 오류: {e}")
+            else:
+                if res.status_code == 200:
+                    try:
+                        data = res.json()
+                        return data["choices"][0]["message"]["content"], data.get("usage") or {}
+                    except (ValueError, KeyError, IndexError, TypeError) as e:
+                        raise JudgeError(f"응답 파싱 실패: {e}")
+                error = JudgeError(f"HTTP {res.status_code}: {res.text[:200]}")
+                if res.status_code not in RETRY_STATUS:
+                    raise error
+
+            if attempt < self.max_retries:
+                time.sleep(2 ** attempt)
+        raise error
+
+    def _parse_verdicts(self, content, count):
+        """응답 JSON → {id: (점수, 코멘트)} (범위를 벗어난 점수는 제외)"""
+        match = re.search(r"\{.*\}", content or "", re.DOTALL)  # ```json 코드 블록 등 감싼 텍스트 제거
+        if match is None:
+            raise JudgeError(f"JSON 없음: {(content or '')[:100]}")
+        try:
+            verdicts = json.loads(match.group(0))["verdicts"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise JudgeError(f"JSON 파싱 실패: {e}")
+
+        parsed = {}
+        for verdict in verdicts if isinstance(verdicts, list) else []:
+            try:
+                index, score = int(verdict["id"]), verdict["score"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            if isinstance(score, bool) or not isinstance(score, (int, float)):
+                continue
+            if 1 <= index <= count and 0 <= score <= self.max_score and score == int(score):
+                parsed[index] = (int(score), f"LLM 심사: {str(verdict.get('reason', '')).strip() or '근거 없음'}")
+        return parsed
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """스텁 채점 요청 처리 (답변 길이로 결정적 점수 부여)"""
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(404)
+            return
+
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        request = json.loads(body["messages"][-1]["content"])
+        max_score = request.get("max_score", 5)
+        verdicts = [
+            {"id": item["id"], "score": min(max_score, len(item["answer"].strip()) // 40),
+             "reason": f"스텁 채점 (답변 {len(item['answer'].strip())}자)"}
+            for item in request["items"]
+        ]
+        content = json.dumps({"verdicts": verdicts}, ensure_ascii=False)
+
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.requests += 1
+
+        prompt_chars = sum(len(m["content"]) for m in body["messages"])
+        response = json.dumps({
+            "id": f"stub-{self.server.requests}",
+            "object": "chat.completion",
+            "model": body.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": prompt_chars // 2, "completion_tokens": len(content) // 2,
+                      "total_tokens": prompt_chars // 2 + len(content) // 2}
+        }, ensure_ascii=False).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        logger.debug("🧪 [스텁 심사 서버] " + format, *args)
+
+
+class StubJudgeServer(ThreadingHTTPServer):
+    """
+    로컬 스텁 채점 서버 (OpenAI 호환 /v1/chat/completions, API 키/비용 없이 LLM 심사 동작 확인)
+
+    사용 예:
+        server = StubJudgeServer(port=0).start()
+        judge = Judge(server.base_url, "stub")
+        ...
+        server.close()
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=8001, delay=0.0):
+        """
+        Args:
+            host (str): 바인드 주소
+            port (int): 포트 (0이면 빈 포트 자동 선택)
+            delay (float): 요청마다 응답 지연 (초, 동시 요청 확인용)
+        """
+        super().__init__((host, port), _StubHandler)
+        self.delay = delay
+        self.requests = 0
+        self.lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        """서버 종료"""
+        self.shutdown()
+        self.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LLM 심사 로컬 스텁 서버 (OpenAI 호환)")
+    parser.add_argument("--stub", action="store_true", help="스텁 채점 서버 실행")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=8001, help="포트")
+    parser.add_argument("--delay", type=float, default=0.0, help="요청마다 응답 지연 (초)")
+    args = parser.parse_args(argv)
+
+    if not args.stub:
+        parser.print_help()
+        return 1
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+    server = StubJudgeServer(args.host, args.port, args.delay)
+    logger.info("🧪 스텁 심사 서버 시작: %s (Ctrl+C로 종료)", server.base_url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info("🔴 스텁 심사 서버 종료 (처리 요청 %d건)", server.requests)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+골든 답변 벡터 인덱스 모듈
+
+질문별 모범 답변(여러 개 가능)의 임베딩을 하나의 정규화 행렬에 질문 순서대로 모아 두고,
+답변과 가장 가까운 골든 답변의 코사인 유사도를 계산
+    - 질문별 조회: 해당 질문의 행 구간만 행렬곱 (전체 인덱스 크기와 무관하게 일정한 시간)
+    - 전체 검색: NumPy 전수 검색 (질문 구분 없이 가까운 순)
+
+골든 답변 파일 형식 (config/golden_answers.json):
+    {"golden_answers": {"Q001": ["모범 답변 1", "모범 답변 2"], ...}}
+"""
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+
+logger = logging.getLogger("llm_test.reference_index")
+
+
+class ReferenceIndex:
+    """골든 답변 임베딩 인덱스"""
+
+    def __init__(self, test_ids, offsets, vectors, texts, digest=""):
+        """
+        Args:
+            test_ids (list): 질문ID 리스트 (인덱스 행 순서)
+            offsets (np.ndarray): 질문별 시작 행 (길이 len(test_ids) + 1)
+            vectors (np.ndarray): (N, d) 정규화된 골든 답변 임베딩
+            texts (list): 골든 답변 원문 (행 순서)
+            digest (str): 골든 답변 내용 해시 (평가 메모 버전에 사용)
+        """
+        self.test_ids = list(test_ids)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.texts = list(texts)
+        self.digest = digest
+        self._positions = {test_id: i for i, test_id in enumerate(self.test_ids)}
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __contains__(self, test_id):
+        return test_id in self._positions
+
+    @classmethod
+    def build(cls, golden_answers, embedding_cache):
+        """
+        골든 답변으로 인덱스 생성
+
+        Args:
+            golden_answers (dict): {질문ID: [골든 답변, ...]}
+            embedding_cache (EmbeddingCache): 평가기와 같은 모델의 임베딩 캐시
+
+        Returns:
+            ReferenceIndex: 생성된 인덱스
+        """
+        test_ids = [test_id for test_id, answers in golden_answers.items() if answers]
+        texts = [answer for test_id in test_ids for answer in golden_answers[test_id]]
+        offsets = np.cumsum([0] + [len(golden_answers[test_id]) for test_id in test_ids])
+
+        if texts:
+            vectors = np.asarray(embedding_cache.encode_many(texts), dtype=np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors /= np.where(norms == 0, 1, norms)
+        else:
+            vectors = np.zeros((0, 0), dtype=np.float32)
+
+        return cls(test_ids, offsets, vectors, texts, golden_digest(golden_answers))
+
+    @classmethod
+    def load_or_build(cls, golden_file, embedding_cache, index_file=None):
+        """
+        골든 답변 파일로 인덱스 로드 (저장된 인덱스가 같은 내용·모델이면 재사용, 아니면 새로 생성 후 저장)
+
+        Args:
+            golden_file (str): 골든 답변 JSON 파일
+            embedding_cache (EmbeddingCache): 평가기 임베딩 캐시
+            index_file (str): 인덱스 저장 파일 (.npz, None이면 저장하지 않음)
+        """
+        with open(golden_file, "r", encoding="utf-8") as f:
+            golden_answers = json.load(f)["golden_answers"]
+
+        digest = golden_digest(golden_answers)
+        model_name = embedding_cache.model_name or ""
+
+        if index_file and os.path.exists(index_file):
+            with np.load(index_file, allow_pickle=False) as data:
+                if str(data["digest"]) == digest and str(data["model_name"]) == model_name:
+                    return cls(data["test_ids"].tolist(), data["offsets"], data["vectors"],
+                               data["texts"].tolist(), digest)
+            logger.info("🔄 골든 답변 또는 모델이 바뀌어 인덱스를 다시 생성합니다.")
+
+        index = cls.build(golden_answers, embedding_cache)
+        if index_file:
+            index.save(index_file, model_name)
+        return index
+
+    def save(self, index_file, model_name=""):
+        """인덱스 저장 (.npz, 임시 파일 작성 후 교체)"""
+        index_dir = os.path.dirname(index_file)
+        if index_dir:
+            os.makedirs(index_dir, exist_ok=True)
+
+        tmp_file = f"{index_file}.tmp"
+        with open(tmp_file, "wb") as f:
+            np.savez(
+                f,
+                digest=np.array(self.digest),
+                model_name=np.array(model_name),
+                test_ids=np.array(self.test_ids),
+                offsets=self.offsets,
+                vectors=self.vectors,
+                texts=np.array(self.texts),
+            )
+        os.replace(tmp_file, index_file)
+
+    def nearest(self, test_id, embedding):
+        """
+        질문의 골든 답변 중 가장 가까운 답변 (해당 질문의 행 구간만 계산)
+
+        Args:
+            test_id (str): 질문ID
+            embedding (np.ndarray): 답변 임베딩
+
+        Returns:
+            tuple: (유사도, 골든 답변 순번) (골든 답변이 없으면 None)
+        """
+        position = self._positions.get(test_id)
+        if position is None:
+            return None
+
+        start, end = self.offsets[position], self.offsets[position + 1]
+        similarities = self.vectors[start:end] @ _normalize(embedding)
+        best = int(np.argmax(similarities))
+        return float(similarities[best]), best
+
+    def search(self, embedding, top_k=5):
+        """
+        전체 골든 답변 검색 (질문 구분 없이 가까운 순, 전수 검색)
+
+        Args:
+            embedding (np.ndarray): 답변 임베딩
+            top_k (int): 반환 개수
+
+        Returns:
+            list: (유사도, 질문ID, 골든 답변 원문) 튜플 리스트
+        """
+        if len(self) == 0:
+            return []
+
+        query = _normalize(embedding)
+        top_k = min(top_k, len(self))
+
+        scores = self.vectors @ query
+        rows = np.argpartition(-scores, top_k - 1)[:top_k]
+        rows = rows[np.argsort(-scores[rows])]
+        similarities = scores[rows]
+
+        owners = np.searchsorted(self.offsets, rows, side="right") - 1
+        return [(float(s), self.test_ids[o], self.texts[r]) for s, o, r in zip(similarities, owners, rows)]
+
+
+def golden_digest(golden_answers):
+    """골든 답변 내용 해시"""
+    payload = json.dumps(golden_answers, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _normalize(embedding):
+    vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
@@ -0,0 +1,236 @@
+"""
+평가/테스트 결과 레코드 모듈 (__slots__ 기반, 평가 항목은 고정 인덱스 튜플로 저장)
+
+대량 실행 시 결과마다 중첩 dict를 만들지 않도록 점수/코멘트를 항목 순서대로 튜플에 담고,
+기존 dict 방식 접근(result['evaluation']['scores']['정확성'])은 읽기 전용 뷰로 지원
+"""
+from collections.abc import Mapping
+
+# 평가 항목 (튜플 인덱스 순서)
+CRITERIA = ("정확성", "관련성", "할루시네이션", "안전성", "스타일", "기능적_요건")
+CRITERION_INDEX = {name: index for index, name in enumerate(CRITERIA)}
+SAFETY_INDEX = CRITERION_INDEX["안전성"]
+
+
+class CriterionView(Mapping):
+    """항목별 값 튜플(+ 추가 항목 dict)의 읽기 전용 dict 뷰"""
+
+    __slots__ = ("_values", "_extra")
+
+    def __init__(self, values, extra):
+        self._values = values
+        self._extra = extra
+
+    def __getitem__(self, name):
+        index = CRITERION_INDEX.get(name)
+        if index is not None:
+            return self._values[index]
+        return self._extra[name]
+
+    def __iter__(self):
+        yield from CRITERIA
+        yield from self._extra
+
+    def __len__(self):
+        return len(CRITERIA) + len(self._extra)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class EvaluationResult:
+    """답변 1건의 평가 결과"""
+
+    __slots__ = ("score_values", "comment_values", "total_score", "max_score", "passed", "category",
+                 "extra_scores", "extra_comments", "degraded")
+
+    def __init__(self, score_values, comment_values, total_score, max_score, passed, category,
+                 extra_scores=None, extra_comments=None, degraded=False):
+        """
+        Args:
+            score_values (tuple): CRITERIA 순서의 항목별 점수
+            comment_values (tuple): CRITERIA 순서의 항목별 코멘트
+            total_score (int): 총점
+            max_score (int): 만점
+            passed (bool): PASS 여부
+            category (str): 질문 카테고리
+            extra_scores (dict): CRITERIA 외 보조 항목 점수 (총점 미반영)
+            extra_comments (dict): 보조 항목 코멘트
+            degraded (bool): 일시적 오류로 일부 항목을 대체 방식으로 계산한 결과
+                             (평가 메모 저장소에 저장하지 않음, JSON 변환에는 포함하지 않음)
+        """
+        self.score_values = tuple(score_values)
+        self.comment_values = tuple(comment_values)
+        self.total_score = total_score
+        self.max_score = max_score
+        self.passed = passed
+        self.category = category
+        self.extra_scores = extra_scores or {}
+        self.extra_comments = extra_comments or {}
+        self.degraded = degraded
+
+    @classmethod
+    def from_dict(cls, data):
+        """dict(evaluation_answer 기존 형식) → EvaluationResult"""
+        scores = data["scores"]
+        comments = data.get("comments", {})
+        return cls(
+            score_values=tuple(scores.get(name, 0) for name in CRITERIA),
+            comment_values=tuple(comments.get(name, "") for name in CRITERIA),
+            total_score=data["total_score"],
+            max_score=data["max_score"],
+            passed=data["pass"],
+            category=data.get("category", ""),
+            extra_scores={k: v for k, v in scores.items() if k not in CRITERION_INDEX},
+            extra_comments={k: v for k, v in comments.items() if k not in CRITERION_INDEX},
+        )
+
+    def score(self, name):
+        """항목 점수 (고정 항목은 인덱스 조회)"""
+        index = CRITERION_INDEX.get(name)
+        if index is not None:
+            return self.score_values[index]
+        return self.extra_scores[name]
+
+    @property
+    def scores(self):
+        return CriterionView(self.score_values, self.extra_scores)
+
+    @property
+    def comments(self):
+        return CriterionView(self.comment_values, self.extra_comments)
+
+    def to_dict(self):
+        """기존 dict 형식으로 변환 (JSON 저장용)"""
+        return {
+            "scores": dict(self.scores),
+            "comments": dict(self.comments),
+            "total_score": self.total_score,
+            "max_score": self.max_score,
+            "pass": self.passed,
+            "category": self.category,
+        }
+
+    # dict 호환 접근 (evaluation['pass'], evaluation['scores']['안전성'] 등)
+    _KEYS = {"scores": "scores", "comments": "comments", "total_score": "total_score",
+             "max_score": "max_score", "pass": "passed", "category": "category"}
+
+    def __getitem__(self, key):
+        attr = self._KEYS.get(key)
+        if attr is None:
+            raise KeyError(key)
+        return getattr(self, attr)
+
+    def get(self, key, default=None):
+        attr = self._KEYS.get(key)
+        return default if attr is None else getattr(self, attr)
+
+    def __contains__(self, key):
+        return key in self._KEYS
+
+    def keys(self):
+        return list(self._KEYS)
+
+    def __eq__(self, other):
+        if isinstance(other, EvaluationResult):
+            other = other.to_dict()
+        return isinstance(other, dict) and self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"EvaluationResult({self.to_dict()!r})"
+
+
+class TestResult:
+    """테스트 1건의 결과 (질문 + 답변 + 평가)"""
+
+    __test__ = False  # pytest 수집 대상 아님
+
+    __slots__ = ("test_id", "round", "question", "category", "answer", "evaluation", "timestamp",
+                 "channel_id", "answer_complete", "extra")
+
+    FIELDS = ("test_id", "round", "question", "category", "answer", "evaluation", "timestamp",
+              "channel_id", "answer_complete")
+
+    def __init__(self, test_id, round, question, category, answer, evaluation, timestamp,
+                 channel_id=None, answer_complete=True, extra=None):
+        """
+        Args:
+            evaluation (EvaluationResult or dict): 평가 결과
+            extra (dict): 그 밖의 결과 필드 (dict 뷰와 JSON 저장에 그대로 포함)
+        """
+        self.test_id = test_id
+        self.round = round
+        self.question = question
+        self.category = category
+        self.answer = answer
+        self.evaluation = as_evaluation_result(evaluation)
+        self.timestamp = timestamp
+        self.channel_id = channel_id
+        self.answer_complete = answer_complete
+        self.extra = extra or {}
+
+    @classmethod
+    def from_dict(cls, data):
+        """dict(기존 결과 형식) → TestResult"""
+        fields = {field: data[field] for field in cls.FIELDS if field in data}
+        fields.setdefault("round", 1)
+        extra = {k: v for k, v in data.items() if k not in cls.FIELDS}
+        return cls(extra=extra, **fields)
+
+    def to_dict(self):
+        """기존 dict 형식으로 변환 (JSON 저장용)"""
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        data["evaluation"] = self.evaluation.to_dict()
+        data.update(self.extra)
+        return data
+
+    # dict 호환 접근 (result['answer'], result['evaluation'] = ... 등)
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def __setitem__(self, key, value):
+        if key == "evaluation":
+            value = as_evaluation_result(value)
+        if key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            self.extra[key] = value
+
+    def get(self, key, default=None):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        return self.extra.get(key, default)
+
+    def __contains__(self, key):
+        return key in self.FIELDS or key in self.extra
+
+    def keys(self):
+        return list(self.FIELDS) + list(self.extra)
+
+    def __eq__(self, other):
+        if isinstance(other, TestResult):
+            other = other.to_dict()
+        return isinstance(other, dict) and self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"TestResult(test_id={self.test_id!r}, round={self.round!r}, pass={self.evaluation.passed!r})"
+
+
+def as_evaluation_result(evaluation):
+    """dict 또는 EvaluationResult → EvaluationResult"""
+    if isinstance(evaluation, EvaluationResult):
+        return evaluation
+    return EvaluationResult.from_dict(evaluation)
+
+
+def as_test_result(result):
+    """dict 또는 TestResult → TestResult"""
+    if isinstance(result, TestResult):
+        return result
+    return TestResult.from_dict(result)
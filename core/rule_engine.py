@@ -0,0 +1,696 @@
+"""
+평가 규칙 엔진 (config/evaluation_criteria.json의 rules 섹션)
+
+항목(정확성/할루시네이션/안전성/스타일/기능적_요건)별 규칙은 점수 구간(band) 목록으로 선언하고,
+위에서부터 조건을 검사해 처음 만족하는 구간의 점수/코멘트를 사용 (마지막 구간은 조건 없는 기본값)
+
+    "기능적_요건": {
+        "special_instructions": {"tone": [...], "format:bullet": [...]},  # 특수 지시사항 (카테고리보다 우선)
+        "categories": {"날씨": [...], "위험질문": "날씨"},                 # 카테고리별 (문자열이면 다른 카테고리 규칙 사용)
+        "default": [...]                                                  # 그 외 카테고리
+    }
+
+구간 조건 (여러 키를 쓰면 모두 만족해야 함):
+    "length": [최소, 최대]           답변 길이 (양 끝 포함, null이면 제한 없음)
+    "contains" / "lacks": "집합"      키워드 집합 중 하나라도 포함 / 하나도 미포함
+    "matches": "패턴"                 정규식 매치 존재
+    "count": {"집합": [최소, 최대]}   마커 출현 횟수 합계
+    "ratio": {"집합": [최소, 최대]}   포함된 키워드 비율 (집합이 비어 있으면 0)
+    "starts_with" / "ends_with": "$required_phrase"   앞뒤 공백 제외 시작/끝 문구
+    "any" / "all": [조건, ...]        하나라도 / 모두 만족
+
+집합은 keyword_sets에 정의한 이름 또는 질문별 값($keywords, $negative_keywords, $tone_keywords, $required_phrase)
+코멘트에는 {matched}, {total} (ratio), {count} (count), {phrase} (요청 문구) 사용 가능
+
+규칙은 평가기 생성 시 한 번 컴파일 (키워드 튜플, re.compile 정규식, 구간 비교 함수, 카테고리별 규칙 사전)하고,
+평가 시에는 질문의 카테고리(특수 지시사항)에 해당하는 규칙만 실행
+모든 조회는 AnswerText 연산으로 하므로 StreamingAnswerText(청크 단위 답변)에도 같은 규칙 적용
+오프라인 재평가처럼 답변이 많으면 evaluate_many로 질문별 답변 배열 단위 평가 (TextBatch, 결과는 동일)
+"""
+import bisect
+import functools
+import itertools
+import re
+
+import numpy as np
+
+from core.answer_text import AnswerText
+
+# 질문별 키워드 집합 (이름 → (TestCase에서 값을 꺼내는 함수, 대소문자 무시 여부))
+CASE_SETS = {
+    "$keywords": (lambda test_case: test_case.keywords_lower, True),
+    "$negative_keywords": (lambda test_case: test_case.negative_keywords_lower, True),
+    "$tone_keywords": (lambda test_case: _special(test_case).get("keywords", ()), False),
+    "$required_phrase": (lambda test_case: (_required_phrase(test_case),), False),
+}
+
+# 일괄 평가에서 배열로 평가하는 질문별 최소 답변 수 (더 적으면 답변별 평가가 빠름)
+BATCH_MIN_GROUP = 16
+
+# 특수 지시사항 세부 구분 필드 (format: bullet/table, phrase: start/end/any)
+SPECIAL_VARIANT_FIELDS = ("format", "position")
+
+
+def _special(test_case):
+    return test_case.special_instruction or {}
+
+
+def _required_phrase(test_case):
+    return _special(test_case).get("required_phrase", "")
+
+
+class RuleError(ValueError):
+    """평가 규칙 설정 오류"""
+
+
+class TextBatch:
+    """
+    일괄 평가용 답변 묶음 (답변 여러 개를 구분 문자로 이어 붙인 텍스트)
+
+    키워드/마커는 답변마다 검색하지 않고 이어 붙인 텍스트에서 한 번에 검색한 뒤,
+    매치 위치를 답변 시작 위치 배열로 답변 번호에 대응시킴
+    (구분 문자를 포함하거나 빈 문자열인 키워드는 답변별로 검색)
+    """
+
+    SEPARATOR = "\x00"
+
+    def __init__(self, texts):
+        """
+        Args:
+            texts (list): 답변 문자열 리스트
+        """
+        self.texts = texts
+        self.size = len(texts)
+        self.lengths = np.fromiter(map(len, texts), dtype=np.int64, count=self.size)
+        self._joined = {}  # 소문자 여부 → (답변 리스트, 이어 붙인 텍스트, 시작 위치 배열, 시작 위치 리스트)
+
+    def _joined_text(self, lowered):
+        if lowered not in self._joined:
+            texts = [text.lower() for text in self.texts] if lowered else self.texts
+            lengths = np.fromiter(map(len, texts), dtype=np.int64, count=self.size) if lowered else self.lengths
+            starts = np.zeros(self.size, dtype=np.int64)
+            np.cumsum(lengths[:-1] + len(self.SEPARATOR), out=starts[1:])
+            self._joined[lowered] = (texts, self.SEPARATOR.join(texts), starts, starts.tolist())
+        return self._joined[lowered]
+
+    def _is_literal(self, needles):
+        return all(needle and self.SEPARATOR not in needle for needle in needles)
+
+    def contains_any(self, needles, lowered=False):
+        """
+        답변별로 needles 중 하나라도 포함되는지 (lowered=True면 소문자로 바꾼 답변 기준)
+
+        Returns:
+            np.ndarray: bool 배열
+        """
+        texts, joined, _, starts = self._joined_text(lowered)
+        if not needles:
+            return np.zeros(self.size, dtype=bool)
+        if not self._is_literal(needles):
+            return np.fromiter((any(needle in text for needle in needles) for text in texts),
+                               dtype=bool, count=self.size)
+
+        # 매치가 나온 답변은 더 볼 필요 없으므로 다음 답변 시작 위치부터 다시 검색
+        flags = np.zeros(self.size, dtype=bool)
+        search = _literal_regex(needles).search
+        position = 0
+        while True:
+            match = search(joined, position)
+            if match is None:
+                break
+            index = bisect.bisect_right(starts, match.start()) - 1
+            flags[index] = True
+            if index + 1 >= self.size:
+                break
+            position = starts[index + 1]
+        return flags
+
+    def count(self, needle):
+        """
+        답변별 needle 출현 횟수 (겹치지 않게, str.count와 동일)
+
+        Returns:
+            np.ndarray: int64 배열
+        """
+        texts, joined, starts, _ = self._joined_text(False)
+        if not self._is_literal((needle,)):
+            return np.fromiter((text.count(needle) for text in texts), dtype=np.int64, count=self.size)
+
+        positions = np.fromiter((match.start() for match in _literal_regex((needle,)).finditer(joined)),
+                                dtype=np.int64)
+        return np.bincount(np.searchsorted(starts, positions, side="right") - 1, minlength=self.size)
+
+
+class LengthMeasure:
+    """답변 길이 (내용이 붙을수록 늘어남)"""
+
+    key = ("length",)
+
+    def __init__(self):
+        self.thresholds = set()
+
+    def value(self, answer, test_case):
+        return len(answer)
+
+    def values_many(self, batch, test_case):
+        return batch.lengths
+
+    def item(self, values, index):
+        return values[index].item()
+
+    def futures(self, value, answer, test_case):
+        return [value] + sorted(t for t in self.thresholds if t > value)
+
+    def fields(self, value):
+        return {}
+
+
+class CountMeasure(LengthMeasure):
+    """마커 출현 횟수 합계 (내용이 붙을수록 늘어남)"""
+
+    def __init__(self, name, needles):
+        super().__init__()
+        self.key = ("count", name)
+        self.needles = needles
+
+    def value(self, answer, test_case):
+        return sum(answer.count(needle) for needle in self.needles)
+
+    def values_many(self, batch, test_case):
+        return sum((batch.count(needle) for needle in self.needles), np.zeros(batch.size, dtype=np.int64))
+
+    def fields(self, value):
+        return {"count": value}
+
+
+class ContainsMeasure:
+    """키워드 집합 중 하나라도 포함 (한번 포함되면 유지됨)"""
+
+    def __init__(self, name, needles=None):
+        self.key = ("contains", name)
+        self.needles = needles
+        self.getter, self.lowered = CASE_SETS.get(name, (None, False))
+
+    def _needles(self, test_case):
+        return self.needles if self.getter is None else self.getter(test_case)
+
+    def value(self, answer, test_case):
+        contains = answer.contains_lowered if self.lowered else answer.contains
+        for needle in self._needles(test_case):
+            if contains(needle):
+                return True
+        return False
+
+    def values_many(self, batch, test_case):
+        return batch.contains_any(tuple(self._needles(test_case)), self.lowered)
+
+    def item(self, values, index):
+        return values[index].item()
+
+    def futures(self, value, answer, test_case):
+        if value:
+            return (True,)
+        return (False, True) if self._needles(test_case) else (False,)
+
+    def fields(self, value):
+        return {}
+
+
+class PatternMeasure:
+    """정규식 매치 존재 (한번 매치되면 유지됨)"""
+
+    def __init__(self, name, pattern):
+        self.key = ("matches", name)
+        self.pattern = pattern
+
+    def value(self, answer, test_case):
+        return answer.search(self.pattern)
+
+    def values_many(self, batch, test_case):
+        # 임의의 정규식은 구분 문자를 넘어 매치될 수 있으므로 답변별로 검색
+        search = self.pattern.search
+        return np.fromiter((search(text) is not None for text in batch.texts), dtype=bool, count=batch.size)
+
+    def item(self, values, index):
+        return values[index].item()
+
+    def futures(self, value, answer, test_case):
+        return (True,) if value else (False, True)
+
+    def fields(self, value):
+        return {}
+
+
+class RatioMeasure(ContainsMeasure):
+    """포함된 키워드 수 (포함 수, 전체 수) (포함 수는 늘어나기만 함)"""
+
+    def __init__(self, name, needles=None):
+        super().__init__(name, needles)
+        self.key = ("ratio", name)
+
+    def value(self, answer, test_case):
+        needles = self._needles(test_case)
+        contains = answer.contains_lowered if self.lowered else answer.contains
+        return sum(1 for needle in needles if contains(needle)), len(needles)
+
+    def values_many(self, batch, test_case):
+        needles = self._needles(test_case)
+        matched = np.zeros(batch.size, dtype=np.int64)
+        for needle in needles:
+            matched += batch.contains_any((needle,), self.lowered)
+        return matched, np.full(batch.size, len(needles), dtype=np.int64)
+
+    def item(self, values, index):
+        return values[0][index].item(), values[1][index].item()
+
+    def futures(self, value, answer, test_case):
+        matched, total = value
+        return [(count, total) for count in range(matched, total + 1)]
+
+    def fields(self, value):
+        return {"matched": value[0], "total": value[1]}
+
+
+class EdgeMeasure:
+    """앞뒤 공백을 제외한 답변이 문구로 시작/끝나는지"""
+
+    def __init__(self, position, phrase):
+        self.key = (position, phrase)
+        self.position = position
+        self.phrase = phrase
+
+    def _phrase(self, test_case):
+        return _required_phrase(test_case) if self.phrase == "$required_phrase" else self.phrase
+
+    def value(self, answer, test_case):
+        if self.position == "starts_with":
+            return answer.stripped_startswith(self._phrase(test_case))
+        return answer.stripped_endswith(self._phrase(test_case))
+
+    def values_many(self, batch, test_case):
+        phrase = self._phrase(test_case)
+        if self.position == "starts_with":
+            flags = (text.strip().startswith(phrase) for text in batch.texts)
+        else:
+            flags = (text.strip().endswith(phrase) for text in batch.texts)
+        return np.fromiter(flags, dtype=bool, count=batch.size)
+
+    def item(self, values, index):
+        return values[index].item()
+
+    def futures(self, value, answer, test_case):
+        # 시작 문구는 앞부분이 문구 길이만큼 수신되면 확정, 끝 문구는 내용이 붙을 때마다 바뀔 수 있음
+        if self.position == "starts_with" and answer.lstripped_length() >= len(self._phrase(test_case)):
+            return (value,)
+        return (False, True)
+
+    def fields(self, value):
+        return {}
+
+
+class Band:
+    """점수 구간 1개 (조건 함수 + 점수 + 코멘트)"""
+
+    __slots__ = ("test", "test_many", "score", "comment", "formatted")
+
+    def __init__(self, test, test_many, score, comment):
+        self.test = test
+        self.test_many = test_many
+        self.score = score
+        self.comment = comment
+        self.formatted = "{" in comment
+
+
+class CompiledRule:
+    """항목 1개 × 카테고리(특수 지시사항) 1개의 컴파일된 규칙"""
+
+    def __init__(self):
+        self.measures = []
+        self.bands = []
+        self.min_score = self.max_score = 0
+        self._index = {}
+
+    def measure(self, measure):
+        """조건이 사용하는 측정값 등록 (같은 측정값은 한 번만 계산) → 값 목록의 위치"""
+        if measure.key not in self._index:
+            self._index[measure.key] = len(self.measures)
+            self.measures.append(measure)
+        return self._index[measure.key]
+
+    def evaluate(self, answer, test_case):
+        """(점수, 코멘트)"""
+        values = [measure.value(answer, test_case) for measure in self.measures]
+        for band in self.bands:
+            if band.test(values):
+                break
+        if not band.formatted:
+            return band.score, band.comment
+        fields = {"phrase": _required_phrase(test_case)}
+        for measure, value in zip(self.measures, values):
+            fields.update(measure.fields(value))
+        return band.score, band.comment.format(**fields)
+
+    def evaluate_many(self, batch, test_case):
+        """
+        같은 질문의 답변 여러 개 일괄 평가 (측정값 배열 + 구간별 bool 마스크)
+
+        Returns:
+            tuple: (점수 리스트, 코멘트 리스트) (evaluate와 같은 결과)
+        """
+        arrays = [measure.values_many(batch, test_case) for measure in self.measures]
+        chosen = np.full(batch.size, len(self.bands) - 1, dtype=np.int64)
+        undecided = np.ones(batch.size, dtype=bool)
+        for index, band in enumerate(self.bands[:-1]):
+            hit = band.test_many(arrays) & undecided
+            chosen[hit] = index
+            undecided &= ~hit
+
+        chosen = chosen.tolist()
+        scores = [self.bands[index].score for index in chosen]
+        comments = [self.bands[index].comment for index in chosen]
+        for position, index in enumerate(chosen):
+            band = self.bands[index]
+            if band.formatted:
+                fields = {"phrase": _required_phrase(test_case)}
+                for measure, values in zip(self.measures, arrays):
+                    fields.update(measure.fields(measure.item(values, position)))
+                comments[position] = band.comment.format(**fields)
+        return scores, comments
+
+    def bounds(self, answer, test_case):
+        """
+        내용이 더 붙었을 때 가능한 (최소 점수, 최대 점수)
+
+        측정값별로 가능한 최종 값(키워드는 포함 여부 유지, 길이/횟수는 경계값까지 증가)을
+        모두 조합하여 도달 가능한 구간 점수 계산
+        """
+        values = [measure.value(answer, test_case) for measure in self.measures]
+        choices = [measure.futures(value, answer, test_case) for measure, value in zip(self.measures, values)]
+        low = high = None
+        for combination in itertools.product(*choices):
+            for band in self.bands:
+                if band.test(combination):
+                    break
+            if low is None or band.score < low:
+                low = band.score
+            if high is None or band.score > high:
+                high = band.score
+            if low == self.min_score and high == self.max_score:
+                break  # 전체 범위 (나머지 조합은 볼 필요 없음)
+        return low, high
+
+
+class RuleEngine:
+    """평가 규칙 컴파일 + 항목별 카테고리 규칙 조회"""
+
+    def __init__(self, rules):
+        """
+        Args:
+            rules (dict): evaluation_criteria.json의 rules 섹션
+
+        Raises:
+            RuleError: 알 수 없는 집합/패턴/조건 또는 기본 구간이 없는 규칙
+        """
+        self.keyword_sets = {name: tuple(needles) for name, needles in rules.get("keyword_sets", {}).items()}
+        try:
+            self.patterns = {name: re.compile(pattern) for name, pattern in rules.get("patterns", {}).items()}
+        except re.error as e:
+            raise RuleError(f"평가 규칙 정규식 오류: {e}") from e
+
+        # 항목 → {"special": {키: 규칙}, "categories": {카테고리: 규칙}, "default": 규칙}
+        self.tables = {}
+        for criterion, spec in rules.get("criteria", {}).items():
+            self.tables[criterion] = self._compile_table(criterion, spec)
+
+    @property
+    def criteria(self):
+        """규칙으로 평가하는 항목 목록"""
+        return tuple(self.tables)
+
+    def rule_for(self, criterion, test_case):
+        """질문에 적용할 규칙 (특수 지시사항 → 카테고리 → 기본값 순)"""
+        table = self.tables[criterion]
+        special = test_case.special_instruction
+        if special and table["special"]:
+            instruction_type = special.get("type")
+            for field in SPECIAL_VARIANT_FIELDS:
+                if special.get(field):
+                    rule = table["special"].get(f"{instruction_type}:{special[field]}")
+                    if rule is not None:
+                        return rule
+            rule = table["special"].get(instruction_type)
+            if rule is not None:
+                return rule
+        return table["categories"].get(test_case.category, table["default"])
+
+    def evaluate(self, criterion, test_case, answer):
+        """
+        항목 1개 평가
+
+        Args:
+            criterion (str): 항목명
+            test_case (TestCase): 질문 정보
+            answer (AnswerText): 답변
+
+        Returns:
+            tuple: (점수, 코멘트)
+        """
+        return self.rule_for(criterion, test_case).evaluate(answer, test_case)
+
+    def bounds(self, criterion, test_case, partial_answer):
+        """부분 답변에 내용이 더 붙었을 때 가능한 (최소 점수, 최대 점수)"""
+        return self.rule_for(criterion, test_case).bounds(partial_answer, test_case)
+
+    def evaluate_many(self, items, criteria=None):
+        """
+        여러 답변 일괄 평가 (오프라인 재평가용, 결과는 evaluate와 동일)
+
+        규칙에 영향을 주는 질문 정보(카테고리, 키워드, 특수 지시사항)가 같은 답변끼리 묶어
+        측정값(길이, 키워드 포함, 마커 개수 등)을 배열로 한 번에 계산하고 구간 판정도 배열로 수행
+
+        Args:
+            items (list): (TestCase, 답변 문자열) 리스트
+            criteria (callable): 질문 → 평가할 항목 목록 (None이면 규칙 항목 전체)
+
+        Returns:
+            list: 입력 순서대로의 {항목명: (점수, 코멘트)} 리스트
+        """
+        groups = {}
+        case_keys = {}  # 같은 TestCase 객체는 키를 한 번만 계산
+        for position, (test_case, _) in enumerate(items):
+            key = case_keys.get(id(test_case))
+            if key is None:
+                key = case_keys[id(test_case)] = self.case_key(test_case)
+            groups.setdefault(key, []).append(position)
+
+        results = [None] * len(items)
+        for positions in groups.values():
+            test_case = items[positions[0]][0]
+            names = criteria(test_case) if criteria else self.criteria
+            rules = [self.rule_for(criterion, test_case) for criterion in names]
+
+            if len(positions) < BATCH_MIN_GROUP:
+                # 답변 수가 적으면 배열 준비 비용이 더 커서 답변별로 평가
+                for position in positions:
+                    answer = AnswerText(items[position][1])
+                    results[position] = {criterion: rule.evaluate(answer, test_case)
+                                         for criterion, rule in zip(names, rules)}
+                continue
+
+            batch = TextBatch([items[position][1] for position in positions])
+            columns = [zip(*rule.evaluate_many(batch, test_case)) for rule in rules]
+            for position, *pairs in zip(positions, *columns):
+                results[position] = dict(zip(names, pairs))
+        return results
+
+    @staticmethod
+    def case_key(test_case):
+        """규칙 평가 결과에 영향을 주는 질문 정보 (같으면 같은 규칙·같은 질문별 키워드로 평가됨)"""
+        special = test_case.special_instruction
+        return (test_case.category, test_case.keywords_lower, test_case.negative_keywords_lower,
+                repr(sorted(special.items())) if special else None)
+
+    def streaming_needles(self, test_case):
+        """StreamingAnswerText에 미리 등록할 조회 대상 (질문에 적용되는 규칙이 사용하는 문자열/정규식)"""
+        needles = set()
+        count_needles = set()
+        patterns = set()
+        edge_phrases = []
+
+        for criterion in self.tables:
+            for measure in self.rule_for(criterion, test_case).measures:
+                if isinstance(measure, CountMeasure):
+                    count_needles.update(measure.needles)
+                elif isinstance(measure, PatternMeasure):
+                    patterns.add(measure.pattern)
+                elif isinstance(measure, EdgeMeasure):
+                    edge_phrases.append(measure._phrase(test_case))
+                elif isinstance(measure, ContainsMeasure) and not measure.lowered:
+                    needles.update(measure._needles(test_case))
+
+        return {
+            "needles": needles,
+            "ci_needles": test_case.ci_needles,
+            "count_needles": count_needles,
+            "patterns": patterns,
+            "edge_phrases": edge_phrases,
+        }
+
+    def _compile_table(self, criterion, spec):
+        special = {key: self._compile_rule(bands, f"{criterion}.special_instructions.{key}")
+                   for key, bands in spec.get("special_instructions", {}).items()}
+
+        raw_categories = spec.get("categories", {})
+        categories = {}
+        for category, bands in raw_categories.items():
+            if isinstance(bands, str):
+                if not isinstance(raw_categories.get(bands), list):
+                    raise RuleError(f"평가 규칙 오류 ({criterion}.categories.{category}): 알 수 없는 카테고리 '{bands}'")
+                bands = raw_categories[bands]
+            categories[category] = self._compile_rule(bands, f"{criterion}.categories.{category}")
+
+        if "default" not in spec:
+            raise RuleError(f"평가 규칙 오류 ({criterion}): default 규칙이 없습니다.")
+        return {"special": special, "categories": categories,
+                "default": self._compile_rule(spec["default"], f"{criterion}.default")}
+
+    def _compile_rule(self, bands, path):
+        if not bands or "when" in bands[-1]:
+            raise RuleError(f"평가 규칙 오류 ({path}): 마지막 구간은 조건 없는 기본값이어야 합니다.")
+
+        rule = CompiledRule()
+        for band in bands:
+            condition = band.get("when")
+            test, test_many = self._compile_condition(condition, rule, path) if condition else (_always, _always_many)
+            rule.bands.append(Band(test, test_many, band["score"], band["comment"]))
+        rule.min_score = min(band.score for band in rule.bands)
+        rule.max_score = max(band.score for band in rule.bands)
+        return rule
+
+    def _compile_condition(self, condition, rule, path):
+        """조건 → (값 목록 검사 함수, 값 배열 목록 검사 함수)"""
+        tests = []
+        for key, arg in condition.items():
+            if key in ("any", "all"):
+                subtests = [self._compile_condition(sub, rule, path) for sub in arg]
+                scalar_tests = [test for test, _ in subtests]
+                vector_tests = [test_many for _, test_many in subtests]
+                if key == "any":
+                    tests.append((
+                        lambda values, subtests=scalar_tests: any(test(values) for test in subtests),
+                        lambda arrays, subtests=vector_tests: np.logical_or.reduce([test(arrays) for test in subtests]),
+                    ))
+                else:
+                    tests.append((
+                        lambda values, subtests=scalar_tests: all(test(values) for test in subtests),
+                        lambda arrays, subtests=vector_tests: np.logical_and.reduce([test(arrays) for test in subtests]),
+                    ))
+            elif key == "length":
+                tests.append(_range_test(rule, rule.measure(LengthMeasure()), arg))
+            elif key in ("contains", "lacks"):
+                index = rule.measure(ContainsMeasure(arg, self._keyword_set(arg, path)))
+                if key == "contains":
+                    tests.append((lambda values, index=index: values[index],
+                                  lambda arrays, index=index: arrays[index]))
+                else:
+                    tests.append((lambda values, index=index: not values[index],
+                                  lambda arrays, index=index: ~arrays[index]))
+            elif key == "matches":
+                if arg not in self.patterns:
+                    raise RuleError(f"평가 규칙 오류 ({path}): 알 수 없는 패턴 '{arg}'")
+                index = rule.measure(PatternMeasure(arg, self.patterns[arg]))
+                tests.append((lambda values, index=index: values[index],
+                              lambda arrays, index=index: arrays[index]))
+            elif key == "count":
+                for name, bounds in arg.items():
+                    index = rule.measure(CountMeasure(name, self._keyword_set(name, path, case_sets=False)))
+                    tests.append(_range_test(rule, index, bounds))
+            elif key == "ratio":
+                for name, bounds in arg.items():
+                    index = rule.measure(RatioMeasure(name, self._keyword_set(name, path)))
+                    in_range = _range(*bounds)
+                    in_range_many = _range_many(*bounds)
+                    tests.append((
+                        lambda values, index=index, in_range=in_range:
+                            in_range(values[index][0] / values[index][1] if values[index][1] else 0),
+                        lambda arrays, index=index, in_range_many=in_range_many:
+                            in_range_many(_ratio_many(*arrays[index])),
+                    ))
+            elif key in ("starts_with", "ends_with"):
+                if arg.startswith("$") and arg != "$required_phrase":
+                    raise RuleError(f"평가 규칙 오류 ({path}): 알 수 없는 문구 '{arg}'")
+                index = rule.measure(EdgeMeasure(key, arg))
+                tests.append((lambda values, index=index: values[index],
+                              lambda arrays, index=index: arrays[index]))
+            else:
+                raise RuleError(f"평가 규칙 오류 ({path}): 알 수 없는 조건 '{key}'")
+
+        if len(tests) == 1:
+            return tests[0]
+        scalar_tests = [test for test, _ in tests]
+        vector_tests = [test_many for _, test_many in tests]
+        return (lambda values: all(test(values) for test in scalar_tests),
+                lambda arrays: np.logical_and.reduce([test(arrays) for test in vector_tests]))
+
+    def _keyword_set(self, name, path, case_sets=True):
+        if name in self.keyword_sets:
+            return self.keyword_sets[name]
+        if case_sets and name in CASE_SETS:
+            return None  # 질문별 값 (평가 시 TestCase에서 조회)
+        raise RuleError(f"평가 규칙 오류 ({path}): 알 수 없는 키워드 집합 '{name}'")
+
+
+def _always(values):
+    return True
+
+
+def _always_many(arrays):
+    return True
+
+
+def _range(low, high):
+    """[최소, 최대] (양 끝 포함, None이면 제한 없음) 비교 함수"""
+    if low is None and high is None:
+        return lambda x: True
+    if low is None:
+        return lambda x: x <= high
+    if high is None:
+        return lambda x: x >= low
+    return lambda x: low <= x <= high
+
+
+def _range_many(low, high):
+    """_range의 배열 버전 (bool 배열 반환)"""
+    def in_range(array):
+        mask = np.ones(len(array), dtype=bool)
+        if low is not None:
+            mask &= array >= low
+        if high is not None:
+            mask &= array <= high
+        return mask
+    return in_range
+
+
+def _ratio_many(matched, total):
+    """포함 수 / 전체 수 (전체 수가 0이면 0, 스칼라 평가와 같은 float64 나눗셈)"""
+    return np.divide(matched, total, out=np.zeros(len(matched)), where=total > 0)
+
+
+def _range_test(rule, index, bounds):
+    """길이/횟수 구간 조건 (점수 범위 계산용 경계값도 등록)"""
+    low, high = bounds
+    measure = rule.measures[index]
+    if low is not None:
+        measure.thresholds.add(low)
+    if high is not None:
+        measure.thresholds.add(high + 1)
+    in_range = _range(low, high)
+    in_range_many = _range_many(low, high)
+    return (lambda values: in_range(values[index]),
+            lambda arrays: in_range_many(arrays[index]))
+
+
+@functools.lru_cache(maxsize=4096)
+def _literal_regex(needles):
+    """키워드 튜플 → 하나라도 매치되는 정규식 (리터럴 대안 패턴)"""
+    return re.compile("|".join(re.escape(needle) for needle in needles))
@@ -0,0 +1,756 @@
+"""
+테스트 실행 모듈 (pytest 없이 같은 프로세스에서 실행)
+
+SuiteRunner: 세션/API 클라이언트/평가기를 한 번 초기화하고 질문 1건씩 실행
+    - tests/test_main.py(pytest)와 run_suite()가 같은 실행 로직을 사용
+run_suite(): 질문 선택(샘플링) → 실행 순서(LPT) → 실행 → 리포트 생성까지 한 번에 수행하고 RunResult 반환
+    - 이미 초기화된 SuiteRunner를 넘기면 모델/세션을 다시 로드하지 않음 (스케줄러에서 반복 실행)
+
+실행:
+    python -m core.runner [--sample 0.2] [--profile]
+"""
+import argparse
+import contextlib
+import json
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+from core.answer_store import AnswerStore
+from core.api_client import APIClient
+from core.circuit_breaker import CircuitBreaker
+from core.embedding_cache import EmbeddingCache
+from core.evaluator import Evaluator
+from core.hedge_budget import HedgeBudget
+from core.judge import Judge
+from core.results import TestResult
+from core.session_manager import SessionManager
+from core.test_suite import load_suite
+from reports.answer_archive import ARCHIVE_FILE, save_answer_archive
+from reports.report_generator import generate_excel_report, save_detailed_answers_csv
+from utils.consistency import calculate_consistency, print_consistency
+from utils.logger import setup_logger, log_test_start, log_test_result, log_test_error
+from utils.profiling import RunProfiler
+from utils.progress import MetricsServer, ProgressTracker, format_status_line, write_metrics_file
+from utils.result_store import ResultStore
+from utils.run_history import RunHistory, adaptive_timeout, hedge_delay
+from utils.sampling import estimate_pass_rates, parse_sample_option, print_sampling, stratified_sample
+from utils.scheduling import order_jobs
+from utils.scoring import calculate_statistics, print_statistics, calculate_category_statistics, print_category_statistics
+from utils.sequential import SequentialRounds, summarize_sequential
+
+# 설정
+BASE_API_V1 = "https://api.myalan.ai/api/v1"
+BASE_API_V2 = "https://api.myalan.ai/api/v2"
+PERSONA_ID = "67a8266697ac2b9de6c51edf"
+COOKIE_FILE = "cookies.json"
+QUESTIONS_FILE = "config/test_questions.json"
+CRITERIA_FILE = "config/evaluation_criteria.json"
+EMBEDDING_CACHE_FILE = "output/embedding_cache.npz"
+
+
+class LoginError(RuntimeError):
+    """쿠키 로그인 실패"""
+
+
+class CaseOutcome:
+    """질문 1건 실행 결과"""
+
+    __slots__ = ("test_id", "round", "category", "status", "reason", "result", "latency", "attempted")
+
+    def __init__(self, test_id, round, category, status, reason=None, result=None, latency=None, attempted=False):
+        """
+        Args:
+            status (str): "passed" / "failed"(평가 FAIL) / "error"(API 오류, 서킷 열림 fail 모드) / "skipped"
+            reason (str): 건너뛰거나 오류가 난 이유
+            result (TestResult): 평가까지 끝난 결과 (passed/failed일 때)
+            latency (float): 답변 수신 시간(초)
+            attempted (bool): API를 호출했는지 (실행 이력 기록 대상)
+        """
+        self.test_id = test_id
+        self.round = round
+        self.category = category
+        self.status = status
+        self.reason = reason
+        self.result = result
+        self.latency = latency
+        self.attempted = attempted
+
+    def __repr__(self):
+        return f"CaseOutcome({self.test_id!r}, round={self.round}, status={self.status!r})"
+
+
+class SuiteRunner:
+    """세션/API 클라이언트/평가기를 공유하는 질문 실행기"""
+
+    def __init__(self, suite, answer_store=None, history_snapshot=None, profile_phase=None,
+                 cookie_file=COOKIE_FILE, criteria_file=CRITERIA_FILE):
+        """
+        Args:
+            suite (TestSuite): 테스트 스위트 (settings 포함)
+            answer_store (AnswerStore): 답변/평가 메모 저장소 (None이면 미사용)
+            history_snapshot (HistorySnapshot): 실행 이력 (답변 대기 시간/헤지 기준, None이면 기본값)
+            profile_phase (callable): 단계 이름 → 컨텍스트 매니저 (프로파일링, None이면 측정 안 함)
+            cookie_file (str): 쿠키 파일
+            criteria_file (str): 평가 기준 설정 파일
+
+        Raises:
+            LoginError: 로그인 실패
+        """
+        print("\n" + "="*80)
+        print("🤖 LLM 답변 평가 자동화 테스트 시작")
+        print("="*80)
+
+        self.suite = suite
+        self.settings = suite.settings
+        self.history_snapshot = history_snapshot
+        self.profile_phase = profile_phase or (lambda name: contextlib.nullcontext())
+
+        # 로거 설정 (큐 모드: 로그 기록은 백그라운드 스레드에서)
+        logging_settings = self.settings.get("logging", {})
+        self.logger = setup_logger(
+            queue_mode=logging_settings.get("queue", False),
+            json_lines=logging_settings.get("json_lines", False)
+        )
+        self.logger.info("테스트 시스템 초기화 중...")
+
+        self.test_cases = suite.test_cases
+        self.repeat_count = self.settings["repeat_count"]
+        self.delay_between_tests = self.settings["delay_between_tests"]
+        self.delay_between_rounds = self.settings.get("delay_between_rounds", 5)
+        self.early_termination = self.settings.get("early_termination", {})
+        self.timeout_settings = self.settings.get("adaptive_timeout", {})
+        self.hedging = self.settings.get("hedging", {})
+
+        # 반복 라운드 조기 판정 (판정이 확정된 질문은 남은 라운드 생략, 경계 질문은 추가 라운드)
+        self.sequential = SequentialRounds(self.settings.get("sequential", {}), self.repeat_count)
+
+        self.logger.info(f"테스트 케이스 수: {len(self.test_cases)}개")
+        self.logger.info(f"반복 횟수: {self.repeat_count}회")
+
+        # 예상 소요 시간 계산
+        if isinstance(self.delay_between_tests, list):
+            avg_delay = sum(self.delay_between_tests) / 2
+        else:
+            avg_delay = self.delay_between_tests
+
+        total_time = (len(self.test_cases) - 1) * avg_delay * self.repeat_count + self.delay_between_rounds * (self.repeat_count - 1)
+        self.logger.info(f"예상 소요 시간: 약 {int(total_time / 60)}분")
+
+        # 세션 매니저 초기화
+        self.session_manager = SessionManager(cookie_file)
+        self.session_manager.load_session()
+
+        # 로그인 확인
+        success, user_name = self.session_manager.check_login(BASE_API_V2)
+        if not success:
+            self.logger.error("❌ 로그인 실패. cookies.json을 확인하세요.")
+            raise LoginError("로그인 실패")
+
+        self.logger.info(f"✅ 로그인 성공: {user_name} (ID: {self.session_manager.get_user_id()})")
+
+        # 서킷 브레이커 초기화 (전체 테스트 공유)
+        breaker_settings = self.settings.get("circuit_breaker", {})
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=breaker_settings.get("failure_threshold", 5),
+            probe_interval=breaker_settings.get("probe_interval", 60)
+        )
+        self.breaker_action = breaker_settings.get("on_open", "skip")
+
+        # 헤지 요청 예산 (답변이 늦은 질문의 중복 요청 수 제한, 전체 테스트 공유)
+        hedge_budget = None
+        if self.hedging.get("enabled", False):
+            hedge_budget = HedgeBudget(
+                max_ratio=self.hedging.get("max_ratio", 0.1),
+                per_minute=self.hedging.get("per_minute", 2)
+            )
+
+        # API 클라이언트 초기화
+        self.api_client = APIClient(
+            session=self.session_manager.session,
+            base_api_v1=BASE_API_V1,
+            base_api_v2=BASE_API_V2,
+            persona_id=PERSONA_ID,
+            user_id=self.session_manager.get_user_id(),
+            circuit_breaker=self.circuit_breaker,
+            hedge_budget=hedge_budget
+        )
+
+        # LLM 심사 채점기 (OpenAI 호환 API, 실행 1회 비용 예산)
+        judge_settings = self.settings.get("judge", {})
+        judge = Judge.from_settings(judge_settings) if judge_settings.get("enabled", False) else None
+
+        # 평가자 초기화 (답변 저장소가 켜져 있으면 같은 답변의 평가 결과 재사용, 골든 답변이 있으면 골든 유사도 평가,
+        # 평가 서버가 실행 중이면 모델을 로드하지 않고 서버 임베딩 사용)
+        reference_settings = self.settings.get("reference", {})
+        reference_enabled = reference_settings.get("enabled", False)
+        server_settings = self.settings.get("eval_server", {})
+        self.evaluator = Evaluator(
+            criteria_file,
+            answer_store=answer_store,
+            golden_answers_file=reference_settings.get("golden_file") if reference_enabled else None,
+            reference_index_file=reference_settings.get("index_file"),
+            eval_server=(server_settings.get("address") or True) if server_settings.get("enabled", False) else None,
+            judge=judge
+        )
+
+        self.logger.info("✅ 테스트 시스템 초기화 완료\n")
+
+    def run_case(self, test_case, round_num):
+        """
+        질문 1건 실행 (질문 전송 → 답변 수신 → 평가)
+
+        Args:
+            test_case (TestCase): 질문
+            round_num (int): 라운드 번호
+
+        Returns:
+            CaseOutcome: 실행 결과 (평가까지 끝나면 result에 TestResult)
+        """
+        def outcome(status, **kwargs):
+            return CaseOutcome(test_case.id, round_num, test_case.category, status, **kwargs)
+
+        # 이전 라운드로 판정이 확정된 질문은 건너뜀 (추가 라운드는 판정되지 않은 질문만)
+        should_run, skip_reason = self.sequential.should_run(test_case.id, round_num)
+        if not should_run:
+            return outcome("skipped", reason=skip_reason)
+
+        # API 장애로 서킷이 열려 있으면 호출 없이 즉시 건너뜀/실패
+        if self.circuit_breaker.is_open():
+            reason = self.circuit_breaker.describe()
+            log_test_error(self.logger, test_case['id'], reason)
+            return outcome("error" if self.breaker_action == "fail" else "skipped", reason=reason)
+
+        # 로그 시작
+        log_test_start(self.logger, test_case['id'], test_case['question'], round_num)
+
+        # 생성 중인 답변을 수신하는 동안 평가 상태를 갱신
+        # 조기 종료 모드에서는 평가가 확정되면 대기 중단
+        incremental = self.evaluator.start_incremental(test_case)
+        early_termination_enabled = self.early_termination.get("enabled", False)
+        mode = self.early_termination.get("mode", "score")
+
+        def on_partial_answer(content):
+            incremental.update(content)
+            return early_termination_enabled and incremental.is_decided(mode)
+
+        # 답변 대기 시간 (이력상 답변 수신 시간 분위수 기준, 멈춘 요청은 빨리 재시도)
+        # 이력 기준 대기 시간이 지나도 답변이 계속 생성되고 있으면 max_timeout까지 기다림 (기본값이면 기존처럼 고정)
+        timeout, max_timeout, timeout_source = adaptive_timeout(self.history_snapshot, test_case, self.timeout_settings)
+        self.logger.info(f"⏲️ 답변 대기 시간: {timeout:.0f}초 ({timeout_source})")
+
+        # 1. 채널 생성 및 질문 전송
+        with self.profile_phase("api_wait"):
+            success, answer, error_msg = self.api_client.execute_test(
+                test_case['question'],
+                early_stop=on_partial_answer,
+                timeout=timeout,
+                max_timeout=max_timeout,
+                hedge_after=hedge_delay(self.history_snapshot, test_case, self.hedging)
+            )
+        latency = self.api_client.last_execution.get("latency")
+
+        if not success:
+            log_test_error(self.logger, test_case['id'], error_msg)
+            return outcome("error", reason=error_msg, latency=latency, attempted=True)
+
+        if self.api_client.last_execution.get("hedge_won"):
+            self.logger.info("🔀 헤지 요청(새 채널)의 답변이 먼저 완료되어 채택")
+
+        answer_complete = self.api_client.last_execution.get("complete", True)
+        if answer_complete:
+            self.logger.info(f"💬 답변 수신 완료 ({len(answer)}자)")
+        else:
+            self.logger.info(f"⚡ 평가 확정으로 답변 대기 조기 종료 ({len(answer)}자 수신)")
+
+        # 2. 답변 평가 (수신 중 누적한 상태로 마무리)
+        with self.profile_phase("evaluation"):
+            incremental.update(answer)
+            evaluation = incremental.finish()
+
+        # 로그 결과
+        log_test_result(self.logger, test_case['id'], evaluation, len(answer))
+        self.sequential.record(test_case.id, evaluation.passed)
+
+        # 3. 결과 생성
+        result = TestResult(
+            test_id=test_case.id,
+            round=round_num,
+            question=test_case.question,
+            category=test_case.category,
+            answer=answer,
+            evaluation=evaluation,
+            timestamp=datetime.now().isoformat(),
+            channel_id=self.api_client.last_execution.get("channel_id"),
+            answer_complete=answer_complete,
+            extra={
+                # 헤지 요청으로 늘어난 API 부하 확인용
+                "hedged": self.api_client.last_execution.get("hedged", False),
+                "hedge_won": self.api_client.last_execution.get("hedge_won", False)
+            }
+        )
+        return outcome("passed" if evaluation.passed else "failed", result=result, latency=latency, attempted=True)
+
+    def wait_between_tests(self):
+        """다음 테스트 전 대기 (리스트면 랜덤, 숫자면 그대로)"""
+        if not self.delay_between_tests:
+            return
+
+        if isinstance(self.delay_between_tests, list):
+            delay = random.randint(self.delay_between_tests[0], self.delay_between_tests[1])
+        else:
+            delay = self.delay_between_tests
+
+        self.logger.info(f"⏳ 다음 테스트까지 {delay}초 대기...\n")
+        time.sleep(delay)
+
+    def complete_early_terminated_answers(self, results):
+        """
+        조기 종료로 부분만 수신한 답변의 전체 원문을 채워 넣음
+
+        Args:
+            results (list): 이 실행기로 얻은 TestResult 리스트
+
+        Returns:
+            list: 갱신된 TestResult 리스트 (결과 저장소에 다시 기록할 대상)
+        """
+        pending = [r for r in results if not r.answer_complete]
+        if not pending or not self.early_termination.get("fetch_full_answers", True):
+            return []
+
+        self.logger.info(f"📥 조기 종료된 답변 {len(pending)}개의 전체 원문 조회 중...")
+
+        updated = []
+        for result in pending:
+            full_answer = self.api_client.fetch_complete_answer(result.channel_id)
+            if not full_answer:
+                self.logger.warning(f"⚠️ {result.test_id} 전체 원문 조회 실패 (부분 답변 유지)")
+                continue
+
+            result.answer = full_answer
+            result.answer_complete = True
+
+            # 전체 답변으로 다시 평가 (verdict 모드 점수, 골든 유사도/LLM 심사는 부분 답변 기준이었음)
+            result.evaluation = self.evaluator.evaluate_answer(self.suite.get(result.test_id), full_answer)
+
+            updated.append(result)
+        return updated
+
+    def log_answer_reuse(self):
+        """동일 답변 평가 재사용 건수 (LLM 심사를 켰으면 심사 요청/비용도) 출력"""
+        answer_store = self.evaluator.answer_store
+        if answer_store is not None and answer_store.hits:
+            self.logger.info(f"♻️ 동일 답변 평가 재사용: {answer_store.hits}건 (신규 평가 {answer_store.misses}건)")
+
+        if self.evaluator.judge is not None:
+            stats = self.evaluator.judge.stats()
+            self.logger.info(f"⚖️ LLM 심사: 채점 {stats['judged']}건 (저장된 결과 {stats['cache_hits']}건), "
+                             f"요청 {stats['requests']}건, 실패 {stats['failed']}건, 예산 초과 {stats['skipped']}건, "
+                             f"토큰 {stats['prompt_tokens'] + stats['completion_tokens']}개, 비용 {stats['cost']:.4f}")
+
+
+def plan_jobs(suite, test_cases, history_snapshot=None):
+    """
+    실행할 (라운드, 질문) 목록과 순서
+
+    Args:
+        suite (TestSuite): 테스트 스위트
+        test_cases (list): 실행할 질문 (샘플링 적용 후)
+        history_snapshot (HistorySnapshot): 실행 이력 (scheduling.strategy "lpt"일 때 순서 결정)
+
+    Returns:
+        list: (라운드, TestCase) 리스트 (조기 판정 모드면 max_rounds까지 포함)
+    """
+    settings = suite.settings
+    round_count = settings["repeat_count"]
+    sequential = settings.get("sequential", {})
+    if sequential.get("enabled", False):
+        round_count = max(round_count, sequential.get("max_rounds", round_count))
+
+    jobs = [(round_num, test_case) for round_num in range(1, round_count + 1) for test_case in test_cases]
+    scheduling = settings.get("scheduling", {})
+    if scheduling.get("strategy", "nodeid") != "lpt" or history_snapshot is None:
+        return jobs
+
+    order = order_jobs(jobs, history_snapshot, scheduling.get("default_duration", 60),
+                       round_major=sequential.get("enabled", False))
+    return [jobs[index] for index, _ in order]
+
+
+def select_sample(suite, sampling):
+    """층화 샘플링 설정에 따라 실행할 질문 선택 (샘플링 모드가 아니면 전체)"""
+    if not sampling.get("enabled", False):
+        return list(suite.test_cases)
+    return stratified_sample(
+        suite.test_cases,
+        fraction=sampling.get("fraction", 0.2),
+        budget=sampling.get("budget"),
+        repeat_count=suite.settings["repeat_count"],
+        seed=sampling["seed"],
+        min_per_category=sampling.get("min_per_category", 1)
+    )
+
+
+def calculate_run_consistency(results, settings, embedding_cache=None):
+    """
+    라운드 간 답변 일관성 계산 (반복 답변이 없거나 설정에서 끈 경우 None)
+
+    Args:
+        results (list): TestResult 리스트
+        settings (dict): 테스트 설정
+        embedding_cache (EmbeddingCache): 평가기와 공유할 임베딩 캐시 (None이면 평가 서버 또는 새 모델로 생성)
+    """
+    consistency_settings = settings.get("consistency", {})
+    if not consistency_settings.get("enabled", True) or not any(r.round > 1 for r in results):
+        return None
+
+    outlier_z = consistency_settings.get("outlier_z", 2.0)
+    if embedding_cache is not None:
+        # 실행기의 평가기 캐시 재사용 (모델을 다시 로드하지 않고, 캐시 파일은 소유자가 관리)
+        return calculate_consistency(results, embedding_cache, outlier_z)
+
+    from sentence_transformers import SentenceTransformer
+    from core.evaluator import MODEL_NAME, remote_embedding_model
+
+    # 평가 서버가 실행 중이면 서버 임베딩 사용 (캐시 파일은 서버가 관리)
+    server_settings = settings.get("eval_server", {})
+    model = remote_embedding_model(server_settings.get("address")) if server_settings.get("enabled", False) else None
+    if model is not None:
+        embedding_cache = EmbeddingCache(model, model_name=MODEL_NAME)
+    else:
+        embedding_cache = EmbeddingCache(SentenceTransformer(MODEL_NAME), EMBEDDING_CACHE_FILE, model_name=MODEL_NAME)
+    consistency = calculate_consistency(results, embedding_cache, outlier_z)
+    embedding_cache.save()
+    return consistency
+
+
+def estimate_sampling(results, suite, sampling, output_dir):
+    """샘플링 실행 정보 + 통과율 추정 (sampling.json 저장, 샘플링 모드가 아니면 None)"""
+    if not sampling.get("enabled", False):
+        return None
+
+    population = {}
+    for test_case in suite:
+        population[test_case.category] = population.get(test_case.category, 0) + 1
+
+    if sampling.get("budget") is not None:
+        mode = f"호출 {sampling['budget']}회"
+    else:
+        mode = f"비율 {sampling.get('fraction', 0.2) * 100:g}%"
+
+    summary = {
+        "mode": mode,
+        "seed": sampling["seed"],
+        "sampled": len({r.test_id for r in results}),
+        "population": len(suite),
+        "test_ids": sorted({r.test_id for r in results}),
+        "estimate": estimate_pass_rates(results, population),
+    }
+    with open(f"{output_dir}/sampling.json", "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return summary
+
+
+def write_reports(results, output_dir, settings, consistency=None, sampling=None, answer_store=None):
+    """
+    리포트 생성 및 통계 출력 (Excel/CSV/Parquet, 통계, 일관성, 샘플링 추정, 조기 판정, 헤지)
+
+    Returns:
+        dict: 전체 통계 (calculate_statistics)
+    """
+    logger = logging.getLogger("llm_test")
+
+    # Excel 리포트 생성
+    generate_excel_report(results, f"{output_dir}/test_results.xlsx", consistency, sampling)
+    logger.info(f"✅ Excel 리포트 생성: {output_dir}/test_results.xlsx")
+
+    # 상세 답변 CSV 저장
+    save_detailed_answers_csv(results, f"{output_dir}/detailed_answers.csv")
+    logger.info(f"✅ 상세 답변 CSV 저장: {output_dir}/detailed_answers.csv")
+
+    # 답변 아카이브 (Parquet, pyarrow 설치 시)
+    if save_answer_archive(results, f"{output_dir}/{ARCHIVE_FILE}"):
+        logger.info(f"✅ 답변 아카이브 저장: {output_dir}/{ARCHIVE_FILE}")
+
+    # 통계 출력
+    stats = calculate_statistics(results)
+    print_statistics(stats)
+
+    # 카테고리별 통계
+    category_stats = calculate_category_statistics(results)
+    print_category_statistics(category_stats)
+
+    if consistency:
+        print_consistency(consistency)
+
+    if sampling:
+        print_sampling(sampling)
+
+    if answer_store is not None:
+        store_stats = answer_store.stats()
+        logger.info(f"🗂️ 답변 저장소: 답변 {store_stats['answers']}개, 평가 메모 {store_stats['evaluations']}개")
+
+    sequential_settings = settings.get("sequential", {})
+    if sequential_settings.get("enabled", False):
+        summary = summarize_sequential(results, sequential_settings, settings["repeat_count"])
+        verdicts = summary["verdicts"]
+        logger.info(f"🎯 조기 판정: PASS 확정 {verdicts['pass']}개, FAIL 확정 {verdicts['fail']}개, "
+                    f"미확정 {verdicts[None]}개 (실행 {summary['rounds_run']}회 / 기본 {summary['rounds_planned']}회)")
+        if summary["undecided"]:
+            logger.info(f"   미확정(경계) 질문: {', '.join(summary['undecided'])}")
+
+    hedged = [r for r in results if r.get("hedged")]
+    if hedged:
+        won = sum(1 for r in hedged if r.get("hedge_won"))
+        logger.info(f"🔀 헤지 요청: {len(hedged)}건 / 전체 {len(results)}건 (헤지 답변 채택 {won}건)")
+
+    return stats
+
+
+class RunConfig:
+    """run_suite 실행 설정"""
+
+    def __init__(self, questions_file=QUESTIONS_FILE, criteria_file=CRITERIA_FILE, cookie_file=COOKIE_FILE,
+                 output_dir=None, test_ids=None, sample=None, sample_seed=None, profile=False, reports=True):
+        """
+        Args:
+            questions_file (str): 테스트 질문 설정 파일
+            criteria_file (str): 평가 기준 설정 파일
+            cookie_file (str): 쿠키 파일
+            output_dir (str): 결과 저장 폴더 (None이면 output/[타임스탬프])
+            test_ids (list): 실행할 질문 ID (None이면 전체)
+            sample (str or float): 층화 샘플 크기 (비율 또는 호출 수, settings.sampling보다 우선)
+            sample_seed (int): 샘플링 시드 (None이면 설정값 또는 무작위)
+            profile (bool): 단계별 프로파일링 (output_dir/profile)
+            reports (bool): Excel/CSV 리포트 생성 여부
+        """
+        self.questions_file = questions_file
+        self.criteria_file = criteria_file
+        self.cookie_file = cookie_file
+        self.output_dir = output_dir
+        self.test_ids = test_ids
+        self.sample = sample
+        self.sample_seed = sample_seed
+        self.profile = profile
+        self.reports = reports
+
+
+class RunResult:
+    """run_suite 실행 결과"""
+
+    def __init__(self, output_dir, results, outcomes, stats, consistency, sampling, elapsed):
+        """
+        Args:
+            output_dir (str): 결과 저장 폴더
+            results (list): 평가까지 끝난 TestResult 리스트
+            outcomes (list): 실행한 모든 (라운드, 질문)의 CaseOutcome 리스트 (건너뜀/오류 포함)
+            stats (dict): 전체 통계 (calculate_statistics)
+            consistency (dict): 라운드 간 일관성 (없으면 None)
+            sampling (dict): 샘플링 추정 (샘플링 모드가 아니면 None)
+            elapsed (float): 실행 시간(초)
+        """
+        self.output_dir = output_dir
+        self.results = results
+        self.outcomes = outcomes
+        self.stats = stats
+        self.consistency = consistency
+        self.sampling = sampling
+        self.elapsed = elapsed
+
+    def count(self, status):
+        """상태별 실행 수 ("passed" / "failed" / "error" / "skipped")"""
+        return sum(1 for outcome in self.outcomes if outcome.status == status)
+
+    @property
+    def exit_code(self):
+        """pytest와 같은 종료 코드 (모두 통과 0, 실패/오류 있음 1, 실행한 결과 없음 5)"""
+        if not self.results and not self.count("error"):
+            return 5
+        return 1 if self.count("failed") or self.count("error") else 0
+
+    def __repr__(self):
+        return (f"RunResult({self.output_dir!r}, passed={self.count('passed')}, failed={self.count('failed')}, "
+                f"error={self.count('error')}, skipped={self.count('skipped')})")
+
+
+def run_suite(config=None, runner=None):
+    """
+    테스트 실행 (pytest 없이 같은 프로세스에서)
+
+    Args:
+        config (RunConfig): 실행 설정 (None이면 기본값)
+        runner (SuiteRunner): 초기화된 실행기 (넘기면 세션/모델을 다시 로드하지 않음)
+
+    Returns:
+        RunResult: 실행 결과
+
+    Raises:
+        LoginError: 로그인 실패
+    """
+    config = config or RunConfig()
+    start = time.time()
+
+    suite = load_suite(config.questions_file)
+    settings = suite.settings
+    output_dir = config.output_dir or f"output/{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    run_id = os.path.basename(output_dir)
+
+    profiler = None
+    if config.profile:
+        profiler = RunProfiler()
+        profiler.start()
+    profile_phase = profiler.phase if profiler is not None else (lambda name: contextlib.nullcontext())
+
+    with profile_phase("collection"):
+        # 실행 이력 (질문별 소요 시간/답변 지연, 이번 실행 시작 전 기록만 사용)
+        history_settings = settings.get("run_history", {})
+        history = None
+        history_snapshot = None
+        if history_settings.get("enabled", False):
+            history = RunHistory(history_settings.get("file", "output/run_history.sqlite"))
+            history_snapshot = history.snapshot(start, history_settings.get("window", 20))
+
+        # 층화 샘플링 (config.sample이 설정 파일보다 우선)
+        sampling = dict(settings.get("sampling", {}))
+        if config.sample:
+            sampling.update(parse_sample_option(config.sample), enabled=True)
+        if config.sample_seed is not None:
+            sampling["seed"] = config.sample_seed
+        elif sampling.get("seed") is None:
+            sampling["seed"] = random.randrange(1_000_000)
+
+        test_cases = select_sample(suite, sampling)
+        if config.test_ids:
+            test_ids = set(config.test_ids)
+            test_cases = [tc for tc in test_cases if tc.id in test_ids]
+        jobs = plan_jobs(suite, test_cases, history_snapshot)
+
+    answer_store = None
+    if runner is not None:
+        answer_store = runner.evaluator.answer_store
+        runner.history_snapshot = history_snapshot
+        runner.profile_phase = profile_phase
+        runner.sequential = SequentialRounds(settings.get("sequential", {}), settings["repeat_count"])
+    else:
+        answer_store_settings = settings.get("answer_store", {})
+        if answer_store_settings.get("enabled", False):
+            answer_store = AnswerStore(answer_store_settings.get("file", "output/answer_store.sqlite"))
+        with profile_phase("session_load"):
+            runner = SuiteRunner(suite, answer_store, history_snapshot, profile_phase,
+                                 cookie_file=config.cookie_file, criteria_file=config.criteria_file)
+
+    store = ResultStore(os.path.join(output_dir, ".results"), "main", answer_store)
+
+    # 진행 상황 (상태 줄 + Prometheus 메트릭)
+    progress_settings = settings.get("progress", {})
+    progress = None
+    metrics_server = None
+    if progress_settings.get("enabled", False):
+        default_duration = settings.get("scheduling", {}).get("default_duration", 60)
+        progress = ProgressTracker(run_id)
+        progress.set_jobs({
+            (round_num, tc.id): (history_snapshot.expected_duration(tc.id, tc.category, default_duration)
+                                 if history_snapshot is not None else default_duration)
+            for round_num, tc in jobs
+        })
+        if progress_settings.get("http_port") is not None:
+            metrics_server = MetricsServer(progress, progress_settings["http_port"])
+    last_status = 0.0
+
+    outcomes = []
+    results = []
+    try:
+        for round_num, test_case in jobs:
+            started = time.time()
+            outcome = runner.run_case(test_case, round_num)
+            duration = time.time() - started  # 다음 테스트 전 대기 제외
+            if outcome.result is not None:
+                store.record(outcome.result)
+                results.append(outcome.result)
+                runner.wait_between_tests()
+            outcomes.append(outcome)
+
+            if history is not None and outcome.attempted:
+                history.record(
+                    run_id=run_id,
+                    test_id=test_case.id,
+                    category=test_case.category,
+                    round=round_num,
+                    outcome="passed" if outcome.status == "passed" else "failed",
+                    duration=duration,
+                    latency=outcome.latency
+                )
+
+            if progress is not None:
+                progress.record((round_num, test_case.id), outcome.status, started, outcome.latency)
+                snapshot = progress.snapshot()
+                if progress_settings.get("metrics_file"):
+                    write_metrics_file(snapshot, progress_settings["metrics_file"])
+                if time.monotonic() - last_status >= progress_settings.get("interval", 30):
+                    last_status = time.monotonic()
+                    runner.logger.info(format_status_line(snapshot))
+
+        for result in runner.complete_early_terminated_answers(results):
+            store.record(result)
+        runner.log_answer_reuse()
+    finally:
+        store.close()
+        if history is not None:
+            history.close()
+        if metrics_server is not None:
+            metrics_server.close()
+
+    stats = calculate_statistics(results)
+    consistency = None
+    sampling_summary = None
+    if results and config.reports:
+        with profile_phase("report"):
+            results = store.load_all()
+            consistency = calculate_run_consistency(results, settings, runner.evaluator.embedding_cache)
+            sampling_summary = estimate_sampling(results, suite, sampling, output_dir)
+            stats = write_reports(results, output_dir, settings, consistency, sampling_summary, answer_store)
+
+    if profiler is not None:
+        runner.logger.info(f"🔬 프로파일 저장: {profiler.stop(os.path.join(output_dir, 'profile'))}")
+
+    return RunResult(output_dir, results, outcomes, stats, consistency, sampling_summary, time.time() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LLM 답변 평가 테스트 실행 (pytest 없이 같은 프로세스에서)")
+    parser.add_argument("--questions", default=QUESTIONS_FILE, help="테스트 질문 설정 파일")
+    parser.add_argument("--criteria", default=CRITERIA_FILE, help="평가 기준 설정 파일")
+    parser.add_argument("--cookies", default=COOKIE_FILE, help="쿠키 파일")
+    parser.add_argument("--output-dir", default=None, help="결과 저장 폴더 (기본: output/[타임스탬프])")
+    parser.add_argument("--test-id", action="append", dest="test_ids", help="실행할 질문 ID (여러 번 지정 가능)")
+    parser.add_argument("--sample", default=None, help="층화 샘플링: 0~1 사이 비율 또는 API 호출 수")
+    parser.add_argument("--sample-seed", type=int, default=None, help="샘플링 시드")
+    parser.add_argument("--profile", action="store_true", help="단계별 프로파일링")
+    args = parser.parse_args(argv)
+
+    try:
+        result = run_suite(RunConfig(
+            questions_file=args.questions,
+            criteria_file=args.criteria,
+            cookie_file=args.cookies,
+            output_dir=args.output_dir,
+            test_ids=args.test_ids,
+            sample=args.sample,
+            sample_seed=args.sample_seed,
+            profile=args.profile
+        ))
+    except (LoginError, FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        return 2
+
+    print(f"\n📁 결과 폴더: {result.output_dir}")
+    print(f"✅ PASS {result.count('passed')}건 | ❌ FAIL {result.count('failed')}건 | "
+          f"⚠️ 오류 {result.count('error')}건 | ⏭️ 건너뜀 {result.count('skipped')}건 ({result.elapsed:.1f}초)")
+    return result.exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
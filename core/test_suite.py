@@ -0,0 +1,222 @@
+"""
+테스트 스위트 로더 모듈 (test_questions.json 1회 파싱 + 검증 + 파일 수정 시각 기준 캐시)
+
+질문은 불변 TestCase 객체로 제공하며, 평가에 반복 사용되는 값
+(소문자 키워드, 스트리밍 조회 대상, 질문 임베딩 캐시 키)을 로드 시점에 미리 계산함
+TestCase는 기존 dict 방식 접근(test_case['id'], test_case.get('keywords', []))도 지원
+"""
+import hashlib
+import json
+import os
+import threading
+from types import MappingProxyType
+
+from core.embedding_cache import EmbeddingCache
+
+REQUIRED_FIELDS = ("id", "category", "question")
+
+# 파일 경로 → (수정 시각, 파일 크기, TestSuite)
+_suite_cache = {}
+_cache_lock = threading.Lock()
+
+
+class TestCase:
+    """테스트 질문 1건 (불변)"""
+
+    __test__ = False  # pytest 수집 대상 아님
+
+    FIELDS = ("id", "category", "question", "expected_behavior", "keywords",
+              "negative_keywords", "special_instruction")
+
+    __slots__ = FIELDS + ("keywords_lower", "negative_keywords_lower", "ci_needles", "question_key",
+                          "_content_hash")
+
+    def __init__(self, id, category, question, expected_behavior=None, keywords=(),
+                 negative_keywords=(), special_instruction=None):
+        keywords = tuple(keywords or ())
+        negative_keywords = tuple(negative_keywords or ())
+        if special_instruction is not None:
+            special_instruction = MappingProxyType({
+                key: tuple(value) if isinstance(value, list) else value
+                for key, value in special_instruction.items()
+            })
+
+        assign = object.__setattr__
+        assign(self, "id", id)
+        assign(self, "category", category)
+        assign(self, "question", question)
+        assign(self, "expected_behavior", expected_behavior)
+        assign(self, "keywords", keywords)
+        assign(self, "negative_keywords", negative_keywords)
+        assign(self, "special_instruction", special_instruction)
+
+        # 평가 시 반복 계산하던 값
+        assign(self, "keywords_lower", tuple(kw.lower() for kw in keywords))
+        assign(self, "negative_keywords_lower", tuple(kw.lower() for kw in negative_keywords))
+        assign(self, "ci_needles", frozenset(keywords + negative_keywords))
+        assign(self, "question_key", EmbeddingCache.key(question))
+        assign(self, "_content_hash", None)
+
+    @classmethod
+    def from_dict(cls, data):
+        """dict → TestCase (설정 파일에 없는 필드는 무시)"""
+        return cls(**{field: data[field] for field in cls.FIELDS if field in data})
+
+    def to_dict(self):
+        """TestCase → dict (JSON 저장용, 값이 없는 선택 필드는 제외)"""
+        data = {}
+        for field in self.FIELDS:
+            value = getattr(self, field)
+            if value is None:
+                continue
+            if isinstance(value, tuple):
+                value = list(value)
+            elif isinstance(value, MappingProxyType):
+                value = {k: list(v) if isinstance(v, tuple) else v for k, v in value.items()}
+            data[field] = value
+        return data
+
+    @property
+    def content_hash(self):
+        """질문 내용 해시 (평가에 쓰이는 필드 전체 기준, 처음 사용할 때 계산)"""
+        if self._content_hash is None:
+            payload = json.dumps(self.to_dict(), ensure_ascii=False, sort_keys=True)
+            object.__setattr__(self, "_content_hash", hashlib.sha256(payload.encode("utf-8")).hexdigest())
+        return self._content_hash
+
+    def replace(self, **changes):
+        """일부 필드만 바꾼 새 TestCase 반환"""
+        data = self.to_dict()
+        data.update(changes)
+        return TestCase.from_dict(data)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"TestCase는 변경할 수 없습니다: {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"TestCase는 변경할 수 없습니다: {name}")
+
+    def __reduce__(self):
+        return (TestCase.from_dict, (self.to_dict(),))
+
+    # dict 호환 접근 (기존 test_case['id'], test_case.get(...) 코드용)
+    def get(self, key, default=None):
+        if key not in self.FIELDS:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS or getattr(self, key) is None:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.FIELDS and getattr(self, key) is not None
+
+    def keys(self):
+        return [field for field in self.FIELDS if getattr(self, field) is not None]
+
+    def __repr__(self):
+        return f"TestCase(id={self.id!r}, category={self.category!r}, question={self.question!r})"
+
+
+class TestSuite:
+    """검증된 테스트 스위트 (설정 + 질문 목록)"""
+
+    __test__ = False  # pytest 수집 대상 아님
+
+    __slots__ = ("path", "settings", "test_cases", "by_id")
+
+    def __init__(self, path, settings, test_cases):
+        self.path = path
+        self.settings = settings
+        self.test_cases = tuple(test_cases)
+        self.by_id = {tc.id: tc for tc in self.test_cases}
+
+    def __len__(self):
+        return len(self.test_cases)
+
+    def __iter__(self):
+        return iter(self.test_cases)
+
+    def get(self, test_id, default=None):
+        """질문 ID로 TestCase 조회"""
+        return self.by_id.get(test_id, default)
+
+
+def as_test_case(test_case):
+    """dict 또는 TestCase → TestCase"""
+    if isinstance(test_case, TestCase):
+        return test_case
+    return TestCase.from_dict(test_case)
+
+
+def parse_suite(data, path="<memory>"):
+    """
+    설정 dict 검증 후 TestSuite 생성
+
+    Args:
+        data (dict): test_questions.json 내용
+        path (str): 오류 메시지용 파일 경로
+
+    Returns:
+        TestSuite: 검증된 테스트 스위트
+
+    Raises:
+        ValueError: 필수 항목 누락, 질문 ID 중복, 잘못된 키워드 형식
+    """
+    if not isinstance(data.get("test_cases"), list):
+        raise ValueError(f"{path}: test_cases 목록이 없습니다.")
+
+    settings = data.get("settings", {})
+    test_cases = []
+    seen = set()
+
+    for index, raw in enumerate(data["test_cases"]):
+        missing = [field for field in REQUIRED_FIELDS if not raw.get(field)]
+        if missing:
+            raise ValueError(f"{path}: test_cases[{index}] 필수 항목 누락 ({', '.join(missing)})")
+
+        if raw["id"] in seen:
+            raise ValueError(f"{path}: 질문 ID 중복 ({raw['id']})")
+        seen.add(raw["id"])
+
+        for field in ("keywords", "negative_keywords"):
+            values = raw.get(field, [])
+            if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+                raise ValueError(f"{path}: {raw['id']}의 {field}는 문자열 목록이어야 합니다.")
+
+        special = raw.get("special_instruction")
+        if special is not None and not isinstance(special, dict):
+            raise ValueError(f"{path}: {raw['id']}의 special_instruction은 객체여야 합니다.")
+
+        test_cases.append(TestCase.from_dict(raw))
+
+    return TestSuite(path, settings, test_cases)
+
+
+def load_suite(path="config/test_questions.json"):
+    """
+    테스트 스위트 로드 (파일이 바뀌지 않았으면 캐시된 TestSuite 반환)
+
+    Args:
+        path (str): 테스트 질문 설정 파일
+
+    Returns:
+        TestSuite: 검증된 테스트 스위트
+    """
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        cached = _suite_cache.get(abs_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        with open(abs_path, "r", encoding="utf-8") as f:
+            suite = parse_suite(json.load(f), path)
+
+        _suite_cache[abs_path] = (signature, suite)
+        return suite
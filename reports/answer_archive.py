@@ -0,0 +1,151 @@
+"""
+답변 아카이브 모듈 (Parquet, 열 단위 압축 저장)
+
+detailed_answers.csv와 같은 내용을 열 단위로 저장하여, 여러 실행의 답변을
+필요한 열만 골라(메모리 맵) 빠르게 읽을 수 있게 함
+    - 카테고리/질문ID/질문: 딕셔너리 인코딩 (반복 값은 한 번만 저장)
+    - 답변 원문: zstd 압축
+    - 점수/PASS 여부 포함 (재평가 없이 실행 간 비교 가능)
+
+pyarrow가 설치되어 있지 않으면 아카이브 저장은 건너뜀 (CSV는 그대로 생성)
+"""
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+except ImportError:  # 선택 의존성
+    pa = None
+
+from core.results import CRITERIA, as_test_result
+
+ARCHIVE_FILE = "answers.parquet"
+
+# 딕셔너리 인코딩 열 (값 종류가 적고 반복이 많음, 답변은 라운드 간 동일 답변을 한 번만 저장)
+DICTIONARY_COLUMNS = ["run_id", "test_id", "category", "question", "answer"]
+
+# rescore.py가 사용하는 CSV 열 이름 ↔ 아카이브 열 이름
+CSV_COLUMNS = {
+    "질문ID": "test_id",
+    "라운드": "round",
+    "카테고리": "category",
+    "질문": "question",
+    "답변 전문": "answer",
+    "타임스탬프": "timestamp",
+}
+
+
+def is_available():
+    """pyarrow 설치 여부"""
+    return pa is not None
+
+
+def _schema():
+    score_fields = [pa.field(name, pa.int8()) for name in CRITERIA]
+    return pa.schema([
+        pa.field("run_id", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("test_id", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("round", pa.int16()),
+        pa.field("category", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("question", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("answer", pa.string()),
+        *score_fields,
+        pa.field("total_score", pa.int16()),
+        pa.field("max_score", pa.int16()),
+        pa.field("pass", pa.bool_()),
+        pa.field("answer_complete", pa.bool_()),
+        pa.field("timestamp", pa.string()),
+    ])
+
+
+def save_answer_archive(results, output_file, run_id=None, compression_level=6):
+    """
+    답변 아카이브(Parquet) 저장
+
+    Args:
+        results (list): 테스트 결과 리스트 (TestResult 또는 dict)
+        output_file (str): 출력 파일 경로 (예: output/[타임스탬프]/answers.parquet)
+        run_id (str): 실행 ID (None이면 출력 폴더 이름)
+        compression_level (int): zstd 압축 레벨
+
+    Returns:
+        str: 저장한 파일 경로 (pyarrow 미설치 시 None)
+    """
+    if pa is None:
+        print("⚠️ pyarrow가 설치되어 있지 않아 답변 아카이브(Parquet) 저장을 건너뜁니다.")
+        return None
+
+    records = [as_test_result(r) for r in results]
+    if run_id is None:
+        run_id = os.path.basename(os.path.dirname(os.path.abspath(output_file)))
+
+    evaluations = [r.evaluation for r in records]
+    score_columns = list(zip(*(e.score_values for e in evaluations))) or [()] * len(CRITERIA)
+
+    columns = {
+        "run_id": [run_id] * len(records),
+        "test_id": [r.test_id for r in records],
+        "round": [r.round for r in records],
+        "category": [r.category for r in records],
+        "question": [r.question for r in records],
+        "answer": [r.answer for r in records],
+        **{name: list(values) for name, values in zip(CRITERIA, score_columns)},
+        "total_score": [e.total_score for e in evaluations],
+        "max_score": [e.max_score for e in evaluations],
+        "pass": [e.passed for e in evaluations],
+        "answer_complete": [r.answer_complete for r in records],
+        "timestamp": [r.timestamp for r in records],
+    }
+
+    table = pa.Table.from_pydict(columns, schema=_schema())
+    pq.write_table(
+        table,
+        output_file,
+        compression="zstd",
+        compression_level=compression_level,
+        use_dictionary=DICTIONARY_COLUMNS,
+    )
+    return output_file
+
+
+def read_answer_archive(paths, columns=None, filter=None):
+    """
+    답변 아카이브 읽기 (여러 실행을 한 테이블로, 필요한 열만 메모리 맵으로 로드)
+
+    Args:
+        paths (str or list): 아카이브 파일 경로 (여러 개 가능)
+        columns (list): 읽을 열 이름 (None이면 전체)
+        filter: pyarrow.dataset 필터 식 (예: ds.field("category") == "날씨")
+
+    Returns:
+        pyarrow.Table: 아카이브 테이블
+    """
+    if pa is None:
+        raise ImportError("답변 아카이브를 읽으려면 pyarrow가 필요합니다: pip install pyarrow")
+
+    if isinstance(paths, str):
+        return pq.read_table(paths, columns=columns, filters=filter, memory_map=True)
+
+    dataset = ds.dataset(list(paths), format="parquet", filesystem=pafs.LocalFileSystem(use_mmap=True))
+    # 실행마다 딕셔너리가 다르므로 집계(group_by 등)가 가능하도록 통합
+    return dataset.to_table(columns=columns, filter=filter).unify_dictionaries()
+
+
+def iter_archive_rows(path, batch_size=1024):
+    """
+    아카이브 답변을 CSV 행 형식(dict, 한국어 열 이름)으로 한 행씩 읽기 (rescore.py용)
+
+    배치 단위로 필요한 열만 읽으므로 전체 파일을 메모리에 올리지 않음
+    """
+    if pa is None:
+        raise ImportError("답변 아카이브를 읽으려면 pyarrow가 필요합니다: pip install pyarrow")
+
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    names = list(CSV_COLUMNS.values())
+
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=names):
+        columns = [batch.column(name).to_pylist() for name in names]
+        for values in zip(*columns):
+            yield dict(zip(CSV_COLUMNS.keys(), values))
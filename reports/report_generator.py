@@ -8,14 +8,18 @@ from openpyxl.utils import get_column_letter
 from datetime import datetime
 import csv
 
+from core.results import CRITERIA, as_test_result
 
-def generate_excel_report(results, output_file="output/test_results.xlsx"):
+
+def generate_excel_report(results, output_file="output/test_results.xlsx", consistency=None, sampling=None):
     """
-    Excel 보고서 생성 (2개 시트: 상세 결과 + 차트)
+    Excel 보고서 생성 (2개 시트: 상세 결과 + 차트, 일관성 분석/샘플링 추정이 있으면 시트 추가)
     
     Args:
         results (list): 테스트 결과 리스트
         output_file (str): 출력 파일 경로
+        consistency (dict): utils.consistency.calculate_consistency 결과 (선택)
+        sampling (dict): 샘플링 실행 정보 + 통과율 추정 (선택, tests/conftest.py 참고)
     """
     wb = Workbook()
     
@@ -29,6 +33,14 @@ def generate_excel_report(results, output_file="output/test_results.xlsx"):
     # 시트 2: 차트
     _create_chart_sheet(wb, results)
     
+    # 시트 3: 라운드 간 답변 일관성
+    if consistency and consistency["questions"]:
+        _create_consistency_sheet(wb, consistency)
+    
+    # 시트 4: 샘플링 실행 추정
+    if sampling:
+        _create_sampling_sheet(wb, sampling)
+    
     # 저장
     wb.save(output_file)
 
@@ -44,6 +56,10 @@ def _create_detail_sheet(wb, results):
         "총점", "만점", "PASS/FAIL", "타임스탬프"
     ]
     
+    # 보조 항목 (골든 유사도 등, 총점 미반영) 은 마지막 열에 추가
+    extra_names = sorted({name for r in results for name in as_test_result(r).evaluation.extra_scores})
+    headers += extra_names
+    
     ws.append(headers)
     
     # 헤더 스타일링
@@ -56,25 +72,23 @@ def _create_detail_sheet(wb, results):
         cell.font = header_font
         cell.alignment = Alignment(horizontal="center", vertical="center")
     
-    # 데이터 작성
+    # 데이터 작성 (점수는 헤더와 같은 CRITERIA 순서)
     for result in results:
-        eval_data = result['evaluation']
+        result = as_test_result(result)
+        eval_data = result.evaluation
+        question = result.question
         
         row_data = [
-            result['test_id'],
-            result.get('round', 1),
-            result['category'],
-            result['question'][:50] + "..." if len(result['question']) > 50 else result['question'],
-            eval_data['scores']['정확성'],
-            eval_data['scores']['관련성'],
-            eval_data['scores']['할루시네이션'],
-            eval_data['scores']['안전성'],
-            eval_data['scores']['스타일'],
-            eval_data['scores']['기능적_요건'],
-            eval_data['total_score'],
-            eval_data['max_score'],
-            "PASS" if eval_data['pass'] else "FAIL",
-            result['timestamp']
+            result.test_id,
+            result.round,
+            result.category,
+            question[:50] + "..." if len(question) > 50 else question,
+            *eval_data.score_values,
+            eval_data.total_score,
+            eval_data.max_score,
+            "PASS" if eval_data.passed else "FAIL",
+            result.timestamp,
+            *(eval_data.extra_scores.get(name, "-") for name in extra_names)
         ]
         
         ws.append(row_data)
@@ -100,7 +114,7 @@ def _create_detail_sheet(wb, results):
             cell.alignment = Alignment(horizontal="center")
     
     # 컬럼 너비 조정
-    column_widths = [10, 8, 12, 40, 8, 8, 12, 8, 8, 12, 8, 8, 12, 20]
+    column_widths = [10, 8, 12, 40, 8, 8, 12, 8, 8, 12, 8, 8, 12, 20] + [12] * len(extra_names)
     for idx, width in enumerate(column_widths, 1):
         ws.column_dimensions[get_column_letter(idx)].width = width
     
@@ -118,18 +132,15 @@ def _create_chart_sheet(wb, results):
     ws = wb.create_sheet("차트 & 통계", 1)
     
     # 통계 계산
-    total_tests = len(results)
-    passed = sum(1 for r in results if r['evaluation']['pass'])
+    evaluations = [as_test_result(r).evaluation for r in results]
+    total_tests = len(evaluations)
+    passed = sum(1 for e in evaluations if e.passed)
     failed = total_tests - passed
     pass_rate = (passed / total_tests * 100) if total_tests > 0 else 0
     
-    # 항목별 평균 점수
-    criteria_names = ["정확성", "관련성", "할루시네이션", "안전성", "스타일", "기능적_요건"]
-    avg_scores = {}
-    
-    for criterion in criteria_names:
-        scores = [r['evaluation']['scores'][criterion] for r in results]
-        avg_scores[criterion] = sum(scores) / len(scores) if scores else 0
+    # 항목별 평균 점수 (항목 순서대로 열 합계)
+    column_sums = map(sum, zip(*(e.score_values for e in evaluations)))
+    avg_scores = {criterion: total / total_tests for criterion, total in zip(CRITERIA, column_sums)}
     
     # === 1. 요약 통계 ===
     ws['A1'] = "📊 테스트 요약 통계"
@@ -141,7 +152,7 @@ def _create_chart_sheet(wb, results):
         ["통과 (PASS)", passed],
         ["실패 (FAIL)", failed],
         ["통과율", f"{pass_rate:.1f}%"],
-        ["평균 총점", f"{sum(r['evaluation']['total_score'] for r in results) / total_tests:.2f}/18점"],
+        ["평균 총점", f"{sum(e.total_score for e in evaluations) / total_tests:.2f}/18점"],
     ]
     
     for row_idx, row_data in enumerate(summary_data, 3):
@@ -214,6 +225,107 @@ def _create_chart_sheet(wb, results):
     ws.column_dimensions['L'].width = 12
 
 
+def _create_consistency_sheet(wb, consistency):
+    """시트3: 라운드 간 답변 일관성 (질문별 + 카테고리별)"""
+    ws = wb.create_sheet("답변 일관성", 2)
+    
+    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF", size=11)
+    outlier_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+    
+    def write_header(row_num, headers):
+        for col_num, header in enumerate(headers, 1):
+            cell = ws.cell(row=row_num, column=col_num, value=header)
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = Alignment(horizontal="center", vertical="center")
+    
+    # === 1. 질문별 (일관성 낮은 순) ===
+    write_header(1, ["질문ID", "카테고리", "라운드 수", "평균 유사도", "최소 유사도", "이상 라운드"])
+    
+    questions = sorted(consistency["questions"].items(), key=lambda item: item[1]["mean"])
+    for row_num, (test_id, stats) in enumerate(questions, 2):
+        outliers = ", ".join(f"Round{r}" for r in stats["outlier_rounds"])
+        ws.append([
+            test_id,
+            stats["category"],
+            stats["rounds"],
+            round(stats["mean"], 3),
+            round(stats["min"], 3),
+            outliers or "-"
+        ])
+        if outliers:
+            ws.cell(row=row_num, column=6).fill = outlier_fill
+    
+    # === 2. 카테고리별 ===
+    category_row = len(questions) + 4
+    write_header(category_row, ["카테고리", "질문 수", "평균 유사도", "최소 유사도", "이상 라운드 수"])
+    
+    for row_num, (category, stats) in enumerate(consistency["categories"].items(), category_row + 1):
+        values = [category, stats["questions"], round(stats["mean"], 3), round(stats["min"], 3), stats["outlier_rounds"]]
+        for col_num, value in enumerate(values, 1):
+            ws.cell(row=row_num, column=col_num, value=value)
+    
+    column_widths = [10, 12, 10, 12, 12, 30]
+    for idx, width in enumerate(column_widths, 1):
+        ws.column_dimensions[get_column_letter(idx)].width = width
+    
+    ws.freeze_panes = "A2"
+
+
+def _create_sampling_sheet(wb, sampling):
+    """샘플링 실행 정보 + 전체/카테고리별 통과율 추정 (신뢰구간)"""
+    ws = wb.create_sheet("샘플링 추정")
+    
+    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF", size=11)
+    
+    def percent(value):
+        return "-" if value is None else f"{value * 100:.1f}%"
+    
+    # === 1. 샘플링 정보 ===
+    ws['A1'] = "샘플링 실행 (층화 샘플, 전체 실행 결과가 아닌 추정치)"
+    ws['A1'].font = Font(size=12, bold=True)
+    
+    overall = sampling["estimate"]["overall"]
+    info = [
+        ["샘플 방식", sampling["mode"]],
+        ["시드", sampling["seed"]],
+        ["샘플 질문 수", f"{sampling['sampled']}/{sampling['population']}개"],
+        ["추정 통과율", percent(overall["rate"])],
+        ["95% 신뢰구간", f"{percent(overall['lower'])} ~ {percent(overall['upper'])}"],
+    ]
+    for row_num, (label, value) in enumerate(info, 3):
+        ws.cell(row=row_num, column=1, value=label).font = Font(bold=True)
+        ws.cell(row=row_num, column=2, value=value)
+    
+    # === 2. 카테고리별 ===
+    header_row = len(info) + 4
+    headers = ["카테고리", "샘플 질문", "전체 질문", "통과/실행", "통과율", "신뢰구간 하한", "신뢰구간 상한"]
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=header_row, column=col_num, value=header)
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = Alignment(horizontal="center", vertical="center")
+    
+    for row_num, (category, stats) in enumerate(sampling["estimate"]["categories"].items(), header_row + 1):
+        values = [
+            category,
+            stats["sampled"],
+            stats["population"],
+            f"{stats['passed']}/{stats['total']}",
+            percent(stats["rate"]),
+            percent(stats["lower"]),
+            percent(stats["upper"])
+        ]
+        for col_num, value in enumerate(values, 1):
+            ws.cell(row=row_num, column=col_num, value=value)
+    
+    column_widths = [16, 12, 12, 12, 10, 14, 14]
+    for idx, width in enumerate(column_widths, 1):
+        ws.column_dimensions[get_column_letter(idx)].width = width
+
+
 def save_detailed_answers_csv(results, output_file="output/detailed_answers.csv"):
     """답변 원문을 CSV로 저장"""
     
@@ -225,11 +337,12 @@ def save_detailed_answers_csv(results, output_file="output/detailed_answers.csv"
         
         # 데이터
         for result in results:
+            result = as_test_result(result)
             writer.writerow([
-                result['test_id'],
-                result.get('round', 1),
-                result['category'],
-                result['question'],
-                result['answer'],
-                result['timestamp']
+                result.test_id,
+                result.round,
+                result.category,
+                result.question,
+                result.answer,
+                result.timestamp
             ])
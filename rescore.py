@@ -0,0 +1,229 @@
+"""
+오프라인 재평가 스크립트 (저장된 답변을 API 호출 없이 다시 평가)
+
+config/evaluation_criteria.json 기준이나 Evaluator 규칙을 바꾼 뒤,
+기존 실행의 답변(answers.parquet, 없으면 detailed_answers.csv)을 다시 평가하여 새 리포트를 생성합니다.
+
+사용법:
+    python rescore.py output/20250101_120000          # 실행 1건
+    python rescore.py output                          # output 아래 모든 실행
+    python rescore.py run1/detailed_answers.csv run2 --workers 4
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+
+from core.answer_store import AnswerStore
+from core.evaluator import Evaluator
+from core.judge import Judge
+from core.results import TestResult
+from core.test_suite import TestCase, load_suite
+from reports import answer_archive
+from reports.answer_archive import ARCHIVE_FILE, iter_archive_rows, save_answer_archive
+from reports.report_generator import generate_excel_report, save_detailed_answers_csv
+from utils.consistency import calculate_consistency
+from utils.scoring import calculate_statistics
+
+ANSWER_FILE = "detailed_answers.csv"
+RESCORED_PREFIX = "rescored_"
+
+
+def find_answer_files(paths):
+    """
+    입력 경로에서 답변 파일 목록 수집 (실행 폴더에 아카이브가 있고 pyarrow가 설치되어 있으면 아카이브 우선)
+
+    Args:
+        paths (list): 답변 파일(CSV/Parquet) 또는 실행 폴더 (하위 폴더까지 검색)
+
+    Returns:
+        list: 답변 파일 경로 리스트 (재평가 결과 폴더는 제외)
+    """
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(path)
+            continue
+
+        for root, dirs, filenames in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(RESCORED_PREFIX))
+            if ARCHIVE_FILE in filenames and answer_archive.is_available():
+                files.append(os.path.join(root, ARCHIVE_FILE))
+            elif ANSWER_FILE in filenames:
+                files.append(os.path.join(root, ANSWER_FILE))
+
+    return files
+
+
+def iter_archived_answers(answer_file):
+    """CSV/Parquet의 답변을 한 행씩 읽기 (전체 파일을 메모리에 올리지 않음)"""
+    if answer_file.endswith(".parquet"):
+        yield from iter_archive_rows(answer_file)
+        return
+
+    with open(answer_file, "r", newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            yield row
+
+
+def build_test_case(row, test_cases):
+    """CSV 행에 대응하는 테스트 케이스 (설정에 없으면 CSV 정보로 최소 구성)"""
+    test_case = test_cases.get(row["질문ID"])
+
+    if test_case is None:
+        return TestCase(id=row["질문ID"], category=row["카테고리"], question=row["질문"])
+
+    if test_case.question != row["질문"]:
+        # 답변은 당시 질문에 대한 것이므로 질문 문구는 CSV 기준
+        return test_case.replace(question=row["질문"])
+
+    return test_case
+
+
+def rescore_run(evaluator, answer_file, test_cases, batch_size):
+    """
+    실행 1건의 답변을 batch_size 단위로 일괄 평가
+
+    Returns:
+        list: TestResult 리스트
+    """
+    results = []
+    batch = []
+
+    def flush():
+        items = [(build_test_case(row, test_cases), row["답변 전문"]) for row in batch]
+        evaluations = evaluator.evaluate_batch(items)
+
+        for row, (test_case, answer), evaluation in zip(batch, items, evaluations):
+            results.append(TestResult(
+                test_id=row["질문ID"],
+                round=int(row["라운드"]) if row["라운드"] else 1,
+                question=row["질문"],
+                category=test_case.category,
+                answer=answer,
+                evaluation=evaluation,
+                timestamp=row["타임스탬프"]
+            ))
+        batch.clear()
+
+    for row in iter_archived_answers(answer_file):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            flush()
+
+    if batch:
+        flush()
+
+    return results
+
+
+def write_reports(results, output_dir, consistency=None):
+    """재평가 리포트 저장 (워커 프로세스에서 실행)"""
+    os.makedirs(output_dir, exist_ok=True)
+    generate_excel_report(results, f"{output_dir}/test_results.xlsx", consistency)
+    save_detailed_answers_csv(results, f"{output_dir}/detailed_answers.csv")
+    save_answer_archive(results, f"{output_dir}/{ARCHIVE_FILE}")
+    return output_dir, calculate_statistics(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="저장된 답변 오프라인 재평가")
+    parser.add_argument("paths", nargs="+", help="답변 파일(CSV/Parquet) 또는 실행 폴더")
+    parser.add_argument("--questions", default=os.path.join(BASE_DIR, "config/test_questions.json"),
+                        help="테스트 질문 설정 파일")
+    parser.add_argument("--criteria", default=os.path.join(BASE_DIR, "config/evaluation_criteria.json"),
+                        help="평가 기준 설정 파일")
+    parser.add_argument("--output-root", default=None,
+                        help="리포트 저장 위치 (기본: 각 실행 폴더 아래 rescored_[타임스탬프])")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="리포트 생성 병렬 프로세스 수")
+    parser.add_argument("--batch-size", type=int, default=4096,
+                        help="일괄 평가 단위 (답변 수, 규칙 항목은 배치 안의 질문별 답변 배열로 평가)")
+    parser.add_argument("--embedding-cache", default=os.path.join(BASE_DIR, "output/embedding_cache.npz"),
+                        help="임베딩 캐시 파일 (빈 문자열이면 캐시 파일 미사용)")
+    parser.add_argument("--answer-store", default=os.path.join(BASE_DIR, "output/answer_store.sqlite"),
+                        help="평가 결과 메모 저장소 (빈 문자열이면 미사용)")
+    parser.add_argument("--golden-answers", default=os.path.join(BASE_DIR, "config/golden_answers.json"),
+                        help="골든 답변 파일 (빈 문자열이거나 파일이 없으면 골든 유사도 평가 안 함)")
+    parser.add_argument("--reference-index", default=os.path.join(BASE_DIR, "output/reference_index.npz"),
+                        help="골든 답변 인덱스 저장 파일")
+    parser.add_argument("--judge", action="store_true",
+                        help="LLM 심사 보조 항목 평가 (테스트 질문 설정의 settings.judge 사용, enabled 값과 무관)")
+    parser.add_argument("--eval-server", default="auto",
+                        help="평가 서버 주소 (auto: 기본 주소의 서버가 실행 중이면 사용, 빈 문자열이면 미사용)")
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("🔁 오프라인 재평가")
+    print("=" * 80)
+
+    answer_files = find_answer_files(args.paths)
+    if not answer_files:
+        print("❌ 답변 파일(answers.parquet / detailed_answers.csv)을 찾을 수 없습니다.")
+        return 1
+
+    print(f"📂 대상 실행: {len(answer_files)}건")
+
+    test_cases = load_suite(args.questions)
+
+    answer_store = AnswerStore(args.answer_store) if args.answer_store else None
+    judge = Judge.from_settings(test_cases.settings.get("judge", {})) if args.judge else None
+    golden_answers = args.golden_answers if args.golden_answers and os.path.exists(args.golden_answers) else None
+    evaluator = Evaluator(args.criteria, embedding_cache_file=args.embedding_cache or None,
+                          answer_store=answer_store, golden_answers_file=golden_answers,
+                          reference_index_file=args.reference_index or None,
+                          eval_server=True if args.eval_server == "auto" else args.eval_server or None,
+                          judge=judge)
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    start = time.time()
+    total_answers = 0
+
+    # 평가(모델 추론)는 메인 프로세스에서 배치로, 리포트 생성은 워커 프로세스에서 병렬로 진행
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = []
+
+        for answer_file in answer_files:
+            run_dir = os.path.dirname(os.path.abspath(answer_file))
+            if args.output_root:
+                output_dir = os.path.join(args.output_root, os.path.basename(run_dir))
+            else:
+                output_dir = os.path.join(run_dir, f"{RESCORED_PREFIX}{stamp}")
+
+            results = rescore_run(evaluator, answer_file, test_cases, args.batch_size)
+            total_answers += len(results)
+            print(f"✅ 재평가 완료: {answer_file} ({len(results)}개 답변)")
+
+            if results:
+                # 일관성 분석은 평가기의 임베딩 캐시를 재사용하므로 메인 프로세스에서 계산
+                consistency = calculate_consistency(results, evaluator.embedding_cache)
+                futures.append(pool.submit(write_reports, results, output_dir, consistency))
+
+            evaluator.embedding_cache.save()
+
+        for future in futures:
+            output_dir, stats = future.result()
+            print(f"📊 {output_dir}: 통과율 {stats['pass_rate']:.1f}% "
+                  f"({stats['passed']}/{stats['total_tests']}), 평균 총점 {stats['avg_total_score']:.2f}")
+
+    elapsed = time.time() - start
+    print()
+    print(f"✅ 전체 {total_answers}개 답변 재평가 완료 ({elapsed:.1f}초, 임베딩 캐시 {len(evaluator.embedding_cache)}개)")
+    if answer_store is not None:
+        print(f"♻️ 동일 답변 평가 재사용: {answer_store.hits}건 (신규 평가 {answer_store.misses}건)")
+        answer_store.close()
+    if judge is not None:
+        stats = judge.stats()
+        print(f"⚖️ LLM 심사: 채점 {stats['judged']}건 (저장된 결과 {stats['cache_hits']}건), 요청 {stats['requests']}건, "
+              f"실패 {stats['failed']}건, 예산 초과 {stats['skipped']}건, 비용 {stats['cost']:.4f}")
+        judge.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,23 @@
 """
 간단 실행 스크립트 (Windows/Mac/Linux 모두 지원)
+
+기본은 같은 프로세스에서 실행 (core/runner.py의 run_suite, pytest 하위 프로세스 없음)
+--pytest를 지정하면 기존처럼 pytest로 실행 (xdist 병렬 실행 등 pytest 옵션 사용)
 """
+import argparse
 import os
 import sys
 import subprocess
 
+parser = argparse.ArgumentParser(description="LLM 답변 평가 자동화 테스트 실행 (--pytest 모드에서는 그 외 옵션을 pytest에 그대로 전달)")
+parser.add_argument("--profile", action="store_true",
+                    help="단계별 프로파일링 (output/[타임스탬프]/profile에 결과 저장)")
+parser.add_argument("--pytest", action="store_true", help="pytest 하위 프로세스로 실행")
+parser.add_argument("--sample", default=None, help="층화 샘플링: 0~1 사이 비율 또는 API 호출 수")
+args, pytest_args = parser.parse_known_args()
+if pytest_args and not args.pytest:
+    parser.error(f"알 수 없는 옵션: {' '.join(pytest_args)} (pytest 옵션은 --pytest와 함께 사용)")
+
 print("=" * 80)
 print("🤖 LLM 답변 평가 자동화 테스트")
 print("=" * 80)
@@ -38,8 +51,28 @@ if not cookie_path:
 print(f"✅ cookies.json 확인 완료 ({cookie_path})")
 print()
 
-# 2. pytest 실행
-result = subprocess.run([sys.executable, "-m", "pytest", "-v"], cwd=os.path.dirname(__file__))
+# 2. 테스트 실행
+project_dir = os.path.dirname(os.path.abspath(__file__))
+if args.pytest:
+    command = [sys.executable, "-m", "pytest", "-v"] + pytest_args
+    if args.profile:
+        command.append("--llm-profile")
+    if args.sample:
+        command += ["--llm-sample", args.sample]
+    returncode = subprocess.run(command, cwd=project_dir).returncode
+else:
+    cookie_path = os.path.abspath(cookie_path)
+    os.chdir(project_dir)
+    sys.path.insert(0, project_dir)
+    from core.runner import LoginError, RunConfig, run_suite
+    
+    try:
+        run_result = run_suite(RunConfig(cookie_file=cookie_path, sample=args.sample, profile=args.profile))
+    except LoginError:
+        sys.exit(1)
+    returncode = run_result.exit_code
+    print(f"\n✅ PASS {run_result.count('passed')}건 | ❌ FAIL {run_result.count('failed')}건 | "
+          f"⚠️ 오류 {run_result.count('error')}건 | ⏭️ 건너뜀 {run_result.count('skipped')}건")
 
 # 3. 결과 확인
 print()
@@ -50,6 +83,8 @@ print()
 print("📁 결과 파일:")
 print("  - Excel 리포트: output/[타임스탬프]/test_results.xlsx")
 print("  - 상세 답변 CSV: output/[타임스탬프]/detailed_answers.csv")
+if args.profile:
+    print("  - 프로파일: output/[타임스탬프]/profile/profile_summary.txt")
 print()
 
-sys.exit(result.returncode)
+sys.exit(returncode)
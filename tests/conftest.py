@@ -0,0 +1,377 @@
+"""
+pytest 플러그인 설정 (테스트 결과 수집 및 리포트 생성)
+
+결과는 실행 폴더(output/[타임스탬프])의 공유 저장소에 한 건씩 기록되고,
+세션 종료 시(pytest_sessionfinish) 한 번만 리포트를 생성함
+pytest-xdist(pytest -n N)로 실행하면 워커는 결과 기록만, 리포트는 컨트롤러가 생성
+"""
+import contextlib
+import logging
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.answer_store import AnswerStore
+from core.runner import calculate_run_consistency, estimate_sampling, select_sample, write_reports
+from core.test_suite import load_suite
+from utils.profiling import RunProfiler
+from utils.progress import MetricsServer, ProgressTracker, format_status_line, write_metrics_file
+from utils.result_store import ResultStore
+from utils.run_history import RunHistory
+from utils.sampling import parse_sample_option
+from utils.scheduling import order_jobs, simulate_makespan
+
+PLUGIN_NAME = "llm_result_collector"
+QUESTIONS_FILE = "config/test_questions.json"
+NODEID_PATTERN = re.compile(r"\[Round(\d+)-([^\]]+)\]$")
+
+
+class ResultCollector:
+    """테스트 결과 수집 플러그인"""
+
+    def __init__(self, config):
+        self.config = config
+        self.is_worker = hasattr(config, "workerinput")
+        # 수집만 하는 실행(--collect-only)은 output/의 저장소·이력·메트릭 파일을 열거나 만들지 않음
+        self.collect_only = config.getoption("collectonly", False)
+
+        if self.is_worker:
+            # xdist 워커: 컨트롤러가 정한 실행 폴더, 이력 기준 시각 사용
+            self.output_dir = config.workerinput["llm_output_dir"]
+            self.history_cutoff = config.workerinput["llm_history_cutoff"]
+            writer_id = config.workerinput["workerid"]
+        else:
+            self.output_dir = f"output/{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            self.history_cutoff = time.time()
+            writer_id = "main"
+
+        # 답변 저장소 (같은 답변은 한 번만 저장하고 평가 결과도 재사용, 실행 간 공유)
+        self.settings = load_suite(QUESTIONS_FILE).settings
+        answer_store_settings = self.settings.get("answer_store", {})
+        self.answer_store = None
+        if answer_store_settings.get("enabled", False) and not self.collect_only:
+            self.answer_store = AnswerStore(answer_store_settings.get("file", "output/answer_store.sqlite"))
+
+        self.store = ResultStore(os.path.join(self.output_dir, ".results"), writer_id, self.answer_store)
+        self.local_results = []  # 이 프로세스에서 기록한 결과
+        self.runner = None       # 이 프로세스의 SuiteRunner (tests/test_main.py가 등록, xdist 컨트롤러는 None)
+
+        # 실행 이력 (질문별 소요 시간/실패 이력, 실행 순서 결정에 사용, 실행 간 공유)
+        history_settings = self.settings.get("run_history", {})
+        self.history = None
+        self.history_snapshot = None
+        if history_settings.get("enabled", False) and not self.collect_only:
+            self.history = RunHistory(history_settings.get("file", "output/run_history.sqlite"))
+            # 이번 실행 시작 전 기록만 사용 (모든 xdist 워커가 같은 실행 순서를 얻도록)
+            self.history_snapshot = self.history.snapshot(self.history_cutoff, history_settings.get("window", 20))
+
+        # 층화 샘플링 (빠른 스모크 실행, --llm-sample 옵션이 설정 파일보다 우선)
+        self.sampling = dict(self.settings.get("sampling", {}))
+        sample_option = config.getoption("llm_sample", None)
+        if sample_option:
+            try:
+                self.sampling.update(parse_sample_option(sample_option), enabled=True)
+            except ValueError as e:
+                raise pytest.UsageError(str(e))
+        if self.is_worker:
+            self.sampling["seed"] = config.workerinput["llm_sample_seed"]
+        elif config.getoption("llm_sample_seed", None) is not None:
+            self.sampling["seed"] = config.getoption("llm_sample_seed")
+        elif self.sampling.get("seed") is None:
+            self.sampling["seed"] = random.randrange(1_000_000)
+        self._sampled_ids = None
+
+        # 프로파일링 (--llm-profile, 단계별 cProfile/샘플링/메모리, 수집 단계부터 측정)
+        self.profiler = None
+        if config.getoption("llm_profile", False):
+            self.profiler = RunProfiler()
+            self.profiler.start()
+
+        self.scheduling = self.settings.get("scheduling", {})
+        self.executed_jobs = []  # (라운드, 질문ID, 카테고리)
+        self.test_spans = []     # (시작 시각, 종료 시각)
+
+        # 진행 상황 모니터링 (컨트롤러/단일 프로세스에서만, 상태 줄 + Prometheus 메트릭)
+        self.progress_settings = self.settings.get("progress", {})
+        self.progress = None
+        self.metrics_server = None
+        self._last_status = 0.0
+        if not self.is_worker and not self.collect_only and self.progress_settings.get("enabled", False):
+            self.progress = ProgressTracker(os.path.basename(self.output_dir))
+            port = self.progress_settings.get("http_port")
+            if port is not None:
+                self.metrics_server = MetricsServer(self.progress, port)
+
+    def record(self, result):
+        """결과 기록 (같은 결과를 수정 후 다시 기록하면 갱신됨)"""
+        if not any(r is result for r in self.local_results):
+            self.local_results.append(result)
+        self.store.record(result)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node):
+        """xdist 컨트롤러 → 워커로 실행 폴더 전달"""
+        node.workerinput["llm_output_dir"] = self.output_dir
+        node.workerinput["llm_history_cutoff"] = self.history_cutoff
+        node.workerinput["llm_sample_seed"] = self.sampling["seed"]
+
+    def profile_phase(self, name):
+        """프로파일링 단계 구간 (프로파일링 모드가 아니면 아무것도 하지 않음)"""
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        return self.profiler.phase(name)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection(self, session):
+        """테스트 수집 구간 프로파일링"""
+        with self.profile_phase("collection"):
+            yield
+
+    def select_test_cases(self, suite):
+        """
+        실행할 질문 (샘플링 모드면 카테고리별 층화 샘플, 모든 워커에서 같은 시드로 같은 질문 선택)
+
+        Args:
+            suite (TestSuite): 테스트 스위트
+
+        Returns:
+            list: TestCase 리스트
+        """
+        if not self.sampling.get("enabled", False):
+            return list(suite.test_cases)
+        if self._sampled_ids is None:
+            self._sampled_ids = {tc.id for tc in select_sample(suite, self.sampling)}
+        return [tc for tc in suite.test_cases if tc.id in self._sampled_ids]
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        """
+        실행 순서 결정
+            - scheduling.strategy "lpt" + 실행 이력: 예상 소요 시간이 긴 질문부터 (같으면 실패가 잦은 질문 먼저)
+              조기 판정 모드면 라운드 순서는 유지하고 라운드 안에서만 LPT
+            - 그 외: 라운드 → 질문 순
+        """
+        items.sort(key=_job_key)
+        if self.scheduling.get("strategy", "nodeid") != "lpt" or self.history_snapshot is None:
+            return
+
+        scheduled = [item for item in items if "test_params" in getattr(getattr(item, "callspec", None), "params", {})]
+        scheduled_ids = {id(item) for item in scheduled}
+        others = [item for item in items if id(item) not in scheduled_ids]
+        jobs = [(item.callspec.params["test_params"]["round_num"], item.callspec.params["test_params"]["test_case"])
+                for item in scheduled]
+
+        order = order_jobs(jobs, self.history_snapshot, self.scheduling.get("default_duration", 60),
+                           round_major=self.settings.get("sequential", {}).get("enabled", False))
+        items[:] = [scheduled[index] for index, _ in order] + others
+
+    def pytest_collection_finish(self, session):
+        """단일 프로세스 실행: 수집된 테스트로 진행 상황 초기화"""
+        if self.progress is not None and session.items:
+            self._start_progress([item.nodeid for item in session.items])
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, node, ids):
+        """xdist 실행: 첫 워커의 수집 결과로 진행 상황 초기화 (모든 워커가 같은 테스트를 수집)"""
+        if self.progress is not None and not self.progress.weights:
+            self._start_progress(ids)
+
+    def _start_progress(self, nodeids):
+        """전체 테스트 등록 (실행 이력이 있으면 예상 소요 시간을 남은 시간 계산 비중으로 사용)"""
+        suite = load_suite(QUESTIONS_FILE)
+        default_duration = self.scheduling.get("default_duration", 60)
+        weights = {}
+        for nodeid in nodeids:
+            match = NODEID_PATTERN.search(nodeid)
+            test_case = suite.get(match.group(2)) if match else None
+            if self.history_snapshot is not None and test_case is not None:
+                weights[nodeid] = self.history_snapshot.expected_duration(test_case.id, test_case.category,
+                                                                          default_duration)
+            else:
+                weights[nodeid] = default_duration
+        self.progress.set_jobs(weights)
+        self._publish_progress(force=True)
+
+    def _update_progress(self, report, properties):
+        """테스트 1건 종료 → 진행 상황 갱신 (평가 FAIL과 API 오류 등은 구분)"""
+        if report.passed:
+            outcome = "passed"
+        elif report.skipped:
+            outcome = "skipped"
+        elif report.when == "call" and "passed" in properties:
+            outcome = "failed"
+        else:
+            outcome = "error"
+        self.progress.record(report.nodeid, outcome, report.start, properties.get("latency"))
+        self._publish_progress()
+
+    def _publish_progress(self, force=False):
+        """메트릭 파일 갱신 (매번) + 터미널 상태 줄 출력 (interval초마다)"""
+        snapshot = self.progress.snapshot()
+        metrics_file = self.progress_settings.get("metrics_file")
+        if metrics_file:
+            try:
+                write_metrics_file(snapshot, metrics_file)
+            except OSError as e:
+                logging.getLogger("llm_test").warning(f"⚠️ 메트릭 파일 저장 실패: {e}")
+
+        now = time.monotonic()
+        if not force and now - self._last_status < self.progress_settings.get("interval", 30):
+            return
+        self._last_status = now
+        terminal = self.config.pluginmanager.get_plugin("terminalreporter")
+        if terminal is not None:
+            terminal.write_line(format_status_line(snapshot))
+
+    def pytest_runtest_logreport(self, report):
+        """테스트 1건 종료 → 진행 상황 갱신, 실행 이력 기록 (컨트롤러/단일 프로세스에서만, 워커 결과는 xdist가 전달)"""
+        if self.is_worker:
+            return
+
+        # setup 단계에서 실패/건너뛴 테스트는 call 단계가 없으므로 여기서 완료 처리
+        if self.progress is not None and (report.when == "call" or (report.when == "setup" and not report.passed)):
+            self._update_progress(report, dict(report.user_properties))
+
+        if report.when != "call":
+            return
+
+        properties = dict(report.user_properties)
+        if "test_id" not in properties:
+            return
+
+        self.executed_jobs.append((properties["round"], properties["test_id"], properties["category"]))
+        self.test_spans.append((report.start, report.stop))
+
+        if self.history is not None:
+            self.history.record(
+                run_id=os.path.basename(self.output_dir),
+                test_id=properties["test_id"],
+                category=properties["category"],
+                round=properties["round"],
+                outcome=report.outcome,
+                duration=properties.get("duration", report.duration),
+                latency=properties.get("latency")
+            )
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.store.close()
+        if self.history is not None:
+            self.history.close()
+        if self.is_worker or self.collect_only:
+            self._save_profile()
+            return
+
+        if self.progress is not None:
+            self._publish_progress(force=True)
+        if self.metrics_server is not None:
+            self.metrics_server.close()
+
+        with self.profile_phase("report"):
+            self._finish_run()
+        self._save_profile()
+
+    def _finish_run(self):
+        """전체 결과로 리포트 생성 및 통계 출력 (컨트롤러/단일 프로세스)"""
+        logger = logging.getLogger("llm_test")
+        results = self.store.load_all()
+
+        if not results:
+            logger.warning("⚠️ 테스트 결과가 없습니다.")
+            return
+
+        logger.info("\n" + "="*80)
+        logger.info("📊 테스트 완료 - 결과 저장 중...")
+        logger.info("="*80)
+
+        # 라운드 간 답변 일관성 (2라운드 이상일 때), 샘플링 실행이면 전체 통과율 추정
+        # 단일 프로세스 실행은 평가기의 임베딩 캐시 재사용 (xdist 컨트롤러는 평가기가 없으므로 모델 로드)
+        embedding_cache = self.runner.evaluator.embedding_cache if self.runner is not None else None
+        consistency = calculate_run_consistency(results, self.settings, embedding_cache)
+        sampling = estimate_sampling(results, load_suite(QUESTIONS_FILE), self.sampling, self.output_dir)
+
+        # 리포트(Excel/CSV/Parquet) 생성 및 통계 출력 (core/runner.py와 공유)
+        write_reports(results, self.output_dir, self.settings, consistency, sampling, self.answer_store)
+
+        self._report_makespan(logger)
+
+        logger.info("\n✅ 모든 작업 완료!")
+
+    def _save_profile(self):
+        """프로파일 결과 저장 (실행 폴더/profile, xdist 워커는 profile/[워커ID])"""
+        if self.profiler is None:
+            return
+        profile_dir = os.path.join(self.output_dir, "profile")
+        if self.is_worker:
+            profile_dir = os.path.join(profile_dir, self.config.workerinput["workerid"])
+        summary_file = self.profiler.stop(profile_dir)
+        logging.getLogger("llm_test").info(f"🔬 프로파일 저장: {summary_file}")
+
+    def _report_makespan(self, logger):
+        """이번 실행의 예상 전체 실행 시간(이력 기준, 같은 순서·워커 수) vs 실제 실행 시간"""
+        if self.history_snapshot is None or not self.test_spans:
+            return
+
+        workers = getattr(self.config.option, "numprocesses", None)
+        workers = workers if isinstance(workers, int) and workers > 0 else 1
+        default_duration = self.scheduling.get("default_duration", 60)
+
+        suite = load_suite(QUESTIONS_FILE)
+        jobs = [(round_num, suite.get(test_id)) for round_num, test_id, _ in self.executed_jobs if suite.get(test_id)]
+        if self.scheduling.get("strategy", "nodeid") == "lpt":
+            round_major = self.settings.get("sequential", {}).get("enabled", False)
+            durations = [expected for _, expected in order_jobs(jobs, self.history_snapshot, default_duration,
+                                                                round_major=round_major)]
+        else:
+            durations = [self.history_snapshot.expected_duration(tc.id, tc.category, default_duration)
+                         for _, tc in sorted(jobs, key=lambda job: (job[0], job[1].id))]
+
+        # 이력의 소요 시간은 답변 지연 기준이므로 질문 사이 대기(평균)는 따로 더함
+        delay = self.settings.get("delay_between_tests", 0)
+        delay = sum(delay) / 2 if isinstance(delay, list) else delay
+        predicted = simulate_makespan([duration + delay for duration in durations], workers)
+        actual = max(stop for _, stop in self.test_spans) - min(start for start, _ in self.test_spans)
+        logger.info(f"⏱️ 전체 실행 시간: 예상 {_format_duration(predicted)} / 실제 {_format_duration(actual)} "
+                    f"(워커 {workers}개, 순서: {self.scheduling.get('strategy', 'nodeid')})")
+
+
+def _job_key(item):
+    """라운드 → 질문ID 순 정렬 키 (Round10이 Round2보다 뒤에 오도록, 그 외 테스트는 nodeid 순으로 마지막)"""
+    params = getattr(getattr(item, "callspec", None), "params", {})
+    if "test_params" in params:
+        return (0, params["test_params"]["round_num"], params["test_params"]["test_case"].id, item.nodeid)
+    return (1, 0, "", item.nodeid)
+
+
+def _format_duration(seconds):
+    """소요 시간 표시 (2분 미만은 초, 이상은 분)"""
+    return f"{seconds:.1f}초" if seconds < 120 else f"{seconds / 60:.1f}분"
+
+
+def pytest_addoption(parser):
+    """LLM 테스트 실행 옵션"""
+    group = parser.getgroup("llm", "LLM 답변 평가")
+    group.addoption("--llm-sample", default=None,
+                    help="층화 샘플링 실행: 0~1 사이 비율(예: 0.2) 또는 API 호출 수(예: 12)")
+    group.addoption("--llm-sample-seed", type=int, default=None,
+                    help="샘플링 시드 (같은 시드면 같은 질문 선택, 기본: 무작위)")
+    group.addoption("--llm-profile", action="store_true", default=False,
+                    help="단계별 프로파일링 (실행 폴더/profile에 cProfile, folded stacks, 메모리 요약 저장)")
+
+
+def pytest_configure(config):
+    """결과 수집 플러그인 등록"""
+    config.addinivalue_line("markers", "round: 테스트 라운드 마커")
+    config.pluginmanager.register(ResultCollector(config), PLUGIN_NAME)
+
+
+@pytest.fixture(scope="session")
+def result_collector(request):
+    """결과 수집기 fixture"""
+    return request.config.pluginmanager.get_plugin(PLUGIN_NAME)
@@ -0,0 +1,53 @@
+"""
+답변 대기 시간 자동 조정 테스트 (API 호출 없음)
+
+이력이 없으면 기본 대기 시간만 사용하고, 이력 기준일 때만 max_timeout까지 연장 허용
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.test_suite import parse_suite
+from utils.run_history import HistorySnapshot, adaptive_timeout
+
+SETTINGS = {"enabled": True, "quantile": 0.99, "margin": 1.5, "min_samples": 5,
+            "min_timeout": 20, "max_timeout": 300, "default_timeout": 120}
+
+
+def make_test_case():
+    return parse_suite({
+        "settings": {"repeat_count": 1, "delay_between_tests": 0},
+        "test_cases": [{"id": "Q001", "category": "일반지식", "question": "질문 Q001"}]
+    }).get("Q001")
+
+
+def test_default_timeout_without_history():
+    """실행 이력이 없으면 기본 대기 시간, 연장 없음"""
+    assert adaptive_timeout(None, make_test_case(), SETTINGS) == (120, None, "기본값")
+
+
+def test_default_timeout_with_short_history():
+    """이력이 min_samples개 미만이면 기본 대기 시간, 연장 없음"""
+    snapshot = HistorySnapshot({"Q001": [("일반지식", "passed", 10.0, 10.0)] * 3})
+
+    timeout, max_timeout, source = adaptive_timeout(snapshot, make_test_case(), SETTINGS)
+    assert (timeout, max_timeout) == (120, None)
+    assert source.startswith("기본값")
+
+
+def test_history_timeout_allows_extension():
+    """이력 기준이면 p99 × margin (min_timeout 이상), 생성 중인 답변은 max_timeout까지 대기"""
+    snapshot = HistorySnapshot({"Q001": [("일반지식", "passed", 40.0, 40.0)] * 5})
+
+    timeout, max_timeout, source = adaptive_timeout(snapshot, make_test_case(), SETTINGS)
+    assert timeout == 60.0
+    assert max_timeout == 300
+    assert source.startswith("질문 이력")
+
+
+def test_disabled_uses_default_timeout():
+    """설정을 끄면 이력이 있어도 기본 대기 시간"""
+    snapshot = HistorySnapshot({"Q001": [("일반지식", "passed", 40.0, 40.0)] * 5})
+
+    assert adaptive_timeout(snapshot, make_test_case(), dict(SETTINGS, enabled=False)) == (120, None, "기본값")
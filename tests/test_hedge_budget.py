@@ -0,0 +1,57 @@
+"""
+헤지 요청 예산 테스트 (API 호출 없음)
+
+비율 한도(max_ratio)와 분당 한도(per_minute), 실행 초반 최소 1건 허용 확인
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.hedge_budget import HedgeBudget
+
+
+class FakeClock:
+    """수동으로 시각을 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_budget(requests, max_ratio=0.1, per_minute=2):
+    """일반 요청 requests건을 기록한 예산"""
+    clock = FakeClock()
+    budget = HedgeBudget(max_ratio=max_ratio, per_minute=per_minute, clock=clock)
+    for _ in range(requests):
+        budget.record_request()
+    return budget, clock
+
+
+def test_first_hedge_allowed_before_ratio_warms_up():
+    """요청이 1/max_ratio건 미만이어도 첫 헤지 1건은 허용, 두 번째는 비율 한도로 거부"""
+    budget, _ = make_budget(requests=3)
+
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+    assert budget.hedges == 1
+
+
+def test_ratio_limit_after_warm_up():
+    """요청 30건, 비율 10%면 헤지 3건까지 허용 (분당 한도는 충분히 크게)"""
+    budget, _ = make_budget(requests=30, per_minute=10)
+
+    assert [budget.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+def test_per_minute_limit_resets_after_window():
+    """분당 한도를 넘으면 거부, 60초가 지나면 다시 허용"""
+    budget, clock = make_budget(requests=100, per_minute=2)
+
+    assert budget.try_acquire() and budget.try_acquire()
+    assert not budget.try_acquire()
+
+    clock.now = 60.0
+    assert budget.try_acquire()
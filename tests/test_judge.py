@@ -0,0 +1,115 @@
+"""
+LLM 심사 채점기 테스트 (로컬 스텁 서버, API 키/비용 없음)
+
+요청 묶음(batch_size), 채점 결과 재사용, 비용 예산, 응답 검증 확인
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.judge import CostBudget, Judge, JudgeError, StubJudgeServer, VerdictCache
+from core.test_suite import parse_suite
+
+
+@pytest.fixture
+def server():
+    """빈 포트로 띄운 스텁 채점 서버"""
+    server = StubJudgeServer(port=0).start()
+    yield server
+    server.close()
+
+
+def make_items(count):
+    """서로 다른 질문·답변 count개 (스텁 점수 = 답변 길이 // 40, 최대 5)"""
+    suite = parse_suite({
+        "settings": {"repeat_count": 1, "delay_between_tests": 0},
+        "test_cases": [{"id": f"Q{i:03d}", "category": "일반지식", "question": f"질문 {i}"}
+                       for i in range(1, count + 1)]
+    })
+    return [(test_case, "답변" * (i * 10)) for i, test_case in enumerate(suite.test_cases)]
+
+
+def test_batches_split_by_batch_size(server):
+    """답변 7개, batch_size 3 → 요청 3건, 모든 답변 채점"""
+    judge = Judge(server.base_url, "stub", batch_size=3)
+
+    verdicts = judge.score_many(make_items(7))
+
+    assert server.requests == 3
+    assert judge.stats()["judged"] == 7
+    assert [score for score, _ in verdicts] == [min(5, i * 20 // 40) for i in range(7)]
+
+
+def test_second_score_many_served_from_cache(server, tmp_path):
+    """같은 답변을 다시 채점하면 요청 없이 저장된 결과 사용 (새 채점기도 저장소 파일로 재사용)"""
+    items = make_items(4)
+    judge = Judge(server.base_url, "stub", batch_size=2, cache=VerdictCache(str(tmp_path / "judge.sqlite")))
+    first = judge.score_many(items)
+    requests = server.requests
+
+    assert judge.score_many(items) == first
+    assert server.requests == requests
+
+    reopened = Judge(server.base_url, "stub", cache=VerdictCache(str(tmp_path / "judge.sqlite")))
+    assert reopened.score_many(items) == first
+    assert reopened.requests == 0 and server.requests == requests
+    judge.close()
+    reopened.close()
+
+
+def test_cost_budget_refuses_and_counts_skipped(server):
+    """예산을 넘는 요청은 보내지 않고, 해당 답변은 None + 예산 초과로 집계"""
+    judge = Judge(server.base_url, "stub", batch_size=2, budget=CostBudget(0.0, prompt_price=1.0))
+
+    verdicts = judge.score_many(make_items(5))
+
+    assert verdicts == [None] * 5
+    assert server.requests == 0
+    assert judge.stats()["skipped"] == 5
+    assert judge.budget.refused == 3
+
+
+def test_cost_budget_never_exceeded(server):
+    """예산 안에서만 요청 (일부 답변만 채점되어도 사용 비용은 예산 이하)"""
+    budget = CostBudget(2.0, prompt_price=1.0, completion_price=1.0)
+    judge = Judge(server.base_url, "stub", batch_size=1, max_concurrency=1, budget=budget)
+
+    verdicts = judge.score_many(make_items(10))
+
+    judged = sum(verdict is not None for verdict in verdicts)
+    assert 0 < judged < 10
+    assert judge.stats()["skipped"] == 10 - judged
+    assert budget.spent <= 2.0
+
+
+def test_parse_verdicts_drops_invalid():
+    """범위를 벗어난 id/점수, 소수/불리언/문자열 점수, id 없는 항목은 제외"""
+    judge = Judge("http://127.0.0.1:1/v1", "stub", max_score=5)
+    content = """```json
+    {"verdicts": [
+        {"id": 1, "score": 4, "reason": "정확함"},
+        {"id": 2, "score": 6},
+        {"id": 3, "score": -1},
+        {"id": 4, "score": 2.5},
+        {"id": 5, "score": true},
+        {"id": 6, "score": "3"},
+        {"score": 3},
+        {"id": 9, "score": 3},
+        {"id": "7", "score": 5.0}
+    ]}
+    ```"""
+
+    parsed = judge._parse_verdicts(content, 8)
+
+    assert parsed == {1: (4, "LLM 심사: 정확함"), 7: (5, "LLM 심사: 근거 없음")}
+
+
+def test_parse_verdicts_malformed_response():
+    """JSON이 없거나 verdicts가 없으면 응답 형식 오류"""
+    judge = Judge("http://127.0.0.1:1/v1", "stub")
+    for content in ("채점할 수 없습니다", '{"result": []}', "{not json}"):
+        with pytest.raises(JudgeError):
+            judge._parse_verdicts(content, 1)
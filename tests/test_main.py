@@ -1,32 +1,18 @@
 """
 pytest 메인 테스트 파일 (10개 질문 × 2회 반복, 랜덤 딜레이)
+
+질문 실행 로직은 core/runner.py의 SuiteRunner (pytest 없이 실행: python -m core.runner)
 """
 import pytest
-import json
-import time
-import random
-from datetime import datetime
 import sys
 import os
+import time
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from core.session_manager import SessionManager
-from core.api_client import APIClient
-from core.evaluator import Evaluator
-from reports.report_generator import generate_excel_report, save_detailed_answers_csv
-from utils.logger import setup_logger, log_test_start, log_test_result, log_test_error
-from utils.scoring import calculate_statistics, print_statistics, calculate_category_statistics, print_category_statistics
-
-# 설정
-BASE_API_V1 = "https://api.myalan.ai/api/v1"
-BASE_API_V2 = "https://api.myalan.ai/api/v2"
-PERSONA_ID = "67a8266697ac2b9de6c51edf"
-COOKIE_FILE = "cookies.json"
-
-# 전역 변수 (테스트 결과 수집용)
-all_results = []
+from core.runner import LoginError, QUESTIONS_FILE, SuiteRunner
+from core.test_suite import load_suite
 
 
 class TestLLMEvaluation:
@@ -34,188 +20,111 @@ class TestLLMEvaluation:
     
     @classmethod
     def setup_class(cls):
-        """테스트 클래스 초기화"""
-        print("\n" + "="*80)
-        print("🤖 LLM 답변 평가 자동화 테스트 시작")
-        print("="*80)
-        
-        # 로거 설정
-        cls.logger = setup_logger()
-        cls.logger.info("테스트 시스템 초기화 중...")
-        
-        # 설정 로드
-        with open("config/test_questions.json", "r", encoding="utf-8") as f:
-            cls.test_data = json.load(f)
-        
-        cls.settings = cls.test_data["settings"]
-        cls.test_cases = cls.test_data["test_cases"]
-        cls.repeat_count = cls.settings["repeat_count"]
-        cls.delay_between_tests = cls.settings["delay_between_tests"]
-        cls.delay_between_rounds = cls.settings.get("delay_between_rounds", 5)
-        
-        cls.logger.info(f"테스트 케이스 수: {len(cls.test_cases)}개")
-        cls.logger.info(f"반복 횟수: {cls.repeat_count}회")
-        
-        # 예상 소요 시간 계산
-        if isinstance(cls.delay_between_tests, list):
-            avg_delay = sum(cls.delay_between_tests) / 2
-        else:
-            avg_delay = cls.delay_between_tests
-        
-        total_time = (len(cls.test_cases) - 1) * avg_delay * cls.repeat_count + cls.delay_between_rounds * (cls.repeat_count - 1)
-        cls.logger.info(f"예상 소요 시간: 약 {int(total_time / 60)}분")
-        
-        # 세션 매니저 초기화
-        cls.session_manager = SessionManager(COOKIE_FILE)
-        cls.session_manager.load_session()
-        
-        # 로그인 확인
-        success, user_name = cls.session_manager.check_login(BASE_API_V2)
-        if not success:
-            cls.logger.error("❌ 로그인 실패. cookies.json을 확인하세요.")
-            pytest.exit("로그인 실패")
-        
-        cls.logger.info(f"✅ 로그인 성공: {user_name} (ID: {cls.session_manager.get_user_id()})")
-        
-        # API 클라이언트 초기화
-        cls.api_client = APIClient(
-            session=cls.session_manager.session,
-            base_api_v1=BASE_API_V1,
-            base_api_v2=BASE_API_V2,
-            persona_id=PERSONA_ID,
-            user_id=cls.session_manager.get_user_id()
-        )
-        
-        # 평가자 초기화
-        cls.evaluator = Evaluator("config/evaluation_criteria.json")
-        
-        cls.logger.info("✅ 테스트 시스템 초기화 완료\n")
+        """테스트 클래스 초기화 (프로파일링 모드에서는 session_load 단계로 측정)"""
+        with cls.result_collector.profile_phase("session_load"):
+            try:
+                cls.runner = SuiteRunner(
+                    load_suite(QUESTIONS_FILE),
+                    answer_store=cls.result_collector.answer_store,
+                    history_snapshot=cls.result_collector.history_snapshot,
+                    profile_phase=cls.result_collector.profile_phase
+                )
+            except LoginError:
+                pytest.exit("로그인 실패")
+        # 세션 종료 시 일관성 분석에서 평가기 임베딩 캐시 재사용 (tests/conftest.py)
+        cls.result_collector.runner = cls.runner
     
-    def test_llm_response(self, test_params):
+    def test_llm_response(self, test_params, record_property):
         """
         LLM 답변 평가 테스트 (동적 파라미터)
         
         Args:
             test_params: pytest fixture (round_num, test_case 포함)
+            record_property: pytest fixture (실행 이력 기록용 정보 전달, tests/conftest.py 참고)
         """
         # 파라미터 가져오기
         round_num = test_params['round_num']
         test_case = test_params['test_case']
         
-        # 로그 시작
-        log_test_start(self.logger, test_case['id'], test_case['question'], round_num)
-        
-        # 1. 채널 생성 및 질문 전송
-        success, answer, error_msg = self.api_client.execute_test(test_case['question'])
-        
-        if not success:
-            log_test_error(self.logger, test_case['id'], error_msg)
-            pytest.fail(f"테스트 실패: {error_msg}")
-        
-        self.logger.info(f"💬 답변 수신 완료 ({len(answer)}자)")
+        # 1. 질문 전송 → 답변 수신 → 평가 (조기 판정/서킷 열림이면 건너뜀)
+        started = time.time()
+        outcome = self.runner.run_case(test_case, round_num)
+        if outcome.status == "skipped":
+            pytest.skip(outcome.reason)
         
-        # 2. 답변 평가
-        evaluation = self.evaluator.evaluate_answer(test_case, answer)
+        # 실행 이력 (질문별 소요 시간/답변 지연 → 다음 실행의 실행 순서 결정, 다음 테스트 전 대기는 제외)
+        if outcome.attempted:
+            record_property("duration", time.time() - started)
+            record_property("test_id", test_case.id)
+            record_property("category", test_case.category)
+            record_property("round", round_num)
+            record_property("latency", outcome.latency)
         
-        # 로그 결과
-        log_test_result(self.logger, test_case['id'], evaluation, len(answer))
+        if outcome.status == "error":
+            pytest.fail(f"테스트 실패: {outcome.reason}")
         
-        # 3. 결과 저장
-        result = {
-            "test_id": test_case['id'],
-            "round": round_num,
-            "question": test_case['question'],
-            "category": test_case['category'],
-            "answer": answer,
-            "evaluation": evaluation,
-            "timestamp": datetime.now().isoformat()
-        }
+        evaluation = outcome.result.evaluation
+        record_property("passed", evaluation.passed)
         
-        all_results.append(result)
+        # 2. 결과 저장 (공유 저장소에 기록, 리포트는 세션 종료 시 tests/conftest.py에서 생성)
+        self.result_collector.record(outcome.result)
         
-        # 4. 랜덤 대기 (다음 테스트 전)
-        if self.delay_between_tests:
-            # 리스트면 랜덤, 숫자면 그대로
-            if isinstance(self.delay_between_tests, list):
-                delay = random.randint(self.delay_between_tests[0], self.delay_between_tests[1])
-            else:
-                delay = self.delay_between_tests
-            
-            self.logger.info(f"⏳ 다음 테스트까지 {delay}초 대기...\n")
-            time.sleep(delay)
+        # 3. 랜덤 대기 (다음 테스트 전)
+        self.runner.wait_between_tests()
         
         # Assertion (pytest fail 처리)
-        assert evaluation['pass'], f"평가 실패: 총점 {evaluation['total_score']}/{evaluation['max_score']}점"
+        assert evaluation.passed, f"평가 실패: 총점 {evaluation.total_score}/{evaluation.max_score}점"
     
     @classmethod
     def teardown_class(cls):
-        """테스트 클래스 종료 처리"""
-        if not all_results:
-            cls.logger.warning("⚠️ 테스트 결과가 없습니다.")
-            return
-        
-        cls.logger.info("\n" + "="*80)
-        cls.logger.info("📊 테스트 완료 - 결과 저장 중...")
-        cls.logger.info("="*80)
-        
-        # 타임스탬프 폴더 생성
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_dir = f"output/{timestamp}"
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Excel 리포트 생성
-        generate_excel_report(all_results, f"{output_dir}/test_results.xlsx")
-        cls.logger.info(f"✅ Excel 리포트 생성: {output_dir}/test_results.xlsx")
-        
-        # 상세 답변 CSV 저장
-        save_detailed_answers_csv(all_results, f"{output_dir}/detailed_answers.csv")
-        cls.logger.info(f"✅ 상세 답변 CSV 저장: {output_dir}/detailed_answers.csv")
+        """테스트 클래스 종료 처리 (리포트 생성은 세션 종료 시 한 번만 수행)"""
+        # 조기 종료된 답변은 리포트용 전체 원문 조회
+        for result in cls.runner.complete_early_terminated_answers(cls.result_collector.local_results):
+            cls.result_collector.record(result)
         
-        # 통계 출력
-        stats = calculate_statistics(all_results)
-        print_statistics(stats)
-        
-        # 카테고리별 통계
-        category_stats = calculate_category_statistics(all_results)
-        print_category_statistics(category_stats)
-        
-        cls.logger.info("\n✅ 모든 작업 완료!")
+        cls.runner.log_answer_reuse()
 
 
-def pytest_configure(config):
-    """pytest 설정 커스터마이징"""
-    # 테스트 케이스 로드
-    with open("config/test_questions.json", "r", encoding="utf-8") as f:
-        test_data = json.load(f)
-    
-    config.test_cases = test_data["test_cases"]
-    config.addinivalue_line("markers", "round: 테스트 라운드 마커")
+@pytest.fixture(scope="class", autouse=True)
+def bind_result_collector(request, result_collector):
+    """테스트 클래스에 결과 수집기 연결"""
+    if request.cls is not None:
+        request.cls.result_collector = result_collector
 
 
 def pytest_generate_tests(metafunc):
     """동적으로 테스트 파라미터 생성"""
     if "test_params" in metafunc.fixturenames:
-        # 설정 파일 로드
-        import json
-        with open("config/test_questions.json", "r", encoding="utf-8") as f:
-            test_data = json.load(f)
-        
-        repeat_count = test_data["settings"]["repeat_count"]
-        test_cases = test_data["test_cases"]
+        # 설정 파일 로드 (파일이 바뀌지 않았으면 캐시 사용)
+        suite = load_suite(QUESTIONS_FILE)
+        repeat_count = suite.settings["repeat_count"]
+        
+        # 조기 판정 모드: 추가 라운드(max_rounds까지)도 생성 (실행 여부는 테스트 시작 시 결정)
+        # 같은 질문의 라운드는 한 워커에서 실행되도록 xdist_group 지정 (pytest -n N --dist loadgroup)
+        sequential = suite.settings.get("sequential", {})
+        round_count = repeat_count
+        marks = lambda test_case: ()
+        if sequential.get("enabled", False):
+            round_count = max(repeat_count, sequential.get("max_rounds", repeat_count))
+            marks = lambda test_case: (pytest.mark.xdist_group(test_case.id),)
+        
+        # 샘플링 모드면 카테고리별 층화 샘플만 실행 (tests/conftest.py)
+        test_cases = metafunc.config.pluginmanager.get_plugin("llm_result_collector").select_test_cases(suite)
         
         # 파라미터 조합 생성
         params = []
-        for round_num in range(1, repeat_count + 1):
+        for round_num in range(1, round_count + 1):
             for test_case in test_cases:
-                params.append({
-                    'round_num': round_num,
-                    'test_case': test_case
-                })
-        
-        # 테스트 ID 생성
-        ids = [f"Round{p['round_num']}-{p['test_case']['id']}" for p in params]
-        
-        metafunc.parametrize("test_params", params, ids=ids)
+                params.append(pytest.param(
+                    {
+                        'round_num': round_num,
+                        'test_case': test_case
+                    },
+                    id=f"Round{round_num}-{test_case.id}",
+                    marks=marks(test_case)
+                ))
+        
+        metafunc.parametrize("test_params", params)
 
 
 @pytest.fixture
@@ -223,8 +132,3 @@ def test_params(request):
     """테스트 파라미터 fixture"""
     return request.param
 
-
-def pytest_collection_modifyitems(config, items):
-    """테스트 아이템 수정 (정렬 등)"""
-    # 라운드 순서대로 정렬
-    items.sort(key=lambda item: item.nodeid)
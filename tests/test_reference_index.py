@@ -0,0 +1,85 @@
+"""
+골든 답변 인덱스 테스트 (고정 벡터 인코더, 모델 호출 없음)
+
+질문별 최근접 골든 답변, 전체 검색 순서, 인덱스 파일 재사용/재생성 확인
+"""
+import json
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.embedding_cache import EmbeddingCache
+from core.reference_index import ReferenceIndex
+
+# 텍스트 → 고정 벡터 (정규화 전)
+VECTORS = {
+    "서울 맑음": [1.0, 0.0, 0.0],
+    "서울 흐림": [0.6, 0.8, 0.0],
+    "부산 비": [0.0, 0.0, 2.0],
+    "8760": [0.0, 1.0, 0.0],
+}
+GOLDEN = {"Q001": ["서울 맑음", "서울 흐림"], "Q002": ["부산 비"], "Q003": []}
+
+
+class FixedEncoder:
+    """VECTORS에 정의한 벡터를 돌려주는 인코더 (호출 횟수 기록)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts, convert_to_numpy=True, **kwargs):
+        self.calls += 1
+        if isinstance(texts, str):
+            return np.array(VECTORS[texts], dtype=np.float32)
+        return np.array([VECTORS[text] for text in texts], dtype=np.float32)
+
+
+def make_cache(encoder=None, model_name="fixed"):
+    return EmbeddingCache(encoder or FixedEncoder(), model_name=model_name)
+
+
+def test_nearest_within_question():
+    """질문의 골든 답변 구간에서만 가장 가까운 답변 (골든 답변이 없는 질문은 None)"""
+    index = ReferenceIndex.build(GOLDEN, make_cache())
+
+    similarity, best = index.nearest("Q001", [0.0, 1.0, 0.0])
+    assert best == 1 and np.isclose(similarity, 0.8)
+    similarity, best = index.nearest("Q002", [0.0, 0.0, 5.0])
+    assert best == 0 and np.isclose(similarity, 1.0)
+    assert index.nearest("Q003", [1.0, 0.0, 0.0]) is None
+    assert "Q003" not in index and len(index) == 3
+
+
+def test_search_orders_all_golden_answers():
+    """전체 검색은 질문 구분 없이 유사도 순, 질문ID/원문 함께 반환"""
+    index = ReferenceIndex.build(GOLDEN, make_cache())
+
+    results = index.search([1.0, 0.1, 0.0], top_k=5)
+
+    assert [(test_id, text) for _, test_id, text in results] == [
+        ("Q001", "서울 맑음"), ("Q001", "서울 흐림"), ("Q002", "부산 비")]
+    assert results[0][0] >= results[1][0] >= results[2][0]
+    assert ReferenceIndex.build({}, make_cache()).search([1.0, 0.0, 0.0]) == []
+
+
+def test_load_or_build_reuses_saved_index(tmp_path):
+    """같은 골든 답변·모델이면 저장된 인덱스 재사용, 골든 답변이 바뀌면 다시 생성"""
+    golden_file = tmp_path / "golden.json"
+    index_file = str(tmp_path / "reference_index.npz")
+    golden_file.write_text(json.dumps({"golden_answers": GOLDEN}, ensure_ascii=False), encoding="utf-8")
+
+    first = ReferenceIndex.load_or_build(str(golden_file), make_cache(), index_file)
+    encoder = FixedEncoder()
+    reloaded = ReferenceIndex.load_or_build(str(golden_file), make_cache(encoder), index_file)
+    assert encoder.calls == 0
+    assert reloaded.digest == first.digest and reloaded.texts == first.texts
+    assert np.allclose(reloaded.vectors, first.vectors)
+
+    golden_file.write_text(json.dumps({"golden_answers": dict(GOLDEN, Q004=["8760"])}, ensure_ascii=False),
+                           encoding="utf-8")
+    rebuilt = ReferenceIndex.load_or_build(str(golden_file), make_cache(encoder), index_file)
+    assert encoder.calls == 1
+    assert "Q004" in rebuilt and rebuilt.digest != first.digest
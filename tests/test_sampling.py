@@ -0,0 +1,68 @@
+"""
+층화 샘플링 통과율 추정 테스트 (API 호출 없음)
+
+같은 질문의 라운드는 하나의 표본으로 보고 질문 수 기준으로 신뢰구간을 계산하는지 확인
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.results import EvaluationResult, TestResult
+from utils.sampling import estimate_pass_rates
+
+
+def make_results(outcomes):
+    """{(카테고리, 질문ID): [라운드별 통과 여부]} → TestResult 리스트"""
+    results = []
+    for (category, test_id), rounds in outcomes.items():
+        for round_num, passed in enumerate(rounds, start=1):
+            evaluation = EvaluationResult((), (), int(passed), 1, passed, category)
+            results.append(TestResult(test_id, round_num, "질문", category, "답변", evaluation, "2026-01-01"))
+    return results
+
+
+def outcomes(repeat):
+    """카테고리 A: 질문 4개 중 3개 통과, B: 질문 2개 중 1개 통과 (라운드마다 같은 결과)"""
+    return {
+        ("A", "Q001"): [True] * repeat, ("A", "Q002"): [True] * repeat,
+        ("A", "Q003"): [True] * repeat, ("A", "Q004"): [False] * repeat,
+        ("B", "Q005"): [True] * repeat, ("B", "Q006"): [False] * repeat,
+    }
+
+
+def test_repeated_rounds_do_not_narrow_interval():
+    """라운드를 4번 반복해도 질문 수가 같으면 추정치와 신뢰구간이 같음"""
+    population = {"A": 10, "B": 10}
+    single = estimate_pass_rates(make_results(outcomes(1)), population)
+    repeated = estimate_pass_rates(make_results(outcomes(4)), population)
+
+    assert repeated["overall"] == pytest.approx(single["overall"])
+    for category in population:
+        for field in ("sampled", "rate", "lower", "upper"):
+            assert repeated["categories"][category][field] == pytest.approx(single["categories"][category][field])
+    assert repeated["categories"]["A"]["total"] == 16
+
+
+def test_rate_is_mean_of_question_pass_rates():
+    """라운드 수가 다른 질문도 질문별 통과율의 평균으로 집계 (라운드가 많은 질문에 치우치지 않음)"""
+    results = make_results({("A", "Q001"): [True] * 6, ("A", "Q002"): [False, True]})
+
+    stats = estimate_pass_rates(results, {"A": 2})["categories"]["A"]
+
+    assert stats["rate"] == pytest.approx((1.0 + 0.5) / 2)
+    assert (stats["sampled"], stats["passed"], stats["total"]) == (2, 7, 8)
+
+
+def test_full_census_has_no_sampling_error():
+    """모든 질문을 실행하면 (유한 모집단 보정) 전체 추정 구간 폭 0, 샘플이 없는 카테고리는 제외"""
+    results = make_results(outcomes(2))
+
+    estimate = estimate_pass_rates(results, {"A": 4, "B": 2, "C": 5})
+
+    overall = estimate["overall"]
+    assert overall["lower"] == pytest.approx(overall["rate"]) == pytest.approx(overall["upper"])
+    assert overall["rate"] == pytest.approx(4 / 6 * 0.75 + 2 / 6 * 0.5)
+    assert estimate["categories"]["C"]["rate"] is None
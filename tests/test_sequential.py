@@ -0,0 +1,77 @@
+"""
+반복 라운드 조기 판정 + LPT 실행 순서 테스트 (API 호출 없음)
+
+조기 판정으로 절약한 기본 라운드가 경계 질문의 추가 라운드로 배분되는지 확인
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.runner import plan_jobs
+from core.test_suite import parse_suite
+from utils.run_history import HistorySnapshot
+from utils.sequential import SequentialRounds
+
+SEQUENTIAL = {"enabled": True, "method": "sprt", "min_rounds": 2, "max_rounds": 6,
+              "p0": 0.5, "p1": 0.9, "alpha": 0.1, "beta": 0.1}
+
+
+def make_suite(sequential):
+    """경계 질문 Q001(가장 오래 걸림) + 항상 실패하는 질문 Q002/Q003, 기본 4라운드"""
+    return parse_suite({
+        "settings": {"repeat_count": 4, "delay_between_tests": 0, "sequential": sequential,
+                     "scheduling": {"strategy": "lpt", "default_duration": 60}},
+        "test_cases": [{"id": test_id, "category": "일반지식", "question": f"질문 {test_id}"}
+                       for test_id in ("Q001", "Q002", "Q003")]
+    })
+
+
+def make_snapshot():
+    """Q001 답변이 가장 오래 걸리는 이력"""
+    return HistorySnapshot({
+        "Q001": [("일반지식", "passed", 120.0, 120.0)],
+        "Q002": [("일반지식", "failed", 30.0, 30.0)],
+        "Q003": [("일반지식", "failed", 20.0, 20.0)],
+    })
+
+
+def run_jobs(jobs, rounds):
+    """실행 순서대로 라운드 실행 여부를 결정하고 결과 기록 (Q001은 PASS/FAIL 번갈아, 나머지는 항상 FAIL)"""
+    executed = []
+    for round_num, test_case in jobs:
+        should_run, _ = rounds.should_run(test_case.id, round_num)
+        if not should_run:
+            continue
+        executed.append((round_num, test_case.id))
+        rounds.record(test_case.id, test_case.id == "Q001" and round_num % 2 == 1)
+    return executed
+
+
+def test_lpt_order_keeps_rounds_when_sequential():
+    """조기 판정 모드: 라운드 순서 유지, 라운드 안에서는 오래 걸리는 질문 먼저"""
+    jobs = plan_jobs(make_suite(SEQUENTIAL), make_suite(SEQUENTIAL).test_cases, make_snapshot())
+
+    assert [round_num for round_num, _ in jobs] == sorted(round_num for round_num, _ in jobs)
+    assert [tc.id for round_num, tc in jobs if round_num == 1] == ["Q001", "Q002", "Q003"]
+
+
+def test_lpt_order_reallocates_saved_rounds():
+    """LPT 순서에서도 먼저 실행되는 경계 질문이 절약한 라운드로 추가 라운드를 받음"""
+    suite = make_suite(SEQUENTIAL)
+    rounds = SequentialRounds(SEQUENTIAL, repeat_count=4)
+
+    executed = run_jobs(plan_jobs(suite, suite.test_cases, make_snapshot()), rounds)
+
+    # Q002/Q003은 2라운드 만에 FAIL 판정 → 3, 4라운드(4회) 절약 → Q001의 5, 6라운드에 배분
+    assert rounds.saved == 4
+    assert (5, "Q001") in executed and (6, "Q001") in executed
+    assert rounds.extra == 2
+
+
+def test_lpt_order_without_sequential():
+    """조기 판정을 끄면 기존 LPT 그대로 (오래 걸리는 질문의 모든 라운드 먼저)"""
+    suite = make_suite({"enabled": False})
+    jobs = plan_jobs(suite, suite.test_cases, make_snapshot())
+
+    assert [(round_num, tc.id) for round_num, tc in jobs[:4]] == [(1, "Q001"), (2, "Q001"), (3, "Q001"), (4, "Q001")]
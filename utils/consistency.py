@@ -0,0 +1,134 @@
+"""
+라운드 간 답변 일관성 분석 모듈
+
+같은 질문을 repeat_count회 반복한 답변들을 한 번에 임베딩하고,
+질문별 코사인 유사도 행렬(numpy 행렬곱)로 평균/최소 일관성과 이상 라운드를 계산
+"""
+import numpy as np
+
+from core.results import as_test_result
+
+
+def similarity_matrix(embeddings):
+    """
+    코사인 유사도 행렬
+
+    Args:
+        embeddings (np.ndarray): (n, d) 임베딩 행렬
+
+    Returns:
+        np.ndarray: (n, n) 유사도 행렬
+    """
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    normalized = embeddings / np.where(norms == 0, 1, norms)
+    return normalized @ normalized.T
+
+
+def summarize_matrix(matrix, outlier_z=2.0):
+    """
+    유사도 행렬 요약 (대각선 제외)
+
+    Args:
+        matrix (np.ndarray): (n, n) 유사도 행렬 (n >= 2)
+        outlier_z (float): 라운드 평균 유사도가 (전체 평균 - outlier_z × 표준편차)보다 낮으면 이상 라운드
+
+    Returns:
+        dict: mean, min, round_means (라운드별 다른 라운드와의 평균 유사도), outliers (인덱스 리스트)
+    """
+    n = matrix.shape[0]
+    off_diagonal = ~np.eye(n, dtype=bool)
+
+    round_means = (matrix.sum(axis=1) - np.diag(matrix)) / (n - 1)
+    outliers = []
+    if n >= 3:
+        spread = round_means.std()
+        if spread > 0:
+            outliers = np.flatnonzero(round_means < round_means.mean() - outlier_z * spread).tolist()
+
+    return {
+        "mean": float(matrix[off_diagonal].mean()),
+        "min": float(matrix[off_diagonal].min()),
+        "round_means": round_means.tolist(),
+        "outliers": outliers,
+    }
+
+
+def calculate_consistency(results, embedding_cache, outlier_z=2.0):
+    """
+    질문별/카테고리별 라운드 간 답변 일관성 계산
+
+    Args:
+        results (list): 테스트 결과 리스트 (TestResult 또는 dict)
+        embedding_cache (EmbeddingCache): 답변 임베딩에 사용할 캐시 (encode_many로 한 번에 계산)
+        outlier_z (float): 이상 라운드 판정 기준 (표준편차 배수)
+
+    Returns:
+        dict: {"questions": {질문ID: 통계}, "categories": {카테고리: 통계}}
+              (2라운드 이상 답변이 있는 질문만 포함)
+    """
+    groups = {}
+    for result in results:
+        result = as_test_result(result)
+        groups.setdefault(result.test_id, []).append(result)
+
+    groups = {test_id: sorted(group, key=lambda r: r.round) for test_id, group in groups.items() if len(group) >= 2}
+    if not groups:
+        return {"questions": {}, "categories": {}}
+
+    # 모든 답변을 한 번에 임베딩 (같은 답변은 캐시에서 한 번만 계산)
+    answers = [r.answer or "" for group in groups.values() for r in group]
+    embeddings = np.asarray(embedding_cache.encode_many(answers), dtype=np.float32)
+
+    questions = {}
+    offset = 0
+    for test_id, group in groups.items():
+        n = len(group)
+        summary = summarize_matrix(similarity_matrix(embeddings[offset:offset + n]), outlier_z)
+        offset += n
+
+        rounds = [r.round for r in group]
+        questions[test_id] = {
+            "category": group[0].category,
+            "rounds": n,
+            "mean": summary["mean"],
+            "min": summary["min"],
+            "round_means": dict(zip(rounds, summary["round_means"])),
+            "outlier_rounds": [rounds[i] for i in summary["outliers"]],
+        }
+
+    categories = {}
+    for stats in questions.values():
+        category = categories.setdefault(stats["category"], {"questions": 0, "means": [], "min": 1.0, "outlier_rounds": 0})
+        category["questions"] += 1
+        category["means"].append(stats["mean"])
+        category["min"] = min(category["min"], stats["min"])
+        category["outlier_rounds"] += len(stats["outlier_rounds"])
+
+    for category in categories.values():
+        category["mean"] = float(np.mean(category.pop("means")))
+
+    return {"questions": questions, "categories": categories}
+
+
+def print_consistency(consistency):
+    """일관성 통계 출력"""
+    if not consistency["questions"]:
+        return
+
+    print("\n" + "="*80)
+    print("🔁 라운드 간 답변 일관성")
+    print("="*80)
+
+    for category, stats in consistency["categories"].items():
+        print(f"\n[{category}]")
+        print(f"  질문 수: {stats['questions']}개")
+        print(f"  평균 일관성: {stats['mean']:.3f} | 최소: {stats['min']:.3f}")
+        print(f"  이상 라운드: {stats['outlier_rounds']}개")
+
+    unstable = sorted(consistency["questions"].items(), key=lambda item: item[1]["mean"])[:5]
+    print("\n일관성이 낮은 질문:")
+    for test_id, stats in unstable:
+        outliers = ", ".join(f"Round{r}" for r in stats["outlier_rounds"]) or "-"
+        print(f"  {test_id} ({stats['category']}) 평균 {stats['mean']:.3f}, 최소 {stats['min']:.3f}, 이상 라운드: {outliers}")
+
+    print("="*80)
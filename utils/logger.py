@@ -1,18 +1,54 @@
 """
 로깅 유틸리티 모듈
+
+큐 모드(queue_mode=True)에서는 로그 호출은 큐에 레코드를 넣기만 하고,
+파일/콘솔 기록은 QueueListener의 백그라운드 스레드 1개가 담당함
 """
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 from datetime import datetime
 import os
 
+from core.results import SAFETY_INDEX, as_evaluation_result
+
+
+# 로거 이름 → 실행 중인 QueueListener
+_listeners = {}
+
+# JSON 로그에 포함하지 않는 LogRecord 기본 속성
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 레코드를 JSON 1줄로 변환 (extra로 넘긴 필드 포함)"""
+
+    def format(self, record):
+        data = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
 
-def setup_logger(name="llm_test", log_dir="output/logs"):
+def setup_logger(name="llm_test", log_dir="output/logs", queue_mode=False, json_lines=False):
     """
     로거 설정
     
     Args:
-        name (str): 로거 이름
+        name (str): 로거 이름 (core 모듈은 하위 로거 llm_test.* 로 기록)
         log_dir (str): 로그 파일 저장 디렉토리
+        queue_mode (bool): True면 QueueHandler로 기록하고 백그라운드 스레드에서 파일/콘솔 출력
+        json_lines (bool): True면 같은 이름의 .jsonl 파일에 구조화 로그 추가 기록
     
     Returns:
         logging.Logger: 설정된 로거 객체
@@ -25,6 +61,7 @@ def setup_logger(name="llm_test", log_dir="output/logs"):
     logger.setLevel(logging.DEBUG)
     
     # 이미 핸들러가 있으면 제거 (중복 방지)
+    shutdown_logger(name)
     if logger.handlers:
         logger.handlers.clear()
     
@@ -45,37 +82,78 @@ def setup_logger(name="llm_test", log_dir="output/logs"):
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
     
+    handlers = [file_handler, console_handler]
+    
+    # 구조화 로그 (JSON Lines)
+    if json_lines:
+        json_handler = logging.FileHandler(log_filename.replace(".log", ".jsonl"), encoding='utf-8')
+        json_handler.setLevel(logging.DEBUG)
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+    
     # 핸들러 추가
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    if queue_mode:
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
     
     return logger
 
 
+def shutdown_logger(name="llm_test"):
+    """큐 모드 백그라운드 기록 종료 (남은 로그를 모두 기록한 뒤 반환)"""
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+@atexit.register
+def _shutdown_all():
+    for name in list(_listeners):
+        shutdown_logger(name)
+
+
 def log_test_start(logger, test_id, question, round_num):
     """테스트 시작 로그"""
     logger.info("="*80)
-    logger.info(f"🧪 테스트 시작: {test_id} (Round {round_num})")
+    logger.info(f"🧪 테스트 시작: {test_id} (Round {round_num})",
+                extra={"event": "test_start", "test_id": test_id, "round": round_num})
     logger.info(f"📝 질문: {question}")
     logger.info("="*80)
 
 
 def log_test_result(logger, test_id, evaluation, answer_length):
     """테스트 결과 로그"""
-    logger.info(f"✅ 테스트 완료: {test_id}")
+    evaluation = as_evaluation_result(evaluation)
+    logger.info(f"✅ 테스트 완료: {test_id}", extra={
+        "event": "test_result",
+        "test_id": test_id,
+        "answer_length": answer_length,
+        "scores": dict(evaluation.scores),
+        "total_score": evaluation.total_score,
+        "max_score": evaluation.max_score,
+        "pass": evaluation.passed,
+    })
     logger.info(f"답변 길이: {answer_length}자")
-    logger.info(f"총점: {evaluation['total_score']}/{evaluation['max_score']}점")
+    logger.info(f"총점: {evaluation.total_score}/{evaluation.max_score}점")
     
-    if evaluation['pass']:
+    if evaluation.passed:
         logger.info("결과: ✅ PASS")
     else:
-        if evaluation['scores']['안전성'] == 0:
+        if evaluation.score_values[SAFETY_INDEX] == 0:
             logger.warning("결과: ❌ FAIL (안전성 0점 - 자동 실패)")
         else:
-            logger.warning(f"결과: ❌ FAIL (총점 {evaluation['total_score']}점)")
+            logger.warning(f"결과: ❌ FAIL (총점 {evaluation.total_score}점)")
 
 
 def log_test_error(logger, test_id, error_msg):
     """테스트 에러 로그"""
-    logger.error(f"❌ 테스트 실패: {test_id}")
+    logger.error(f"❌ 테스트 실패: {test_id}", extra={"event": "test_error", "test_id": test_id, "error": error_msg})
     logger.error(f"에러: {error_msg}")
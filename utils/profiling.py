@@ -0,0 +1,193 @@
+"""
+실행 프로파일링 모듈 (--llm-profile / run_test.py --profile)
+
+실행 단계별로 어디서 시간이 걸리는지 확인
+    - session_load: 세션/평가기 초기화 (쿠키, 임베딩 모델 로드)
+    - collection: 테스트 수집 (질문셋 로드, 파라미터 생성)
+    - api_wait: 질문 전송 ~ 답변 수신 (수신 중 점진 평가 포함)
+    - evaluation: 답변 평가 마무리
+    - report: 리포트 생성 (Excel/CSV/Parquet, 통계)
+
+단계별로 cProfile(.prof), 샘플링 프로파일(flamegraph용 folded stacks), tracemalloc 메모리 정보를 기록하고
+실행 폴더의 profile/ 아래에 저장 (xdist 워커는 profile/[워커ID]/)
+"""
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+PHASES = ("session_load", "collection", "api_wait", "evaluation", "report")
+
+
+class RunProfiler:
+    """단계별 프로파일러 (단계는 중첩 가능, cProfile 결과에서는 안쪽 단계 구간을 바깥 단계에서 제외)"""
+
+    def __init__(self, sample_interval=0.005, top_n=30):
+        """
+        Args:
+            sample_interval (float): 스택 샘플링 간격(초)
+            top_n (int): 요약 파일에 출력할 함수/메모리 위치 수
+        """
+        self.sample_interval = sample_interval
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        self._stack = []            # 진행 중인 단계 (이름, 시작 시각)
+        self._profiles = {}         # 단계 → cProfile.Profile
+        self._timings = {}          # 단계 → {"count", "seconds", "peak", "net"}
+        self._memory_diffs = {}     # 단계 → 첫 실행의 tracemalloc 스냅샷 차이 (상위 N개)
+        self._samples = Counter()   # folded stack → 샘플 수
+        self._stop = threading.Event()
+        self._sampler = None
+        self._thread_id = threading.get_ident()
+
+    def start(self):
+        """프로파일링 시작 (메모리 추적 + 스택 샘플링 스레드)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._sampler = threading.Thread(target=self._sample_loop, name="llm-profiler", daemon=True)
+        self._sampler.start()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        단계 구간 측정
+
+        Args:
+            name (str): 단계 이름 (PHASES 참고)
+        """
+        outer = self._stack[-1][0] if self._stack else None
+        if outer is not None:
+            self._profiles[outer].disable()
+
+        profile = self._profiles.setdefault(name, cProfile.Profile())
+        first_run = name not in self._timings
+        before = tracemalloc.take_snapshot() if first_run else None
+        memory_before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+        with self._lock:
+            self._stack.append((name, time.perf_counter()))
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                _, started = self._stack.pop()
+            elapsed = time.perf_counter() - started
+            current, peak = tracemalloc.get_traced_memory()
+
+            timing = self._timings.setdefault(name, {"count": 0, "seconds": 0.0, "peak": 0, "net": 0})
+            timing["count"] += 1
+            timing["seconds"] += elapsed
+            timing["peak"] = max(timing["peak"], peak)
+            timing["net"] += current - memory_before
+            if first_run:
+                diff = tracemalloc.take_snapshot().compare_to(before, "lineno")
+                self._memory_diffs[name] = diff[:self.top_n]
+
+            if outer is not None:
+                self._profiles[outer].enable()
+
+    def _sample_loop(self):
+        """테스트 스레드 + 그 외 스레드(로그 기록 등) 스택 샘플링"""
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.sample_interval):
+            with self._lock:
+                current_phase = self._stack[-1][0] if self._stack else "idle"
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or thread_id not in names:
+                    continue  # 샘플러 자신, threading 밖에서 만든 스레드(xdist 통신 등)
+                root = current_phase if thread_id == self._thread_id else f"thread:{names[thread_id]}"
+                self._samples[_folded_stack(root, frame)] += 1
+
+    def stop(self, output_dir):
+        """
+        프로파일링 종료 후 결과 저장
+
+        Args:
+            output_dir (str): 저장 폴더
+
+        Returns:
+            str: 요약 파일 경로
+        """
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        os.makedirs(output_dir, exist_ok=True)
+
+        for name, profile in self._profiles.items():
+            profile.dump_stats(os.path.join(output_dir, f"{name}.prof"))
+
+        # flamegraph.pl / speedscope / inferno에서 바로 열 수 있는 folded stacks
+        with open(os.path.join(output_dir, "profile.folded"), "w", encoding="utf-8") as f:
+            for stack, count in self._samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+        summary_file = os.path.join(output_dir, "profile_summary.txt")
+        with open(summary_file, "w", encoding="utf-8") as f:
+            f.write(self.summary())
+        tracemalloc.stop()
+        return summary_file
+
+    def summary(self):
+        """단계별 소요 시간/메모리 + 상위 함수(누적 시간) + 메모리 증가 위치"""
+        out = io.StringIO()
+        out.write("=" * 80 + "\n단계별 소요 시간 / 메모리\n" + "=" * 80 + "\n")
+        out.write(f"{'단계':<14}{'횟수':>6}{'합계(초)':>12}{'평균(초)':>12}{'최대 사용(MB)':>16}{'순증가(MB)':>14}\n")
+        for name in sorted(self._timings, key=_phase_order):
+            timing = self._timings[name]
+            out.write(f"{name:<14}{timing['count']:>6}{timing['seconds']:>12.2f}"
+                      f"{timing['seconds'] / timing['count']:>12.3f}"
+                      f"{timing['peak'] / 1e6:>16.1f}{timing['net'] / 1e6:>14.1f}\n")
+
+        by_root = Counter()
+        for stack, count in self._samples.items():
+            by_root[stack.split(";", 1)[0]] += count
+        sampled = sum(count for root, count in by_root.items() if not root.startswith("thread:"))
+        if sampled:
+            out.write(f"\n테스트 스레드 샘플링 ({sampled}개 샘플, {self.sample_interval * 1000:.0f}ms 간격)\n")
+            for root, count in by_root.most_common():
+                if not root.startswith("thread:"):
+                    out.write(f"  {root:<30}{count / sampled * 100:>6.1f}%\n")
+            others = [(root, count) for root, count in by_root.most_common() if root.startswith("thread:")]
+            if others:
+                out.write("그 외 스레드 (대기 중인 샘플 포함)\n")
+                for root, count in others:
+                    out.write(f"  {root:<30}{count:>8}개\n")
+
+        for name in sorted(self._profiles, key=_phase_order):
+            out.write("\n" + "=" * 80 + f"\n[{name}] 상위 {self.top_n}개 함수 (누적 시간)\n" + "=" * 80 + "\n")
+            try:
+                pstats.Stats(self._profiles[name], stream=out).sort_stats("cumulative").print_stats(self.top_n)
+            except TypeError:
+                out.write("기록된 함수 호출 없음\n")
+
+            diff = self._memory_diffs.get(name)
+            if diff:
+                out.write(f"[{name}] 메모리 증가 위치 (첫 실행 기준 상위 {len(diff)}개)\n")
+                for stat in diff:
+                    out.write(f"  {stat}\n")
+        return out.getvalue()
+
+
+def _phase_order(name):
+    return (PHASES.index(name) if name in PHASES else len(PHASES), name)
+
+
+def _folded_stack(root, frame):
+    """프레임 → "root;바깥 함수;...;안쪽 함수" (folded stacks 형식)"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}".replace(";", ":").replace(" ", "_"))
+        frame = frame.f_back
+    names.append(root)
+    return ";".join(reversed(names))
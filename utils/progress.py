@@ -0,0 +1,206 @@
+"""
+실행 진행 상황 모니터링 모듈 (완료/남은 테스트, 처리량, 오류율, 예상 종료 시간)
+
+컨트롤러(또는 단일 프로세스)가 테스트 결과를 받을 때마다 갱신하여
+    - 터미널 상태 줄 (일정 간격으로 출력)
+    - Prometheus 텍스트 포맷 파일 (node_exporter textfile collector 등에서 수집)
+    - 로컬 HTTP 엔드포인트 (선택, http://127.0.0.1:[port]/metrics)
+로 노출
+"""
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class ProgressTracker:
+    """
+    실행 진행 상황 집계 (스레드 안전)
+
+    예상 종료 시간(ETA)은 실제 경과 시간을 기준으로 계산
+    테스트별 예상 소요 시간(실행 이력)이 있으면 남은 작업량을 그 비중으로 환산 → 긴 질문이 남아 있어도 정확
+    """
+
+    def __init__(self, run_id, clock=time.time):
+        """
+        Args:
+            run_id (str): 실행 ID (메트릭 라벨)
+            clock (callable): 현재 시각 함수 (테스트용 주입)
+        """
+        self.run_id = run_id
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.weights = {}         # 테스트 ID(nodeid) → 예상 소요 시간 (없으면 1)
+        self.done_weight = 0.0
+        self.started_at = None    # 첫 테스트 시작 시각
+        self.outcomes = {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+        self.latency_sum = 0.0
+        self.latency_count = 0
+
+    def set_jobs(self, weights):
+        """
+        전체 테스트 등록
+
+        Args:
+            weights (dict): {nodeid: 예상 소요 시간(초)} (예상 시간을 모르면 같은 값)
+        """
+        with self._lock:
+            self.weights = dict(weights)
+
+    def record(self, nodeid, outcome, start=None, latency=None):
+        """
+        테스트 1건 완료 기록
+
+        Args:
+            nodeid (str): 테스트 ID
+            outcome (str): "passed" / "failed"(평가 FAIL) / "error"(API 오류 등) / "skipped"
+            start (float): 테스트 시작 시각 (첫 테스트 기준으로 경과 시간 계산)
+            latency (float): 답변 수신 시간(초)
+        """
+        with self._lock:
+            if start is not None and (self.started_at is None or start < self.started_at):
+                self.started_at = start
+            self.outcomes[outcome] += 1
+            self.done_weight += self.weights.get(nodeid, 1.0)
+            if latency is not None:
+                self.latency_sum += latency
+                self.latency_count += 1
+
+    def snapshot(self):
+        """
+        현재 진행 상황
+
+        Returns:
+            dict: total, completed, remaining, outcomes, elapsed, answers_per_minute,
+                  error_rate, mean_latency, eta (초, 계산할 수 없으면 None)
+        """
+        with self._lock:
+            now = self._clock()
+            completed = sum(self.outcomes.values())
+            total = max(len(self.weights), completed)
+            elapsed = now - self.started_at if self.started_at is not None else 0.0
+
+            answered = self.outcomes["passed"] + self.outcomes["failed"]
+            attempted = answered + self.outcomes["error"]
+
+            eta = None
+            total_weight = sum(self.weights.values()) or float(total)
+            if completed >= total:
+                eta = 0.0
+            elif self.done_weight > 0 and elapsed > 0:
+                eta = elapsed * max(0.0, total_weight - self.done_weight) / self.done_weight
+
+            return {
+                "run_id": self.run_id,
+                "total": total,
+                "completed": completed,
+                "remaining": total - completed,
+                "outcomes": dict(self.outcomes),
+                "elapsed": elapsed,
+                "answers_per_minute": answered / (elapsed / 60) if elapsed > 0 else 0.0,
+                "error_rate": self.outcomes["error"] / attempted if attempted else 0.0,
+                "mean_latency": self.latency_sum / self.latency_count if self.latency_count else None,
+                "eta": eta,
+            }
+
+
+def format_status_line(snapshot):
+    """터미널 상태 줄"""
+    outcomes = snapshot["outcomes"]
+    percent = snapshot["completed"] / snapshot["total"] * 100 if snapshot["total"] else 0.0
+    eta = _format_seconds(snapshot["eta"]) if snapshot["eta"] is not None else "-"
+    latency = f"{snapshot['mean_latency']:.1f}초" if snapshot["mean_latency"] is not None else "-"
+    return (f"📡 진행 {snapshot['completed']}/{snapshot['total']} ({percent:.0f}%) | "
+            f"PASS {outcomes['passed']} FAIL {outcomes['failed']} 오류 {outcomes['error']} 건너뜀 {outcomes['skipped']} | "
+            f"{snapshot['answers_per_minute']:.1f}건/분 | 오류율 {snapshot['error_rate'] * 100:.1f}% | "
+            f"평균 답변 {latency} | 경과 {_format_seconds(snapshot['elapsed'])} | 남은 시간 {eta}")
+
+
+def format_prometheus(snapshot):
+    """Prometheus 텍스트 포맷 메트릭"""
+    label = f'run_id="{snapshot["run_id"]}"'
+    lines = []
+
+    def metric(name, kind, help_text, value, extra_label=""):
+        if not any(line.startswith(f"# HELP {name} ") for line in lines):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+        labels = f"{label},{extra_label}" if extra_label else label
+        lines.append(f"{name}{{{labels}}} {value}")
+
+    metric("llm_test_items_total", "gauge", "Number of scheduled test items.", snapshot["total"])
+    metric("llm_test_items_completed", "gauge", "Number of finished test items.", snapshot["completed"])
+    metric("llm_test_items_remaining", "gauge", "Number of test items not yet finished.", snapshot["remaining"])
+    for outcome, count in snapshot["outcomes"].items():
+        metric("llm_test_results_total", "counter", "Finished test items by outcome.", count, f'outcome="{outcome}"')
+    metric("llm_test_elapsed_seconds", "gauge", "Seconds since the first test started.", f"{snapshot['elapsed']:.1f}")
+    metric("llm_test_answers_per_minute", "gauge", "Evaluated answers per minute.",
+           f"{snapshot['answers_per_minute']:.3f}")
+    metric("llm_test_error_rate", "gauge", "Share of attempted items that ended in an API error.",
+           f"{snapshot['error_rate']:.4f}")
+    if snapshot["mean_latency"] is not None:
+        metric("llm_test_answer_latency_seconds_mean", "gauge", "Mean answer latency.",
+               f"{snapshot['mean_latency']:.2f}")
+    if snapshot["eta"] is not None:
+        metric("llm_test_eta_seconds", "gauge", "Estimated seconds until the run finishes.", f"{snapshot['eta']:.1f}")
+    metric("llm_test_last_update_timestamp_seconds", "gauge", "Unix time of the last update.", f"{time.time():.0f}")
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics_file(snapshot, metrics_file):
+    """메트릭 파일 저장 (수집기가 쓰다 만 파일을 읽지 않도록 임시 파일 작성 후 교체)"""
+    metrics_dir = os.path.dirname(metrics_file)
+    if metrics_dir:
+        os.makedirs(metrics_dir, exist_ok=True)
+    tmp_file = f"{metrics_file}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write(format_prometheus(snapshot))
+    os.replace(tmp_file, metrics_file)
+
+
+class MetricsServer:
+    """로컬 메트릭 HTTP 서버 (GET /metrics, 백그라운드 스레드)"""
+
+    def __init__(self, tracker, port, host="127.0.0.1"):
+        """
+        Args:
+            tracker (ProgressTracker): 진행 상황 집계
+            port (int): 포트 (0이면 임의 포트, 실제 포트는 self.port)
+            host (str): 바인딩 주소 (기본: 로컬에서만 접근)
+        """
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = format_prometheus(tracker.snapshot()).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # 요청마다 콘솔 출력하지 않음
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """서버 종료"""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _format_seconds(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {seconds}초"
+    return f"{seconds}초"
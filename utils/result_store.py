@@ -0,0 +1,83 @@
+"""
+테스트 결과 공유 저장소 모듈 (프로세스별 JSON Lines 파일)
+
+pytest-xdist 워커는 각자 자신의 파일에 결과를 한 줄씩 기록하고,
+컨트롤러는 모든 파일을 합쳐 리포트를 생성함
+"""
+import glob
+import json
+import os
+import threading
+
+from core.results import TestResult
+
+
+class ResultStore:
+    """실행 폴더의 결과 저장소 (같은 결과 키는 마지막 기록이 우선)"""
+
+    def __init__(self, store_dir, writer_id="main", answer_store=None):
+        """
+        Args:
+            store_dir (str): 저장소 폴더 (예: output/[타임스탬프]/.results)
+            writer_id (str): 기록 주체 ID (xdist 워커 ID 등, 파일 이름으로 사용)
+            answer_store (AnswerStore): 지정하면 답변 원문은 저장소에 한 번만 저장하고 해시만 기록
+        """
+        self.store_dir = store_dir
+        self.writer_id = writer_id
+        self.answer_store = answer_store
+        self._file = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def result_key(result):
+        """결과 키 (라운드 + 질문ID)"""
+        return f"{result.get('round', 1)}:{result['test_id']}"
+
+    def record(self, result):
+        """결과 1건 기록 (즉시 flush, 같은 키로 다시 기록하면 갱신)"""
+        data = result.to_dict() if isinstance(result, TestResult) else dict(result)
+        if self.answer_store is not None and data.get("answer") is not None:
+            data["answer_hash"] = self.answer_store.put_answer(data["answer"])
+            data["answer"] = None
+        line = json.dumps({"key": self.result_key(result), "result": data}, ensure_ascii=False)
+
+        with self._lock:
+            if self._file is None:
+                os.makedirs(self.store_dir, exist_ok=True)
+                path = os.path.join(self.store_dir, f"{self.writer_id}.jsonl")
+                self._file = open(path, "a", encoding="utf-8")
+
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        """기록 파일 닫기"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def load_all(self):
+        """
+        모든 기록 파일을 합쳐 결과 목록 반환
+
+        Returns:
+            list: TestResult 리스트 (라운드, 질문ID 순)
+        """
+        merged = {}
+
+        for path in sorted(glob.glob(os.path.join(self.store_dir, "*.jsonl"))):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 비정상 종료된 워커의 마지막 줄
+                    merged[record["key"]] = record["result"]
+
+        for data in merged.values():
+            if data.get("answer") is None and data.get("answer_hash") and self.answer_store is not None:
+                data["answer"] = self.answer_store.get_answer(data["answer_hash"])
+
+        results = [TestResult.from_dict(data) for data in merged.values()]
+        return sorted(results, key=lambda r: (r.round, r.test_id))
@@ -0,0 +1,247 @@
+"""
+실행 이력 저장소 모듈 (질문별 소요 시간/답변 지연/실패 이력, SQLite)
+
+테스트 1건이 끝날 때마다 (질문ID, 라운드, 결과, 소요 시간, 답변 지연)을 기록하고,
+다음 실행에서 질문별 예상 소요 시간(답변 지연 기준)과 실패율을 조회하여 실행 순서 결정에 사용,
+답변 수신 시간 분포로 질문별 답변 대기 시간(adaptive_timeout) 결정
+여러 실행(및 rescore 등 다른 도구)이 같은 파일을 함께 사용할 수 있음 (SQLite WAL 모드)
+"""
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+# 실패로 집계하는 결과
+FAILURE_OUTCOMES = ("failed", "error")
+
+
+class RunHistory:
+    """실행 이력 저장소 (SQLite)"""
+
+    def __init__(self, db_file="output/run_history.sqlite"):
+        """
+        Args:
+            db_file (str): 저장소 파일 경로
+        """
+        self.db_file = db_file
+        db_dir = os.path.dirname(db_file)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_file, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS attempts ("
+                " run_id TEXT NOT NULL,"
+                " test_id TEXT NOT NULL,"
+                " category TEXT,"
+                " round INTEGER,"
+                " outcome TEXT NOT NULL,"
+                " duration REAL NOT NULL,"
+                " latency REAL,"
+                " recorded_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS attempts_recorded_at ON attempts (recorded_at)"
+            )
+            self._conn.commit()
+
+    def record(self, run_id, test_id, category, round, outcome, duration, latency=None):
+        """
+        테스트 1건 기록
+
+        Args:
+            run_id (str): 실행 ID (출력 폴더 이름)
+            test_id (str): 질문ID
+            category (str): 카테고리
+            round (int): 라운드
+            outcome (str): passed / failed / error / skipped
+            duration (float): 테스트 소요 시간(초, 다음 테스트 전 대기 제외)
+            latency (float): 질문 전송 후 답변 수신까지 걸린 시간(초, 답변을 받지 못했으면 None)
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO attempts (run_id, test_id, category, round, outcome, duration, latency, recorded_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, test_id, category, round, outcome, duration, latency, time.time())
+            )
+            self._conn.commit()
+
+    def snapshot(self, before=None, window=20):
+        """
+        이력 요약 조회
+
+        Args:
+            before (float): 이 시각(time.time()) 이전 기록만 사용 (None이면 전체)
+                            xdist 워커들이 같은 기준으로 같은 실행 순서를 얻기 위해 사용
+            window (int): 질문별로 사용할 최근 기록 수
+
+        Returns:
+            HistorySnapshot: 질문별/카테고리별 통계
+        """
+        query = "SELECT test_id, category, outcome, duration, latency FROM attempts"
+        params = ()
+        if before is not None:
+            query += " WHERE recorded_at < ?"
+            params = (before,)
+        query += " ORDER BY recorded_at DESC"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        per_test = {}
+        for test_id, category, outcome, duration, latency in rows:
+            records = per_test.setdefault(test_id, [])
+            if len(records) < window:
+                records.append((category, outcome, duration, latency))
+
+        return HistorySnapshot(per_test)
+
+    def close(self):
+        """저장소 닫기"""
+        with self._lock:
+            self._conn.close()
+
+
+class HistorySnapshot:
+    """이력 요약 (질문별 통계, 질문 이력이 없으면 카테고리 → 전체 순으로 대체)"""
+
+    def __init__(self, per_test):
+        """
+        Args:
+            per_test (dict): {질문ID: [(카테고리, 결과, 소요 시간, 답변 지연), ...]} (최신순)
+        """
+        self.tests = {test_id: _summarize(records) for test_id, records in per_test.items()}
+
+        per_category = {}
+        for records in per_test.values():
+            per_category.setdefault(records[0][0], []).extend(records)
+        self.categories = {category: _summarize(records) for category, records in per_category.items()}
+
+        self.overall = _summarize([r for records in per_test.values() for r in records])
+
+    def __len__(self):
+        return len(self.tests)
+
+    def stats(self, test_id, category=None):
+        """질문 통계 (질문 → 카테고리 → 전체 순으로 이력이 있는 첫 번째, 없으면 None)"""
+        for stats in (self.tests.get(test_id), self.categories.get(category), self.overall):
+            if stats is not None:
+                return stats
+        return None
+
+    def expected_duration(self, test_id, category=None, default=60.0):
+        """
+        예상 소요 시간(초, 최근 기록의 평균 답변 지연)
+
+        답변을 받은 기록이 없으면(모두 오류 등) 평균 소요 시간 사용
+        """
+        stats = self.stats(test_id, category)
+        if stats is None:
+            return default
+        return stats["mean_latency"] if stats["mean_latency"] is not None else stats["mean_duration"]
+
+    def latency_quantile(self, test_id, category=None, quantile=0.99, min_samples=5):
+        """
+        답변 수신 시간 분위수(초)
+
+        질문 이력이 min_samples개 미만이면 카테고리 이력으로 계산
+
+        Returns:
+            tuple: (분위수, 기준 "question"/"category") (이력이 부족하면 (None, None))
+        """
+        for source, stats in (("question", self.tests.get(test_id)), ("category", self.categories.get(category))):
+            if stats is not None and len(stats["latencies"]) >= min_samples:
+                return float(np.quantile(stats["latencies"], quantile)), source
+        return None, None
+
+    def latency_timeout(self, test_id, category=None, quantile=0.99, margin=1.5, min_samples=5):
+        """
+        이력 기반 답변 대기 시간(초) = 답변 수신 시간 분위수 × 여유 배수
+
+        Returns:
+            tuple: (대기 시간, 기준 "question"/"category") (이력이 부족하면 (None, None))
+        """
+        value, source = self.latency_quantile(test_id, category, quantile, min_samples)
+        return (value * margin if value is not None else None), source
+
+    def failure_rate(self, test_id):
+        """질문 실패율 (이력이 없으면 0)"""
+        stats = self.tests.get(test_id)
+        return stats["failure_rate"] if stats else 0.0
+
+
+def adaptive_timeout(snapshot, test_case, settings):
+    """
+    질문별 답변 대기 시간 결정
+
+    Args:
+        snapshot (HistorySnapshot): 실행 이력 요약 (None이면 기본값)
+        test_case (TestCase): 질문
+        settings (dict): settings.adaptive_timeout
+            (enabled, quantile, margin, min_samples, min_timeout, max_timeout, default_timeout)
+
+    Returns:
+        tuple: (대기 시간(초), 최대 대기 시간(초), 기준 설명)
+               최대 대기 시간은 이력 기준일 때만 max_timeout (기본값이면 None → 대기 시간에서 종료)
+    """
+    default_timeout = settings.get("default_timeout", 120)
+    if snapshot is None or not settings.get("enabled", False):
+        return default_timeout, None, "기본값"
+
+    quantile = settings.get("quantile", 0.99)
+    margin = settings.get("margin", 1.5)
+    timeout, source = snapshot.latency_timeout(test_case.id, test_case.category, quantile, margin,
+                                               settings.get("min_samples", 5))
+    if timeout is None:
+        return default_timeout, None, "기본값 (이력 부족)"
+
+    max_timeout = settings.get("max_timeout", 300)
+    timeout = min(max(timeout, settings.get("min_timeout", 20)), max_timeout)
+    label = "질문" if source == "question" else "카테고리"
+    return timeout, max_timeout, f"{label} 이력 p{quantile * 100:g} × {margin:g}"
+
+
+def hedge_delay(snapshot, test_case, settings):
+    """
+    헤지 요청 시작 시각(초) = 이력상 답변 수신 시간의 quantile 분위수
+
+    Args:
+        snapshot (HistorySnapshot): 실행 이력 요약
+        test_case (TestCase): 질문
+        settings (dict): settings.hedging (enabled, quantile, min_samples, min_delay)
+
+    Returns:
+        float: 헤지 시작 시각 (헤지를 끄거나 이력이 부족하면 None)
+    """
+    if snapshot is None or not settings.get("enabled", False):
+        return None
+
+    delay, _ = snapshot.latency_quantile(test_case.id, test_case.category, settings.get("quantile", 0.95),
+                                         settings.get("min_samples", 5))
+    if delay is None:
+        return None
+    return max(delay, settings.get("min_delay", 10))
+
+
+def _summarize(records):
+    if not records:
+        return None
+
+    durations = np.array([r[2] for r in records], dtype=float)
+    latencies = np.array([r[3] for r in records if r[3] is not None], dtype=float)
+    failures = sum(1 for r in records if r[1] in FAILURE_OUTCOMES)
+
+    return {
+        "count": len(records),
+        "mean_duration": float(durations.mean()),
+        "mean_latency": float(latencies.mean()) if len(latencies) else None,
+        "latencies": latencies,
+        "failure_rate": failures / len(records),
+    }
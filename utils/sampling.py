@@ -0,0 +1,190 @@
+"""
+층화 샘플링 모듈 (빠른 스모크 실행 + 전체 통과율 추정)
+
+카테고리를 층으로 하여 질문 일부만 실행하고 (카테고리 크기에 비례 배분),
+샘플 결과로 전체/카테고리별 통과율과 신뢰구간을 추정
+    - 같은 질문의 라운드끼리는 상관이 크므로 질문을 표본 단위로 사용 (질문별 통과율 평균, n = 샘플 질문 수)
+    - 카테고리별: Wilson 신뢰구간
+    - 전체: 층화 추정 (카테고리 비중 가중 평균, 유한 모집단 보정 포함)
+"""
+import math
+import random
+
+from core.results import as_test_result
+from utils.scoring import wilson_interval
+
+
+def parse_sample_option(value):
+    """
+    샘플 크기 옵션 해석 ("0.2" → 비율 20%, "12" → 호출 12회)
+
+    Returns:
+        dict: {"fraction": float} 또는 {"budget": int}
+    """
+    number = float(value)
+    if 0 < number < 1:
+        return {"fraction": number}
+    if number >= 1 and number.is_integer():
+        return {"budget": int(number)}
+    raise ValueError(f"샘플 크기는 0~1 사이 비율 또는 호출 횟수(정수)여야 합니다: {value}")
+
+
+def allocate(category_sizes, sample_size, min_per_category=1):
+    """
+    카테고리별 샘플 수 배분 (크기 비례, 나머지는 큰 소수점 순)
+
+    Args:
+        category_sizes (dict): {카테고리: 질문 수}
+        sample_size (int): 전체 샘플 질문 수
+        min_per_category (int): 카테고리별 최소 샘플 수 (질문 수를 넘지 않음)
+
+    Returns:
+        dict: {카테고리: 샘플 수}
+    """
+    total = sum(category_sizes.values())
+    sample_size = max(0, min(sample_size, total))
+
+    counts = {c: min(size, min_per_category) for c, size in category_sizes.items()}
+    remaining = sample_size - sum(counts.values())
+    if remaining <= 0:
+        return counts
+
+    capacity = {c: size - counts[c] for c, size in category_sizes.items()}
+    capacity_total = sum(capacity.values())
+    quotas = {c: remaining * cap / capacity_total for c, cap in capacity.items()}
+
+    for c, quota in quotas.items():
+        counts[c] += int(quota)
+    leftover = sample_size - sum(counts.values())
+    for c in sorted(quotas, key=lambda c: (quotas[c] - int(quotas[c]), c), reverse=True):
+        if leftover <= 0:
+            break
+        if counts[c] < category_sizes[c]:
+            counts[c] += 1
+            leftover -= 1
+    return counts
+
+
+def stratified_sample(test_cases, fraction=None, budget=None, repeat_count=1, seed=0, min_per_category=1):
+    """
+    카테고리별 층화 샘플링
+
+    Args:
+        test_cases (list): TestCase 리스트
+        fraction (float): 샘플 비율 (budget과 둘 중 하나)
+        budget (int): 최대 API 호출 수 (질문 수 = budget // repeat_count)
+        repeat_count (int): 라운드 수
+        seed (int): 난수 시드 (같은 시드면 같은 질문 선택 → xdist 워커 간 일치)
+        min_per_category (int): 카테고리별 최소 샘플 수
+
+    Returns:
+        list: 선택된 TestCase 리스트 (원래 순서 유지)
+    """
+    if budget is not None:
+        sample_size = budget // max(1, repeat_count)
+    else:
+        sample_size = math.ceil(len(test_cases) * fraction)
+
+    by_category = {}
+    for test_case in test_cases:
+        by_category.setdefault(test_case.category, []).append(test_case)
+
+    counts = allocate({c: len(cases) for c, cases in by_category.items()}, sample_size, min_per_category)
+
+    rng = random.Random(seed)
+    selected = set()
+    for category, cases in by_category.items():
+        selected.update(tc.id for tc in rng.sample(cases, counts[category]))
+
+    return [tc for tc in test_cases if tc.id in selected]
+
+
+def estimate_pass_rates(results, population, z=1.96):
+    """
+    샘플 결과로 통과율 추정
+
+    Args:
+        results (list): 샘플 실행 결과 리스트
+        population (dict): {카테고리: 전체 질문 수}
+        z (float): 신뢰구간 임계값 (1.96 = 95%)
+
+    Returns:
+        dict: overall {rate, lower, upper}, categories {카테고리: {sampled, population, passed, total, rate, lower, upper}}
+              (rate는 질문별 통과율의 평균, passed/total은 라운드 단위 집계,
+               샘플이 없는 카테고리는 rate None, 전체 추정에서 제외하고 비중을 나머지에 재배분)
+    """
+    tallies = {}
+    for result in results:
+        result = as_test_result(result)
+        tally = tallies.setdefault(result.category, {"questions": {}, "passed": 0, "total": 0})
+        question = tally["questions"].setdefault(result.test_id, [0, 0])  # [통과 라운드, 전체 라운드]
+        question[0] += int(result.evaluation.passed)
+        question[1] += 1
+        tally["passed"] += int(result.evaluation.passed)
+        tally["total"] += 1
+
+    categories = {}
+    for category, size in population.items():
+        tally = tallies.get(category)
+        if tally is None:
+            categories[category] = {"sampled": 0, "population": size, "passed": 0, "total": 0,
+                                    "rate": None, "lower": None, "upper": None}
+            continue
+
+        # 질문 1개 = 표본 1개 (라운드를 독립 표본으로 세면 구간이 너무 좁아짐)
+        sampled = len(tally["questions"])
+        rate = sum(passed / total for passed, total in tally["questions"].values()) / sampled
+        lower, upper = wilson_interval(rate * sampled, sampled, z)
+        categories[category] = {
+            "sampled": sampled,
+            "population": size,
+            "passed": tally["passed"],
+            "total": tally["total"],
+            "rate": rate,
+            "lower": lower,
+            "upper": upper,
+        }
+
+    # 층화 추정: 카테고리 비중(W) × 카테고리 통과율, 분산은 Agresti-Coull 보정 + 유한 모집단 보정
+    covered = {c: s for c, s in categories.items() if s["rate"] is not None}
+    covered_population = sum(s["population"] for s in covered.values())
+    if not covered_population:
+        return {"overall": {"rate": None, "lower": None, "upper": None}, "categories": categories}
+
+    rate = 0.0
+    variance = 0.0
+    for stats in covered.values():
+        weight = stats["population"] / covered_population
+        sampled = stats["sampled"]
+        adjusted = (stats["rate"] * sampled + z * z / 2) / (sampled + z * z)
+        fpc = 1 - sampled / stats["population"]
+        rate += weight * stats["rate"]
+        variance += weight * weight * fpc * adjusted * (1 - adjusted) / sampled
+
+    margin = z * math.sqrt(variance)
+    return {
+        "overall": {"rate": rate, "lower": max(0.0, rate - margin), "upper": min(1.0, rate + margin)},
+        "categories": categories,
+    }
+
+
+def print_sampling(sampling):
+    """샘플링 추정 결과 출력"""
+    print("\n" + "="*80)
+    print("🎲 샘플링 실행 추정 (층화 샘플)")
+    print("="*80)
+    print(f"샘플: {sampling['sampled']}/{sampling['population']}개 질문 "
+          f"({sampling['mode']}, 시드 {sampling['seed']})")
+
+    overall = sampling["estimate"]["overall"]
+    if overall["rate"] is not None:
+        print(f"추정 통과율: {overall['rate'] * 100:.1f}% "
+              f"(95% 신뢰구간 {overall['lower'] * 100:.1f}% ~ {overall['upper'] * 100:.1f}%)")
+
+    for category, stats in sampling["estimate"]["categories"].items():
+        if stats["rate"] is None:
+            print(f"  [{category}] 샘플 없음 (전체 {stats['population']}개)")
+            continue
+        print(f"  [{category}] {stats['sampled']}/{stats['population']}개 질문, "
+              f"통과율 {stats['rate'] * 100:.1f}% ({stats['lower'] * 100:.1f}% ~ {stats['upper'] * 100:.1f}%)")
+    print("="*80)
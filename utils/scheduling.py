@@ -0,0 +1,52 @@
+"""
+테스트 실행 순서 결정 모듈 (LPT: 오래 걸리는 질문 먼저)
+
+여러 워커(pytest-xdist)가 병렬로 실행할 때, 오래 걸리는 질문(창작/웹검색 등)이
+마지막에 시작되면 전체 실행 시간(makespan)이 길어지므로
+이력상 예상 소요 시간이 긴 질문부터 실행 (같으면 실패가 잦은 질문 먼저 → 재시도 시간 확보)
+반복 라운드 조기 판정(utils/sequential.py)을 켜면 라운드 순서는 유지하고 라운드 안에서만 LPT 적용
+(모든 질문의 기본 라운드가 끝나야 절약한 호출 수가 쌓여 추가 라운드에 배분할 수 있음)
+"""
+import heapq
+
+
+def order_jobs(jobs, snapshot, default_duration=60.0, round_major=False):
+    """
+    실행 순서 결정 (LPT)
+
+    Args:
+        jobs (list): (라운드, TestCase) 튜플 리스트
+        snapshot (HistorySnapshot): 실행 이력 요약
+        default_duration (float): 이력이 전혀 없을 때의 예상 소요 시간(초)
+        round_major (bool): True면 라운드 순으로 실행하고 같은 라운드 안에서만 LPT (조기 판정 모드)
+
+    Returns:
+        list: (원래 인덱스, 예상 소요 시간) 튜플 리스트 (실행 순서)
+    """
+    keyed = []
+    for index, (round_num, test_case) in enumerate(jobs):
+        expected = snapshot.expected_duration(test_case.id, test_case.category, default_duration)
+        failure_rate = snapshot.failure_rate(test_case.id)
+        # 같은 예상 시간·실패율이면 라운드/질문ID 순 (모든 워커에서 같은 순서가 되도록)
+        key = (-expected, -failure_rate, round_num, test_case.id)
+        keyed.append(((round_num,) + key if round_major else key, index, expected))
+
+    keyed.sort()
+    return [(index, expected) for _, index, expected in keyed]
+
+
+def simulate_makespan(durations, workers=1):
+    """
+    주어진 순서로 빈 워커에 하나씩 배정할 때의 전체 실행 시간
+
+    Args:
+        durations (list): 실행 순서대로의 소요 시간(초)
+        workers (int): 워커 수
+
+    Returns:
+        float: 예상 전체 실행 시간(초)
+    """
+    finish_times = [0.0] * max(1, workers)
+    for duration in durations:
+        heapq.heapreplace(finish_times, finish_times[0] + duration)
+    return max(finish_times)
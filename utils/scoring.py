@@ -1,6 +1,9 @@
 """
 점수 계산 유틸리티 모듈
 """
+import math
+
+from core.results import CRITERIA, as_test_result
 
 
 def calculate_statistics(results):
@@ -23,22 +26,18 @@ def calculate_statistics(results):
             "avg_total_score": 0.0
         }
     
-    total_tests = len(results)
-    passed = sum(1 for r in results if r['evaluation']['pass'])
+    evaluations = [as_test_result(r).evaluation for r in results]
+    total_tests = len(evaluations)
+    passed = sum(1 for e in evaluations if e.passed)
     failed = total_tests - passed
     pass_rate = (passed / total_tests * 100) if total_tests > 0 else 0.0
     
-    # 항목별 평균 점수
-    criteria_names = ["정확성", "관련성", "할루시네이션", "안전성", "스타일", "기능적_요건"]
-    avg_scores = {}
-    
-    for criterion in criteria_names:
-        scores = [r['evaluation']['scores'][criterion] for r in results]
-        avg_scores[criterion] = sum(scores) / len(scores) if scores else 0.0
+    # 항목별 평균 점수 (항목 순서대로 열 합계)
+    column_sums = map(sum, zip(*(e.score_values for e in evaluations)))
+    avg_scores = {criterion: total / total_tests for criterion, total in zip(CRITERIA, column_sums)}
     
     # 전체 평균 점수
-    total_scores = [r['evaluation']['total_score'] for r in results]
-    avg_total_score = sum(total_scores) / len(total_scores) if total_scores else 0.0
+    avg_total_score = sum(e.total_score for e in evaluations) / total_tests
     
     return {
         "total_tests": total_tests,
@@ -81,7 +80,8 @@ def calculate_category_statistics(results):
     category_stats = {}
     
     for result in results:
-        category = result['category']
+        result = as_test_result(result)
+        category = result.category
         
         if category not in category_stats:
             category_stats[category] = {
@@ -94,12 +94,12 @@ def calculate_category_statistics(results):
         
         category_stats[category]["total"] += 1
         
-        if result['evaluation']['pass']:
+        if result.evaluation.passed:
             category_stats[category]["passed"] += 1
         else:
             category_stats[category]["failed"] += 1
         
-        category_stats[category]["scores"].append(result['evaluation']['total_score'])
+        category_stats[category]["scores"].append(result.evaluation.total_score)
     
     # 평균 점수 계산
     for category in category_stats:
@@ -125,3 +125,86 @@ def print_category_statistics(category_stats):
         print(f"  평균 점수: {stats['avg_score']:.2f}/18점")
     
     print("="*80)
+
+
+def wilson_interval(passed, total, z=1.96):
+    """
+    통과율의 Wilson 신뢰구간
+    
+    Args:
+        passed (int): 통과 수
+        total (int): 전체 수
+        z (float): 정규분포 임계값 (1.96 = 95%)
+    
+    Returns:
+        tuple: (하한, 상한) (total이 0이면 (0.0, 1.0))
+    """
+    if total == 0:
+        return 0.0, 1.0
+    
+    rate = passed / total
+    denominator = 1 + z * z / total
+    center = (rate + z * z / (2 * total)) / denominator
+    half_width = z * math.sqrt(rate * (1 - rate) / total + z * z / (4 * total * total)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def sprt_decision(passed, total, p0=0.5, p1=0.9, alpha=0.1, beta=0.1):
+    """
+    SPRT(순차 확률비 검정)로 질문 통과율 판정
+    
+    H0: 통과율 <= p0 (불안정한 질문) / H1: 통과율 >= p1 (안정적으로 통과하는 질문)
+    
+    Args:
+        passed (int): 통과 수
+        total (int): 전체 수
+        p0 (float): 실패로 판정할 통과율
+        p1 (float): 통과로 판정할 통과율
+        alpha (float): 실제로 p0인데 통과로 판정할 확률
+        beta (float): 실제로 p1인데 실패로 판정할 확률
+    
+    Returns:
+        str: "pass" / "fail" (아직 판정할 수 없으면 None)
+    """
+    failed = total - passed
+    log_ratio = passed * math.log(p1 / p0) + failed * math.log((1 - p1) / (1 - p0))
+    
+    if log_ratio >= math.log((1 - beta) / alpha):
+        return "pass"
+    if log_ratio <= math.log(beta / (1 - alpha)):
+        return "fail"
+    return None
+
+
+def sequential_decision(passed, total, settings):
+    """
+    반복 라운드 조기 판정 (settings.sequential 기준)
+    
+    Args:
+        passed (int): 지금까지 통과한 라운드 수
+        total (int): 지금까지 실행한 라운드 수
+        settings (dict): method("sprt"/"wilson"), min_rounds,
+                         sprt: p0, p1, alpha, beta / wilson: pass_rate, z
+    
+    Returns:
+        str: "pass" / "fail" (아직 판정할 수 없으면 None)
+    """
+    if total < settings.get("min_rounds", 2):
+        return None
+    
+    if settings.get("method", "sprt") == "wilson":
+        lower, upper = wilson_interval(passed, total, settings.get("z", 1.96))
+        pass_rate = settings.get("pass_rate", 0.8)
+        if lower >= pass_rate:
+            return "pass"
+        if upper < pass_rate:
+            return "fail"
+        return None
+    
+    return sprt_decision(
+        passed, total,
+        p0=settings.get("p0", 0.5),
+        p1=settings.get("p1", 0.9),
+        alpha=settings.get("alpha", 0.1),
+        beta=settings.get("beta", 0.1)
+    )
@@ -0,0 +1,109 @@
+"""
+반복 라운드 조기 판정 모듈 (순차 검정)
+
+질문별 라운드 결과(PASS/FAIL)가 쌓일 때마다 SPRT 또는 Wilson 신뢰구간으로 판정하여
+    - 판정이 확정된 질문: 남은 라운드를 실행하지 않음 (API 호출 절약)
+    - 절약한 호출 수만큼: 판정이 나지 않은 경계 질문에 추가 라운드(repeat_count 초과 ~ max_rounds) 실행
+
+같은 질문의 라운드는 같은 프로세스에서 실행되어야 하므로 pytest-xdist에서는
+--dist loadgroup으로 실행 (질문별 xdist_group 마커는 tests/test_main.py에서 부여)
+"""
+import threading
+
+from core.results import as_test_result
+from utils.scoring import sequential_decision
+
+
+class SequentialRounds:
+    """질문별 라운드 실행 여부 결정 (프로세스 단위)"""
+
+    def __init__(self, settings, repeat_count):
+        """
+        Args:
+            settings (dict): settings.sequential (enabled, method, min_rounds, max_rounds, 검정 파라미터)
+            repeat_count (int): 기본 반복 횟수 (이 안에서 판정되면 남은 라운드를 건너뜀)
+        """
+        self.settings = settings
+        self.enabled = settings.get("enabled", False)
+        self.repeat_count = repeat_count
+        self.max_rounds = max(repeat_count, settings.get("max_rounds", repeat_count))
+        self._lock = threading.Lock()
+
+        self.tallies = {}   # 질문ID → [통과 수, 실행 수]
+        self.saved = 0      # 조기 판정으로 건너뛴 기본 라운드 수
+        self.extra = 0      # 실행한 추가 라운드 수
+
+    def record(self, test_id, passed):
+        """라운드 결과 1건 기록"""
+        with self._lock:
+            tally = self.tallies.setdefault(test_id, [0, 0])
+            tally[0] += int(bool(passed))
+            tally[1] += 1
+
+    def verdict(self, test_id):
+        """질문 판정 ("pass"/"fail", 아직 판정할 수 없으면 None)"""
+        passed, total = self.tallies.get(test_id, (0, 0))
+        return sequential_decision(passed, total, self.settings)
+
+    def should_run(self, test_id, round_num):
+        """
+        라운드 실행 여부
+
+        Returns:
+            tuple: (실행 여부, 건너뛰는 이유)
+        """
+        if not self.enabled:
+            return True, None
+
+        with self._lock:
+            passed, total = self.tallies.get(test_id, (0, 0))
+            verdict = sequential_decision(passed, total, self.settings)
+
+            if round_num <= self.repeat_count:
+                if verdict is None:
+                    return True, None
+                self.saved += 1
+                return False, f"조기 판정 {verdict.upper()} ({passed}/{total} 통과)"
+
+            # 추가 라운드: 판정되지 않은 질문에만, 절약한 호출 수 안에서
+            if verdict is not None:
+                return False, f"조기 판정 {verdict.upper()} ({passed}/{total} 통과)"
+            if self.extra >= self.saved:
+                return False, "추가 라운드 예산 없음"
+            self.extra += 1
+            return True, None
+
+
+def summarize_sequential(results, settings, repeat_count):
+    """
+    조기 판정 요약 (세션 종료 시 전체 결과 기준)
+
+    Args:
+        results (list): 테스트 결과 리스트
+        settings (dict): settings.sequential
+        repeat_count (int): 기본 반복 횟수
+
+    Returns:
+        dict: verdicts (판정별 질문 수), rounds_run, rounds_planned, undecided (경계 질문 ID 리스트)
+    """
+    tallies = {}
+    for result in results:
+        result = as_test_result(result)
+        tally = tallies.setdefault(result.test_id, [0, 0])
+        tally[0] += int(result.evaluation.passed)
+        tally[1] += 1
+
+    verdicts = {"pass": 0, "fail": 0, None: 0}
+    undecided = []
+    for test_id, (passed, total) in tallies.items():
+        verdict = sequential_decision(passed, total, settings)
+        verdicts[verdict] += 1
+        if verdict is None:
+            undecided.append(test_id)
+
+    return {
+        "verdicts": verdicts,
+        "rounds_run": len(results),
+        "rounds_planned": len(tallies) * repeat_count,
+        "undecided": sorted(undecided),
+    }